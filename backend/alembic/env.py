@@ -27,9 +27,7 @@ from app.models import (
 )
 
 # Importar configuración
-from app.config import get_settings
-
-settings = get_settings()
+from app.config import SETTINGS
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -37,7 +35,7 @@ config = context.config
 
 # Configurar la URL de la base de datos desde las variables de entorno
 # Convertir de asyncpg a psycopg2 para Alembic
-db_url = settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
+db_url = SETTINGS.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
 config.set_main_option("sqlalchemy.url", db_url)
 
 # Interpret the config file for Python logging.
@@ -0,0 +1,213 @@
+"""
+Utilidades compartidas por las revisiones de Alembic.
+
+Se importan desde las revisiones como `from migration_helpers import ...`
+(el directorio alembic/ se agrega al path vía prepend_sys_path en alembic.ini).
+"""
+import csv
+import io
+from typing import Any, Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from psycopg2.extras import execute_values
+
+# A partir de esta cantidad de filas bulk_insert() usa COPY en lugar de INSERT
+COPY_THRESHOLD = 50_000
+
+
+def _index_is_valid(index_name: str) -> Optional[bool]:
+    """pg_index.indisvalid del índice, o None si no existe."""
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name"
+        ),
+        {"name": index_name},
+    ).scalar()
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[Union[str, sa.TextClause]],
+    **kw,
+) -> None:
+    """
+    Crea un índice con CREATE INDEX CONCURRENTLY sin bloquear escrituras.
+
+    CONCURRENTLY no puede ejecutarse dentro de una transacción, por eso se
+    usa autocommit_block(). Si la construcción falla (ej: claves duplicadas
+    en un índice único) PostgreSQL deja el índice creado pero marcado como
+    INVALID (pg_index.indisvalid = false): se elimina antes de propagar el
+    error, así la migración puede reintentarse directamente. Al reintentar,
+    un índice válido ya existente se conserva y uno inválido se reconstruye.
+    """
+    with op.get_context().autocommit_block():
+        as_sql = op.get_context().as_sql
+
+        if not as_sql:
+            is_valid = _index_is_valid(index_name)
+            if is_valid:
+                return
+            if is_valid is False:
+                _drop_index(index_name, table_name)
+
+        try:
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                postgresql_concurrently=True,
+                **kw,
+            )
+        except Exception:
+            if not as_sql:
+                _drop_index(index_name, table_name)
+            raise
+
+        if not as_sql and _index_is_valid(index_name) is False:
+            _drop_index(index_name, table_name)
+            raise RuntimeError(
+                f"El índice {index_name} quedó INVALID tras CREATE INDEX CONCURRENTLY"
+            )
+
+
+def _drop_index(index_name: str, table_name: str) -> None:
+    """DROP INDEX CONCURRENTLY IF EXISTS; debe llamarse dentro de autocommit_block()."""
+    op.drop_index(
+        index_name,
+        table_name=table_name,
+        postgresql_concurrently=True,
+        if_exists=True,
+    )
+
+
+def assert_no_duplicates(
+    table_name: str,
+    columns: Sequence[str],
+    where: Optional[str] = None,
+    details: Sequence[str] = (),
+    limit: int = 20,
+) -> None:
+    """
+    Verifica que no haya claves repetidas en `columns` (entre las filas que
+    cumplen `where`) antes de crear un índice único sobre ellas.
+
+    Si las hay aborta la migración con un RuntimeError que lista hasta
+    `limit` claves con su cantidad de filas y, para ayudar a depurarlas, los
+    valores distintos de las columnas de `details`. No hace nada en modo
+    offline (`alembic upgrade --sql`).
+    """
+    if op.get_context().as_sql:
+        return
+
+    key = ", ".join(columns)
+    selected = [key, "count(*) AS filas"]
+    selected += [f"array_agg(DISTINCT {column}) AS {column}" for column in details]
+    where_sql = f" WHERE {where}" if where else ""
+    duplicates = op.get_bind().execute(
+        sa.text(
+            f"SELECT {', '.join(selected)} FROM {table_name}{where_sql} "
+            f"GROUP BY {key} HAVING count(*) > 1 "
+            f"ORDER BY count(*) DESC LIMIT :limit"
+        ),
+        {"limit": limit},
+    ).mappings().all()
+    if not duplicates:
+        return
+
+    lines = [
+        "  " + ", ".join(f"{name}={row[name]}" for name in (*columns, "filas", *details))
+        for row in duplicates
+    ]
+    raise RuntimeError(
+        f"{table_name} tiene claves repetidas en ({key}); depurarlas antes "
+        f"de crear el índice único:\n" + "\n".join(lines)
+    )
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    """Elimina un índice con DROP INDEX CONCURRENTLY fuera de la transacción."""
+    with op.get_context().autocommit_block():
+        _drop_index(index_name, table_name)
+
+
+def backfill_in_batches(
+    table_name: str,
+    set_clause: str,
+    where_clause: str,
+    batch_size: int = 1000,
+    params: Optional[dict] = None,
+) -> int:
+    """
+    Ejecuta un UPDATE de datos en lotes, con commit por lote.
+
+    Cada lote es `UPDATE table SET ... WHERE id IN (SELECT id ... WHERE
+    where_clause LIMIT batch_size)`, así los locks de fila duran solo lo que
+    tarda un lote y una migración sobre tablas grandes puede interrumpirse
+    y retomarse. where_clause debe excluir las filas ya actualizadas
+    (ej: "new_col IS NULL"), si no el bucle nunca termina.
+
+    Retorna la cantidad total de filas actualizadas.
+    """
+    stmt = sa.text(
+        f"UPDATE {table_name} SET {set_clause} "
+        f"WHERE id IN (SELECT id FROM {table_name} WHERE {where_clause} LIMIT :batch_size)"
+    )
+    bind_params = {"batch_size": batch_size, **(params or {})}
+
+    if op.get_context().as_sql:
+        op.execute(stmt.bindparams(**bind_params))
+        return 0
+
+    total = 0
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while True:
+            updated = bind.execute(stmt, bind_params).rowcount
+            if not updated:
+                break
+            total += updated
+    return total
+
+
+def bulk_insert(
+    table_name: str,
+    columns: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    page_size: int = 1000,
+) -> None:
+    """
+    Inserta muchas filas en pocas idas y vueltas al servidor.
+
+    Usa el cursor psycopg2 de la conexión de la migración:
+    - hasta COPY_THRESHOLD filas: execute_values(), que arma un INSERT
+      multi-VALUES por cada page_size filas (op.bulk_insert hace un
+      executemany, una ida y vuelta por fila);
+    - por encima: COPY ... FROM STDIN WITH CSV, que transmite los datos
+      directamente. Los None se envían como NULL.
+
+    Solo funciona en modo online (no con `alembic upgrade --sql`).
+    """
+    column_list = ", ".join(columns)
+    cursor = op.get_bind().connection.cursor()
+    try:
+        if len(rows) > COPY_THRESHOLD:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(rows)
+            buffer.seek(0)
+            cursor.copy_expert(
+                f"COPY {table_name} ({column_list}) FROM STDIN WITH CSV",
+                buffer,
+            )
+        else:
+            execute_values(
+                cursor,
+                f"INSERT INTO {table_name} ({column_list}) VALUES %s",
+                rows,
+                page_size=page_size,
+            )
+    finally:
+        cursor.close()
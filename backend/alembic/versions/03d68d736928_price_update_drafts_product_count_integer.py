@@ -0,0 +1,50 @@
+"""price_update_drafts.product_count as integer
+
+Revision ID: 03d68d736928
+Revises: d1857458a7e0
+Create Date: 2026-10-15 11:00:00.000000
+
+product_count se había creado como String(10): ordenar o sumar por esa
+columna comparaba texto ('10' < '9') y cada lectura requería int(...).
+Se convierte a INTEGER conservando los valores existentes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '03d68d736928'
+down_revision: Union[str, Sequence[str], None] = 'd1857458a7e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: product_count VARCHAR(10) -> INTEGER."""
+    # El default '0'::varchar no se puede castear automáticamente: se quita y se repone
+    op.alter_column('price_update_drafts', 'product_count', server_default=None)
+    op.alter_column(
+        'price_update_drafts',
+        'product_count',
+        existing_type=sa.String(length=10),
+        type_=sa.Integer(),
+        existing_nullable=False,
+        postgresql_using='product_count::integer',
+    )
+    op.alter_column('price_update_drafts', 'product_count', server_default='0')
+
+
+def downgrade() -> None:
+    """Downgrade schema: product_count INTEGER -> VARCHAR(10)."""
+    op.alter_column('price_update_drafts', 'product_count', server_default=None)
+    op.alter_column(
+        'price_update_drafts',
+        'product_count',
+        existing_type=sa.Integer(),
+        type_=sa.String(length=10),
+        existing_nullable=False,
+        postgresql_using='product_count::varchar',
+    )
+    op.alter_column('price_update_drafts', 'product_count', server_default='0')
@@ -1,9 +1,18 @@
 """merge heads
 
 Revision ID: 0a9a80888ff8
-Revises: 74bbeb216fa7, 999999999999
+Revises: 74bbeb216fa7
 Create Date: 2026-02-14 00:18:46.497157
 
+Originalmente unía 74bbeb216fa7 con 999999999999, una revisión duplicada
+que agregaba vouchers.related_voucher_id igual que b8536960a28c. Como
+999999999999 era ancestro de b8536960a28c, un `alembic upgrade head` desde
+cero agregaba la columna dos veces y fallaba. Se eliminó 999999999999 y
+b8536960a28c queda como única revisión que crea la columna.
+
+Una base cuyo alembic_version todavía apunte a 999999999999 (rama sin
+mergear) debe re-stampearse: `alembic stamp 74bbeb216fa7` si la columna
+no existe, o `alembic stamp b8536960a28c` si ya existe.
 """
 from typing import Sequence, Union
 
@@ -13,7 +22,7 @@ import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision: str = '0a9a80888ff8'
-down_revision: Union[str, Sequence[str], None] = ('74bbeb216fa7', '999999999999')
+down_revision: Union[str, Sequence[str], None] = '74bbeb216fa7'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
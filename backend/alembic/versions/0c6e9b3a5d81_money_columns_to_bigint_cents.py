@@ -0,0 +1,56 @@
+"""money columns to bigint cents
+
+Revision ID: 0c6e9b3a5d81
+Revises: f6a2c8e04b17
+Create Date: 2026-10-15 16:00:00.000000
+
+Convierte los importes en pesos de NUMERIC(12, 2) a BIGINT en centavos
+(tipo Money en app/models/types.py). NUMERIC es de precisión arbitraria
+y longitud variable; BIGINT ocupa 8 bytes fijos y suma con aritmética
+entera. Los porcentajes (bonificaciones, IVA, cargo extra) siguen
+siendo NUMERIC.
+
+El cambio de tipo reescribe cada tabla bajo ACCESS EXCLUSIVE.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c6e9b3a5d81'
+down_revision: Union[str, Sequence[str], None] = 'f6a2c8e04b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = {
+    'products': ('cost_price', 'list_price', 'net_price', 'sale_price'),
+    'clients': ('current_balance', 'credit_limit'),
+    'client_accounts': ('debit', 'credit', 'balance'),
+    'payments': ('amount',),
+    'cash_registers': ('opening_amount', 'counted_cash', 'difference'),
+    'cash_movements': ('amount',),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema: NUMERIC(12, 2) -> BIGINT (centavos)."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    for table, columns in COLUMNS.items():
+        alters = ", ".join(
+            f"ALTER COLUMN {column} TYPE BIGINT USING round({column} * 100)::bigint"
+            for column in columns
+        )
+        op.execute(f"ALTER TABLE {table} {alters}")
+
+
+def downgrade() -> None:
+    """Downgrade schema: BIGINT (centavos) -> NUMERIC(12, 2)."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    for table, columns in COLUMNS.items():
+        alters = ", ".join(
+            f"ALTER COLUMN {column} TYPE NUMERIC(12, 2) USING {column} / 100.0"
+            for column in columns
+        )
+        op.execute(f"ALTER TABLE {table} {alters}")
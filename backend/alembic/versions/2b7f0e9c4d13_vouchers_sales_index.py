@@ -0,0 +1,39 @@
+"""vouchers sales index
+
+Revision ID: 2b7f0e9c4d13
+Revises: 5e8b1d4a7c39
+Create Date: 2026-10-15 22:00:00.000000
+
+Índice compuesto parcial para las ventas del período del dashboard
+(business_id, status, voucher_type, date) WHERE deleted_at IS NULL,
+con total en INCLUDE. Reemplaza el BitmapAnd entre índices simples (o el
+seq scan) por un único recorrido de rango, resuelto con Index Only Scan.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b7f0e9c4d13'
+down_revision: Union[str, Sequence[str], None] = '5e8b1d4a7c39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: índice de ventas por período."""
+    create_index_concurrently(
+        'ix_vouchers_sales',
+        'vouchers',
+        ['business_id', 'status', 'voucher_type', 'date'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+        postgresql_include=['total'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: elimina el índice de ventas."""
+    drop_index_concurrently('ix_vouchers_sales', 'vouchers')
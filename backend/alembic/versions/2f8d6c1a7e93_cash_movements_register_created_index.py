@@ -0,0 +1,43 @@
+"""cash_movements register/created_at index
+
+Revision ID: 2f8d6c1a7e93
+Revises: c4e7a2b90f15
+Create Date: 2026-10-15 14:00:00.000000
+
+Reemplaza ix_cash_movements_cash_register_id por un índice compuesto
+(cash_register_id, created_at). Los movimientos de una caja se cargan
+ordenados por created_at (CashRegister.movements), así el índice los
+devuelve ya ordenados y el plan no necesita un nodo Sort. Como
+cash_register_id es prefijo del compuesto, el índice simple sobra y se
+elimina para no mantener dos índices en cada INSERT.
+"""
+from typing import Sequence, Union
+
+from migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f8d6c1a7e93'
+down_revision: Union[str, Sequence[str], None] = 'c4e7a2b90f15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: índice compuesto y baja del índice simple."""
+    create_index_concurrently(
+        'ix_cash_movements_register_created',
+        'cash_movements',
+        ['cash_register_id', 'created_at'],
+    )
+    drop_index_concurrently('ix_cash_movements_cash_register_id', 'cash_movements')
+
+
+def downgrade() -> None:
+    """Downgrade schema: vuelve al índice simple sobre cash_register_id."""
+    create_index_concurrently(
+        'ix_cash_movements_cash_register_id',
+        'cash_movements',
+        ['cash_register_id'],
+    )
+    drop_index_concurrently('ix_cash_movements_register_created', 'cash_movements')
@@ -0,0 +1,57 @@
+"""business credentials to bytea
+
+Revision ID: 3c9a7e5b1d64
+Revises: 8e4b2a6d0c35
+Create Date: 2026-10-15 18:00:00.000000
+
+Pasa a BYTEA (UTF-8) las credenciales ARCA/AFIP de businesses
+(arca_token, arca_sign, afip_cert, afip_key) y las marca con
+STORAGE EXTERNAL: los PEM se guardan fuera de línea y sin comprimir,
+así leerlos no requiere descomprimir y la tupla principal queda chica.
+En el modelo son columnas diferidas (tipo Utf8Bytes), que solo carga la
+emisión electrónica.
+
+El cambio de tipo restablece el STORAGE por defecto del tipo, por eso
+SET STORAGE va después. Solo afecta a los valores que se escriban desde
+ahora: los existentes se reubican la próxima vez que se actualice la
+configuración del negocio.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9a7e5b1d64'
+down_revision: Union[str, Sequence[str], None] = '8e4b2a6d0c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = ('arca_token', 'arca_sign', 'afip_cert', 'afip_key')
+
+
+def upgrade() -> None:
+    """Upgrade schema: TEXT -> BYTEA con STORAGE EXTERNAL."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute(
+        "ALTER TABLE businesses "
+        + ", ".join(
+            f"ALTER COLUMN {column} TYPE BYTEA USING convert_to({column}, 'UTF8')"
+            for column in COLUMNS
+        )
+    )
+    for column in COLUMNS:
+        op.execute(f"ALTER TABLE businesses ALTER COLUMN {column} SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    """Downgrade schema: BYTEA -> TEXT (vuelve al STORAGE por defecto)."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute(
+        "ALTER TABLE businesses "
+        + ", ".join(
+            f"ALTER COLUMN {column} TYPE TEXT USING convert_from({column}, 'UTF8')"
+            for column in COLUMNS
+        )
+    )
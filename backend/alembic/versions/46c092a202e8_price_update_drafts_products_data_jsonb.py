@@ -0,0 +1,58 @@
+"""price_update_drafts.products_data as jsonb
+
+Revision ID: 46c092a202e8
+Revises: 03d68d736928
+Create Date: 2026-10-15 11:30:00.000000
+
+products_data guardaba el JSON de los productos editados como TEXT, lo
+que obligaba a serializar/deserializar en Python y a recorrer la tabla
+completa para saber qué borradores contienen un producto. Se convierte
+a JSONB y se agrega un índice GIN (jsonb_path_ops) para consultas de
+contención (products_data @> '[{"id": "..."}]').
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = '46c092a202e8'
+down_revision: Union[str, Sequence[str], None] = '03d68d736928'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: products_data TEXT -> JSONB + índice GIN."""
+    op.alter_column(
+        'price_update_drafts',
+        'products_data',
+        existing_type=sa.Text(),
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using='products_data::jsonb',
+    )
+    create_index_concurrently(
+        'ix_price_update_drafts_products_data',
+        'price_update_drafts',
+        ['products_data'],
+        postgresql_using='gin',
+        postgresql_ops={'products_data': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: products_data JSONB -> TEXT."""
+    drop_index_concurrently('ix_price_update_drafts_products_data', 'price_update_drafts')
+    op.alter_column(
+        'price_update_drafts',
+        'products_data',
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        type_=sa.Text(),
+        existing_nullable=False,
+        postgresql_using='products_data::text',
+    )
@@ -0,0 +1,37 @@
+"""vouchers.full_number generated column
+
+Revision ID: 4f1c9d7a2e60
+Revises: d0a6c3f81b29
+Create Date: 2026-10-15 20:00:00.000000
+
+Agrega vouchers.full_number como columna generada almacenada
+(sale_point || '-' || number). La base la mantiene en cada INSERT/UPDATE
+(incluido el reemplazo del número de las NC por el asignado por AFIP) y
+el listado puede buscar sobre el número completo con una sola condición.
+
+Agregar una columna STORED reescribe la tabla bajo ACCESS EXCLUSIVE.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f1c9d7a2e60'
+down_revision: Union[str, Sequence[str], None] = 'd0a6c3f81b29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: columna generada full_number."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute(
+        "ALTER TABLE vouchers ADD COLUMN full_number VARCHAR(14) "
+        "GENERATED ALWAYS AS (sale_point || '-' || number) STORED"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: elimina full_number."""
+    op.drop_column('vouchers', 'full_number')
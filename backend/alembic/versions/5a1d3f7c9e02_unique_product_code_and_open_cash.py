@@ -0,0 +1,76 @@
+"""unique product code and open cash register
+
+Revision ID: 5a1d3f7c9e02
+Revises: 0c6e9b3a5d81
+Create Date: 2026-10-15 16:30:00.000000
+
+Lleva a la base dos reglas que hasta ahora solo validaba la aplicación
+(con un SELECT previo y una condición de carrera entre requests):
+
+- uq_products_business_code: código de producto único por negocio entre
+  productos no eliminados. Reemplaza ix_products_code; las búsquedas por
+  código usan ILIKE '%...%', que un B-tree no puede resolver.
+- uq_cash_registers_business_open: una sola caja abierta por negocio.
+
+Antes de construir los índices se verifica que no haya duplicados: si los
+hay la migración se aborta sin crear nada y lista las claves repetidas (código
+por negocio, o negocio con más de una caja abierta). Hay que depurarlas
+(renombrar o eliminar los productos, cerrar las cajas sobrantes) y volver a
+correrla. Si igual entra un duplicado durante la construcción, el índice
+queda INVALID y create_index_concurrently lo elimina antes de fallar.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from migration_helpers import (
+    assert_no_duplicates,
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a1d3f7c9e02'
+down_revision: Union[str, Sequence[str], None] = '0c6e9b3a5d81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: índices únicos parciales."""
+    assert_no_duplicates(
+        'products',
+        ['business_id', 'code'],
+        where='deleted_at IS NULL',
+        details=['id'],
+    )
+    assert_no_duplicates(
+        'cash_registers',
+        ['business_id'],
+        where="status = 'OPEN' AND deleted_at IS NULL",
+        details=['id'],
+    )
+
+    create_index_concurrently(
+        'uq_products_business_code',
+        'products',
+        ['business_id', 'code'],
+        unique=True,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    drop_index_concurrently('ix_products_code', 'products')
+    create_index_concurrently(
+        'uq_cash_registers_business_open',
+        'cash_registers',
+        ['business_id'],
+        unique=True,
+        postgresql_where=sa.text("status = 'OPEN' AND deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: vuelve al índice simple sobre products.code."""
+    drop_index_concurrently('uq_cash_registers_business_open', 'cash_registers')
+    create_index_concurrently('ix_products_code', 'products', ['code'])
+    drop_index_concurrently('uq_products_business_code', 'products')
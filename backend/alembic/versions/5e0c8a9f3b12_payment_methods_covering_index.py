@@ -0,0 +1,37 @@
+"""payment_methods covering index
+
+Revision ID: 5e0c8a9f3b12
+Revises: 9d5b1f0c2e47
+Create Date: 2026-10-15 12:30:00.000000
+
+Índice cubriente para el listado de métodos de pago del negocio
+(WHERE business_id = ? AND is_active ORDER BY name). Incluye todas las
+columnas que devuelve el endpoint, así PostgreSQL responde con un
+Index Only Scan sin visitar el heap. La unicidad del código la da
+uq_business_payment_code_live (9d5b1f0c2e47).
+"""
+from typing import Sequence, Union
+
+from migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e0c8a9f3b12'
+down_revision: Union[str, Sequence[str], None] = '9d5b1f0c2e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: índice (business_id, name) INCLUDE (...)."""
+    create_index_concurrently(
+        'ix_payment_methods_business',
+        'payment_methods',
+        ['business_id', 'name'],
+        postgresql_include=['id', 'code', 'is_active', 'requires_reference'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: elimina el índice cubriente."""
+    drop_index_concurrently('ix_payment_methods_business', 'payment_methods')
@@ -0,0 +1,43 @@
+"""vouchers.show_prices to BOOLEAN
+
+Revision ID: 5e8b1d4a7c39
+Revises: 9a3e6c1f5b82
+Create Date: 2026-10-15 21:30:00.000000
+
+Convierte vouchers.show_prices de VARCHAR(1) 'S'/'N' a BOOLEAN NOT NULL.
+Se mantiene la semántica anterior del PDF (solo 'S' mostraba precios):
+'S' -> true, 'N' y NULL -> false.
+
+Un único ALTER COLUMN ... TYPE ... USING reescribe la tabla una sola vez
+bajo ACCESS EXCLUSIVE (en lugar de agregar, copiar y renombrar columnas).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8b1d4a7c39'
+down_revision: Union[str, Sequence[str], None] = '9a3e6c1f5b82'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: show_prices VARCHAR(1) -> BOOLEAN NOT NULL."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute(
+        "ALTER TABLE vouchers "
+        "ALTER COLUMN show_prices TYPE BOOLEAN USING COALESCE(show_prices = 'S', false), "
+        "ALTER COLUMN show_prices SET NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: show_prices BOOLEAN -> VARCHAR(1) 'S'/'N'."""
+    op.execute(
+        "ALTER TABLE vouchers "
+        "ALTER COLUMN show_prices DROP NOT NULL, "
+        "ALTER COLUMN show_prices TYPE VARCHAR(1) "
+        "USING CASE WHEN show_prices THEN 'S' ELSE 'N' END"
+    )
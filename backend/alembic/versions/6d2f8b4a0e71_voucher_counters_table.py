@@ -0,0 +1,86 @@
+"""voucher counters table
+
+Revision ID: 6d2f8b4a0e71
+Revises: 3c9a7e5b1d64
+Create Date: 2026-10-15 18:30:00.000000
+
+Mueve la numeración correlativa de businesses (last_*_number, VARCHAR(8)
+con ceros a la izquierda) a voucher_counters: una fila BIGINT por
+negocio y serie. Emitir un comprobante ya no actualiza (ni bloquea) la
+fila del negocio, solo la del contador de su serie.
+
+Los códigos de counter_type son los de COUNTER_TYPE_CODES en el modelo.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d2f8b4a0e71'
+down_revision: Union[str, Sequence[str], None] = '3c9a7e5b1d64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (columna en businesses, código de counter_type)
+COUNTERS = (
+    ('last_quotation_number', 1),
+    ('last_receipt_number', 2),
+    ('last_invoice_a_number', 3),
+    ('last_invoice_b_number', 4),
+    ('last_invoice_c_number', 5),
+    ('last_purchase_order_number', 6),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema: businesses.last_*_number -> voucher_counters."""
+    op.create_table(
+        'voucher_counters',
+        sa.Column('business_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('counter_type', sa.SmallInteger(), nullable=False),
+        sa.Column('last_number', sa.BigInteger(), nullable=False),
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['business_id'], ['businesses.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('business_id', 'counter_type', name='uq_voucher_counters_business_type'),
+        sa.CheckConstraint('counter_type BETWEEN 1 AND 6', name='ck_voucher_counters_counter_type'),
+    )
+
+    # Solo se copian las series que ya emitieron algún número; el resto se
+    # crea con la primera emisión (VoucherCounter.next_number)
+    for column, code in COUNTERS:
+        op.execute(
+            f"INSERT INTO voucher_counters (id, business_id, counter_type, last_number) "
+            f"SELECT gen_random_uuid(), id, {code}, {column}::bigint FROM businesses "
+            f"WHERE {column} ~ '^[0-9]+$' AND {column}::bigint > 0"
+        )
+
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    with op.batch_alter_table('businesses', schema=None) as batch_op:
+        for column, _ in COUNTERS:
+            batch_op.drop_column(column)
+
+
+def downgrade() -> None:
+    """Downgrade schema: voucher_counters -> businesses.last_*_number."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    with op.batch_alter_table('businesses', schema=None) as batch_op:
+        for column, _ in COUNTERS:
+            batch_op.add_column(sa.Column(column, sa.String(length=8), nullable=True))
+
+    for column, code in COUNTERS:
+        op.execute(
+            f"UPDATE businesses b SET {column} = lpad(c.last_number::text, 8, '0') "
+            f"FROM voucher_counters c "
+            f"WHERE c.business_id = b.id AND c.counter_type = {code}"
+        )
+        op.execute(f"UPDATE businesses SET {column} = '00000000' WHERE {column} IS NULL")
+
+    op.drop_table('voucher_counters')
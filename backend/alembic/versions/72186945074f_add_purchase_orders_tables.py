@@ -69,7 +69,6 @@ def upgrade() -> None:
     op.create_index(op.f('ix_purchase_order_items_id'), 'purchase_order_items', ['id'], unique=False)
     op.create_index(op.f('ix_purchase_order_items_product_id'), 'purchase_order_items', ['product_id'], unique=False)
     op.create_index(op.f('ix_purchase_order_items_purchase_order_id'), 'purchase_order_items', ['purchase_order_id'], unique=False)
-    op.drop_constraint(op.f('uq_business_payment_code'), 'payment_methods', type_='unique')
     op.create_index(op.f('ix_payment_methods_id'), 'payment_methods', ['id'], unique=False)
     op.create_index(op.f('ix_supplier_category_discounts_id'), 'supplier_category_discounts', ['id'], unique=False)
     op.create_index(op.f('ix_voucher_payments_id'), 'voucher_payments', ['id'], unique=False)
@@ -92,7 +91,6 @@ def downgrade() -> None:
     op.drop_index(op.f('ix_voucher_payments_id'), table_name='voucher_payments')
     op.drop_index(op.f('ix_supplier_category_discounts_id'), table_name='supplier_category_discounts')
     op.drop_index(op.f('ix_payment_methods_id'), table_name='payment_methods')
-    op.create_unique_constraint(op.f('uq_business_payment_code'), 'payment_methods', ['business_id', 'code'], postgresql_nulls_not_distinct=False)
     op.drop_index(op.f('ix_purchase_order_items_purchase_order_id'), table_name='purchase_order_items')
     op.drop_index(op.f('ix_purchase_order_items_product_id'), table_name='purchase_order_items')
     op.drop_index(op.f('ix_purchase_order_items_id'), table_name='purchase_order_items')
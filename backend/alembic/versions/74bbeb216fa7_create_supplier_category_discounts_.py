@@ -36,12 +36,9 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['supplier_id'], ['suppliers.id'], ),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_supplier_category_discounts_category_id'), 'supplier_category_discounts', ['category_id'], unique=False)
-    op.create_index(op.f('ix_supplier_category_discounts_supplier_id'), 'supplier_category_discounts', ['supplier_id'], unique=False)
+    # Los índices sobre supplier_id/category_id se crean con CONCURRENTLY en d1857458a7e0
 
 
 def downgrade() -> None:
     """Downgrade schema."""
-    op.drop_index(op.f('ix_supplier_category_discounts_supplier_id'), table_name='supplier_category_discounts')
-    op.drop_index(op.f('ix_supplier_category_discounts_category_id'), table_name='supplier_category_discounts')
     op.drop_table('supplier_category_discounts')
@@ -0,0 +1,83 @@
+"""vouchers enums to smallint
+
+Revision ID: 7b3e19c4d6a0
+Revises: 5e0c8a9f3b12
+Create Date: 2026-10-15 13:00:00.000000
+
+Convierte vouchers.voucher_type y vouchers.status de los tipos ENUM nativos
+(vouchertype / voucherstatus) a SMALLINT con CHECK. Los códigos son los de
+VOUCHER_TYPE_CODES / VOUCHER_STATUS_CODES en app/models/voucher.py.
+
+2 bytes por columna en lugar de 4 y sin tipos propios que asyncpg tenga
+que introspectar en cada conexión nueva. El cambio de tipo reescribe la
+tabla (y ix_vouchers_voucher_type) bajo ACCESS EXCLUSIVE.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3e19c4d6a0'
+down_revision: Union[str, Sequence[str], None] = '5e0c8a9f3b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Mismo orden que en app/models/voucher.py (no importar modelos desde migraciones)
+VOUCHER_TYPES = (
+    'QUOTATION', 'RECEIPT',
+    'INVOICE_A', 'INVOICE_B', 'INVOICE_C',
+    'CREDIT_NOTE_A', 'CREDIT_NOTE_B', 'CREDIT_NOTE_C',
+    'DEBIT_NOTE_A', 'DEBIT_NOTE_B', 'DEBIT_NOTE_C',
+)
+VOUCHER_STATUSES = ('DRAFT', 'CONFIRMED', 'CANCELLED')
+
+
+def _to_code(column: str, names: Sequence[str]) -> str:
+    """CASE que traduce el nombre del miembro a su código (1..n)."""
+    whens = " ".join(
+        f"WHEN '{name}' THEN {code}" for code, name in enumerate(names, start=1)
+    )
+    return f"CASE {column}::text {whens} END"
+
+
+def _to_name(column: str, names: Sequence[str]) -> str:
+    """CASE inverso: código SMALLINT a nombre del miembro."""
+    whens = " ".join(
+        f"WHEN {code} THEN '{name}'" for code, name in enumerate(names, start=1)
+    )
+    return f"CASE {column} {whens} END"
+
+
+def upgrade() -> None:
+    """Upgrade schema: ENUM nativo -> SMALLINT + CHECK."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute(
+        "ALTER TABLE vouchers "
+        f"ALTER COLUMN voucher_type TYPE SMALLINT USING {_to_code('voucher_type', VOUCHER_TYPES)}, "
+        f"ALTER COLUMN status TYPE SMALLINT USING {_to_code('status', VOUCHER_STATUSES)}"
+    )
+    op.create_check_constraint(
+        'ck_vouchers_voucher_type', 'vouchers', f'voucher_type BETWEEN 1 AND {len(VOUCHER_TYPES)}'
+    )
+    op.create_check_constraint(
+        'ck_vouchers_status', 'vouchers', f'status BETWEEN 1 AND {len(VOUCHER_STATUSES)}'
+    )
+    op.execute("DROP TYPE IF EXISTS vouchertype")
+    op.execute("DROP TYPE IF EXISTS voucherstatus")
+
+
+def downgrade() -> None:
+    """Downgrade schema: vuelve a los tipos ENUM nativos."""
+    op.drop_constraint('ck_vouchers_status', 'vouchers', type_='check')
+    op.drop_constraint('ck_vouchers_voucher_type', 'vouchers', type_='check')
+    types_list = ", ".join(f"'{name}'" for name in VOUCHER_TYPES)
+    statuses_list = ", ".join(f"'{name}'" for name in VOUCHER_STATUSES)
+    op.execute(f"CREATE TYPE vouchertype AS ENUM ({types_list})")
+    op.execute(f"CREATE TYPE voucherstatus AS ENUM ({statuses_list})")
+    op.execute(
+        "ALTER TABLE vouchers "
+        f"ALTER COLUMN voucher_type TYPE vouchertype USING ({_to_name('voucher_type', VOUCHER_TYPES)})::vouchertype, "
+        f"ALTER COLUMN status TYPE voucherstatus USING ({_to_name('status', VOUCHER_STATUSES)})::voucherstatus"
+    )
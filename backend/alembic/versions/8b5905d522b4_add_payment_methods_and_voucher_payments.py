@@ -34,7 +34,7 @@ def upgrade() -> None:
         sa.Column('deleted_at', sa.TIMESTAMP(), nullable=True),
         sa.ForeignKeyConstraint(['business_id'], ['businesses.id']),
         sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('business_id', 'code', name='uq_business_payment_code')
+        # La unicidad (business_id, code) sobre filas vivas la da uq_business_payment_code_live
     )
     
     # Crear tabla voucher_payments
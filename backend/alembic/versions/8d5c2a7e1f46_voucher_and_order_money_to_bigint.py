@@ -0,0 +1,73 @@
+"""voucher and purchase order money columns to bigint cents
+
+Revision ID: 8d5c2a7e1f46
+Revises: 2b7f0e9c4d13
+Create Date: 2026-10-15 22:30:00.000000
+
+Convierte los importes de comprobantes, órdenes de pedido y sus ítems de
+NUMERIC a BIGINT en centavos (tipo Money), igual que 0c6e9b3a5d81 hizo
+con productos, clientes, cuenta corriente y caja. Cantidades y
+porcentajes (quantity, discount_percent, iva_rate, general_discount)
+siguen siendo NUMERIC.
+
+El cambio de tipo reescribe cada tabla bajo ACCESS EXCLUSIVE.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d5c2a7e1f46'
+down_revision: Union[str, Sequence[str], None] = '2b7f0e9c4d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# tabla -> ((columna, tipo NUMERIC original), ...)
+COLUMNS = {
+    'vouchers': (
+        ('subtotal', 'NUMERIC(12, 2)'),
+        ('iva_amount', 'NUMERIC(12, 2)'),
+        ('total', 'NUMERIC(12, 2)'),
+    ),
+    'voucher_items': (
+        ('unit_price', 'NUMERIC(12, 2)'),
+        ('iva_amount', 'NUMERIC(12, 2)'),
+        ('subtotal', 'NUMERIC(12, 2)'),
+        ('total', 'NUMERIC(12, 2)'),
+    ),
+    'purchase_orders': (
+        ('subtotal', 'NUMERIC(14, 2)'),
+        ('total_iva', 'NUMERIC(14, 2)'),
+        ('total', 'NUMERIC(14, 2)'),
+    ),
+    'purchase_order_items': (
+        ('unit_cost', 'NUMERIC(12, 2)'),
+        ('subtotal', 'NUMERIC(14, 2)'),
+        ('iva_amount', 'NUMERIC(14, 2)'),
+        ('total', 'NUMERIC(14, 2)'),
+    ),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema: NUMERIC -> BIGINT (centavos)."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    for table, columns in COLUMNS.items():
+        alters = ", ".join(
+            f"ALTER COLUMN {column} TYPE BIGINT USING round({column} * 100)::bigint"
+            for column, _ in columns
+        )
+        op.execute(f"ALTER TABLE {table} {alters}")
+
+
+def downgrade() -> None:
+    """Downgrade schema: BIGINT (centavos) -> NUMERIC."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    for table, columns in COLUMNS.items():
+        alters = ", ".join(
+            f"ALTER COLUMN {column} TYPE {numeric_type} USING {column} / 100.0"
+            for column, numeric_type in columns
+        )
+        op.execute(f"ALTER TABLE {table} {alters}")
@@ -0,0 +1,89 @@
+"""enum columns to smallint
+
+Revision ID: 8e4b2a6d0c35
+Revises: 5a1d3f7c9e02
+Create Date: 2026-10-15 17:00:00.000000
+
+Pasa a SMALLINT con CHECK las columnas de tipo enumerado de las tablas
+de movimientos, que son las que más filas acumulan:
+
+- payments.method (ENUM paymentmethod)
+- client_accounts.movement_type (ENUM movementtype)
+- cash_movements.type / payment_method (VARCHAR + CHECK desde a91f4d2c6b58)
+
+Los códigos son los de *_CODES en los modelos (tipo SmallIntEnum).
+El cambio de tipo reescribe cada tabla bajo ACCESS EXCLUSIVE.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4b2a6d0c35'
+down_revision: Union[str, Sequence[str], None] = '5a1d3f7c9e02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (tabla, columna, constraint, tipo ENUM original o None si era VARCHAR, valores en orden de código)
+COLUMNS = (
+    ('payments', 'method', 'ck_payments_method', 'paymentmethod',
+     ('CASH', 'TRANSFER', 'CHECK', 'CREDIT_CARD', 'DEBIT_CARD', 'MERCADOPAGO', 'OTHER')),
+    ('client_accounts', 'movement_type', 'ck_client_accounts_movement_type', 'movementtype',
+     ('INVOICE', 'PAYMENT', 'CREDIT_NOTE', 'DEBIT_NOTE', 'ADJUSTMENT_DEBIT', 'ADJUSTMENT_CREDIT')),
+    ('cash_movements', 'type', 'ck_cash_movements_type', None,
+     ('SALE', 'PAYMENT_RECEIVED', 'INCOME', 'EXPENSE')),
+    ('cash_movements', 'payment_method', 'ck_cash_movements_payment_method', None,
+     ('CASH', 'CARD', 'TRANSFER', 'CHECK', 'OTHER')),
+)
+
+
+def _to_code(column: str, names: Sequence[str]) -> str:
+    """CASE que traduce el nombre del miembro a su código (1..n)."""
+    whens = " ".join(f"WHEN '{name}' THEN {code}" for code, name in enumerate(names, start=1))
+    return f"CASE {column}::text {whens} END"
+
+
+def _to_name(column: str, names: Sequence[str]) -> str:
+    """CASE inverso: código SMALLINT a nombre del miembro."""
+    whens = " ".join(f"WHEN {code} THEN '{name}'" for code, name in enumerate(names, start=1))
+    return f"CASE {column} {whens} END"
+
+
+def _in_list(values: Sequence[str]) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    """Upgrade schema: ENUM / VARCHAR -> SMALLINT + CHECK."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    for table, column, constraint, type_name, names in COLUMNS:
+        if type_name is None:
+            op.drop_constraint(constraint, table, type_='check')
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE SMALLINT "
+            f"USING {_to_code(column, names)}"
+        )
+        op.create_check_constraint(constraint, table, f"{column} BETWEEN 1 AND {len(names)}")
+        if type_name is not None:
+            op.execute(f"DROP TYPE IF EXISTS {type_name}")
+
+
+def downgrade() -> None:
+    """Downgrade schema: vuelve a ENUM nativo / VARCHAR + CHECK."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    for table, column, constraint, type_name, names in reversed(COLUMNS):
+        op.drop_constraint(constraint, table, type_='check')
+        if type_name is not None:
+            op.execute(f"CREATE TYPE {type_name} AS ENUM ({_in_list(names)})")
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} "
+                f"USING ({_to_name(column, names)})::{type_name}"
+            )
+        else:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(20) "
+                f"USING {_to_name(column, names)}"
+            )
+            op.create_check_constraint(constraint, table, f"{column} IN ({_in_list(names)})")
@@ -0,0 +1,40 @@
+"""vouchers.arca_response to JSONB
+
+Revision ID: 9a3e6c1f5b82
+Revises: 4f1c9d7a2e60
+Create Date: 2026-10-15 21:00:00.000000
+
+Convierte vouchers.arca_response de TEXT a JSONB: la respuesta de ARCA
+queda validada y parseada una sola vez al escribirla. JSONB mantiene el
+STORAGE EXTENDED por defecto (TOAST comprimido), que es lo que conviene
+para un documento que no se lee en los listados.
+
+El cambio de tipo reescribe la tabla bajo ACCESS EXCLUSIVE.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3e6c1f5b82'
+down_revision: Union[str, Sequence[str], None] = '4f1c9d7a2e60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: arca_response TEXT -> JSONB."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute(
+        "ALTER TABLE vouchers ALTER COLUMN arca_response TYPE JSONB "
+        "USING arca_response::jsonb"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: arca_response JSONB -> TEXT."""
+    op.execute(
+        "ALTER TABLE vouchers ALTER COLUMN arca_response TYPE TEXT "
+        "USING arca_response::text"
+    )
@@ -0,0 +1,40 @@
+"""payment_methods partial unique code
+
+Revision ID: 9d5b1f0c2e47
+Revises: 46c092a202e8
+Create Date: 2026-10-15 12:00:00.000000
+
+Unicidad de (business_id, code) en payment_methods solo para filas vivas.
+El UniqueConstraint original incluía filas con soft delete (impidiendo
+reutilizar un código eliminado) y fue eliminado en 72186945074f sin
+reemplazo. El índice parcial WHERE deleted_at IS NULL restablece la
+regla con la semántica correcta y sin indexar filas eliminadas.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d5b1f0c2e47'
+down_revision: Union[str, Sequence[str], None] = '46c092a202e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: índice único parcial sobre (business_id, code)."""
+    create_index_concurrently(
+        'uq_business_payment_code_live',
+        'payment_methods',
+        ['business_id', 'code'],
+        unique=True,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: elimina el índice único parcial."""
+    drop_index_concurrently('uq_business_payment_code_live', 'payment_methods')
@@ -0,0 +1,60 @@
+"""unique client document per business
+
+Revision ID: a7d4e1b9c6f2
+Revises: c3e9a5f2b7d0
+Create Date: 2026-10-15 23:30:00.000000
+
+uq_clients_business_document: número de documento único por negocio entre
+clientes no eliminados. Hasta ahora lo validaba la aplicación con un SELECT
+previo al INSERT (dos round-trips y una condición de carrera entre
+requests). Reemplaza ix_clients_document_number: las búsquedas por
+documento usan ILIKE '%...%', que un B-tree no puede resolver.
+
+Antes de construir el índice se verifica que no haya duplicados: si los hay
+la migración se aborta sin crear nada y lista cada negocio y número repetido
+con los tipos de documento y los ids de los clientes involucrados (el mismo
+número puede estar cargado como CUIT y como DNI). Hay que unificar o
+corregir esos clientes y volver a correrla. Si igual entra un duplicado
+durante la construcción, el índice queda INVALID y create_index_concurrently
+lo elimina antes de fallar.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from migration_helpers import (
+    assert_no_duplicates,
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d4e1b9c6f2'
+down_revision: Union[str, Sequence[str], None] = 'c3e9a5f2b7d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: documento de cliente único por negocio."""
+    assert_no_duplicates(
+        'clients',
+        ['business_id', 'document_number'],
+        where='deleted_at IS NULL',
+        details=['document_type', 'id'],
+    )
+    create_index_concurrently(
+        'uq_clients_business_document',
+        'clients',
+        ['business_id', 'document_number'],
+        unique=True,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    drop_index_concurrently('ix_clients_document_number', 'clients')
+
+
+def downgrade() -> None:
+    """Downgrade schema: vuelve al índice simple sobre clients.document_number."""
+    create_index_concurrently('ix_clients_document_number', 'clients', ['document_number'])
+    drop_index_concurrently('uq_clients_business_document', 'clients')
@@ -0,0 +1,62 @@
+"""cash enums to varchar + check
+
+Revision ID: a91f4d2c6b58
+Revises: 2f8d6c1a7e93
+Create Date: 2026-10-15 14:30:00.000000
+
+Reemplaza los tipos ENUM nativos de caja (cashregisterstatus,
+cashmovementtype, cashpaymentmethod) por VARCHAR(20) con CHECK.
+
+Agregar un valor a un ENUM nativo requiere ALTER TYPE ... ADD VALUE, que
+no puede correr dentro de una transacción. Con CHECK alcanza con
+DROP/ADD CONSTRAINT dentro de una migración transaccional normal, y las
+conexiones nuevas no tienen que resolver tipos propios en pg_type.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a91f4d2c6b58'
+down_revision: Union[str, Sequence[str], None] = '2f8d6c1a7e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (tabla, columna, tipo ENUM original, constraint, valores)
+COLUMNS = (
+    ('cash_registers', 'status', 'cashregisterstatus', 'ck_cash_registers_status',
+     ('OPEN', 'CLOSED')),
+    ('cash_movements', 'type', 'cashmovementtype', 'ck_cash_movements_type',
+     ('SALE', 'PAYMENT_RECEIVED', 'INCOME', 'EXPENSE')),
+    ('cash_movements', 'payment_method', 'cashpaymentmethod', 'ck_cash_movements_payment_method',
+     ('CASH', 'CARD', 'TRANSFER', 'CHECK', 'OTHER')),
+)
+
+
+def _in_list(values: Sequence[str]) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    """Upgrade schema: ENUM nativo -> VARCHAR(20) + CHECK."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    for table, column, type_name, constraint, values in COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(20) USING {column}::text"
+        )
+        op.create_check_constraint(constraint, table, f"{column} IN ({_in_list(values)})")
+        op.execute(f"DROP TYPE IF EXISTS {type_name}")
+
+
+def downgrade() -> None:
+    """Downgrade schema: vuelve a los tipos ENUM nativos."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    for table, column, type_name, constraint, values in reversed(COLUMNS):
+        op.drop_constraint(constraint, table, type_='check')
+        op.execute(f"CREATE TYPE {type_name} AS ENUM ({_in_list(values)})")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} "
+            f"USING {column}::{type_name}"
+        )
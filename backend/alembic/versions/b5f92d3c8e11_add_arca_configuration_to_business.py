@@ -19,24 +19,26 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Agregar campos de configuración ARCA/AFIP
-    op.add_column('businesses', sa.Column('arca_token', sa.Text(), nullable=True))
-    op.add_column('businesses', sa.Column('arca_sign', sa.Text(), nullable=True))
-    op.add_column('businesses', sa.Column('arca_token_expiration', sa.String(length=30), nullable=True))
-    op.add_column('businesses', sa.Column('arca_cuit_representante', sa.String(length=13), nullable=True))
-    op.add_column('businesses', sa.Column('arca_environment', sa.String(length=20), nullable=True, server_default='testing'))
-    
-    # Agregar campos de configuración MrBot API
-    op.add_column('businesses', sa.Column('mrbot_email', sa.String(length=255), nullable=True))
-    op.add_column('businesses', sa.Column('mrbot_api_key', sa.String(length=500), nullable=True))
+    with op.batch_alter_table('businesses') as batch_op:
+        # Agregar campos de configuración ARCA/AFIP
+        batch_op.add_column(sa.Column('arca_token', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('arca_sign', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('arca_token_expiration', sa.String(length=30), nullable=True))
+        batch_op.add_column(sa.Column('arca_cuit_representante', sa.String(length=13), nullable=True))
+        batch_op.add_column(sa.Column('arca_environment', sa.String(length=20), nullable=True, server_default='testing'))
+
+        # Agregar campos de configuración MrBot API
+        batch_op.add_column(sa.Column('mrbot_email', sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column('mrbot_api_key', sa.String(length=500), nullable=True))
 
 
 def downgrade() -> None:
     # Eliminar campos en caso de rollback
-    op.drop_column('businesses', 'mrbot_api_key')
-    op.drop_column('businesses', 'mrbot_email')
-    op.drop_column('businesses', 'arca_environment')
-    op.drop_column('businesses', 'arca_cuit_representante')
-    op.drop_column('businesses', 'arca_token_expiration')
-    op.drop_column('businesses', 'arca_sign')
-    op.drop_column('businesses', 'arca_token')
+    with op.batch_alter_table('businesses') as batch_op:
+        batch_op.drop_column('mrbot_api_key')
+        batch_op.drop_column('mrbot_email')
+        batch_op.drop_column('arca_environment')
+        batch_op.drop_column('arca_cuit_representante')
+        batch_op.drop_column('arca_token_expiration')
+        batch_op.drop_column('arca_sign')
+        batch_op.drop_column('arca_token')
@@ -0,0 +1,46 @@
+"""cash_movements covering index
+
+Revision ID: b7d4e0a2c918
+Revises: 6d2f8b4a0e71
+Create Date: 2026-10-15 19:00:00.000000
+
+Reemplaza ix_cash_movements_register_created por el mismo índice
+(cash_register_id, created_at) con INCLUDE (type, payment_method,
+amount). El resumen de caja agrupa por tipo y método sumando amount:
+con esas columnas en el índice se resuelve con un Index Only Scan, sin
+visitar el heap por cada movimiento.
+
+No es parcial: los movimientos de caja no se eliminan (soft delete) y
+las consultas no filtran por deleted_at.
+"""
+from typing import Sequence, Union
+
+from migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d4e0a2c918'
+down_revision: Union[str, Sequence[str], None] = '6d2f8b4a0e71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: índice cubriente y baja del índice compuesto."""
+    create_index_concurrently(
+        'ix_cash_movements_register_covering',
+        'cash_movements',
+        ['cash_register_id', 'created_at'],
+        postgresql_include=['type', 'payment_method', 'amount'],
+    )
+    drop_index_concurrently('ix_cash_movements_register_created', 'cash_movements')
+
+
+def downgrade() -> None:
+    """Downgrade schema: vuelve al índice compuesto sin INCLUDE."""
+    create_index_concurrently(
+        'ix_cash_movements_register_created',
+        'cash_movements',
+        ['cash_register_id', 'created_at'],
+    )
+    drop_index_concurrently('ix_cash_movements_register_covering', 'cash_movements')
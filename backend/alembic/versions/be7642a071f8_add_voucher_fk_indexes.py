@@ -0,0 +1,37 @@
+"""add voucher fk indexes
+
+Revision ID: be7642a071f8
+Revises: 594c26beebec
+Create Date: 2026-10-15 10:00:00.000000
+
+Agrega el índice faltante sobre vouchers.deleted_by.
+PostgreSQL no crea índices automáticamente para columnas FK, por lo que
+cada ON DELETE SET NULL desde users y cada búsqueda por auditoría de
+eliminación recorría toda la tabla vouchers.
+
+related_voucher_id ya tiene su índice (ix_vouchers_related_voucher_id,
+creado en 72186945074f) e invoiced_voucher_id el suyo (d1857458a7e0).
+
+El índice se construye con CREATE INDEX CONCURRENTLY para no bloquear
+escrituras sobre vouchers; eso requiere correr fuera de la transacción.
+"""
+from typing import Sequence, Union
+
+from migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'be7642a071f8'
+down_revision: Union[str, Sequence[str], None] = '594c26beebec'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: índice sobre vouchers.deleted_by."""
+    create_index_concurrently('ix_vouchers_deleted_by', 'vouchers', ['deleted_by'])
+
+
+def downgrade() -> None:
+    """Downgrade schema: elimina el índice sobre vouchers.deleted_by."""
+    drop_index_concurrently('ix_vouchers_deleted_by', 'vouchers')
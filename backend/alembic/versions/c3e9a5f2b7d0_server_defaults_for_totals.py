@@ -0,0 +1,75 @@
+"""server defaults for totals and status columns
+
+Revision ID: c3e9a5f2b7d0
+Revises: 8d5c2a7e1f46
+Create Date: 2026-10-15 23:00:00.000000
+
+Los importes, porcentajes y estados con valor inicial fijo pasan a tener
+DEFAULT en la base en lugar de un default de Python: los INSERT que no
+los informan omiten la columna y PostgreSQL la completa desde el
+catálogo (vuelve en el RETURNING por eager_defaults).
+
+SET DEFAULT solo modifica el catálogo, no reescribe la tabla.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e9a5f2b7d0'
+down_revision: Union[str, Sequence[str], None] = '8d5c2a7e1f46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# tabla -> ((columna, default), ...); los estados son el código SMALLINT de DRAFT
+DEFAULTS = {
+    'vouchers': (
+        ('status', '1'),
+        ('general_discount', '0'),
+        ('subtotal', '0'),
+        ('iva_amount', '0'),
+        ('total', '0'),
+    ),
+    'voucher_items': (
+        ('discount_percent', '0'),
+    ),
+    'purchase_orders': (
+        ('status', '1'),
+        ('subtotal', '0'),
+        ('total_iva', '0'),
+        ('total', '0'),
+    ),
+    'purchase_order_items': (
+        ('system_stock', '0'),
+        ('quantity_to_order', '0'),
+        ('unit_cost', '0'),
+        ('iva_rate', '21.00'),
+        ('subtotal', '0'),
+        ('iva_amount', '0'),
+        ('total', '0'),
+    ),
+    'client_accounts': (
+        ('debit', '0'),
+        ('credit', '0'),
+    ),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema: DEFAULT en la base."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    for table, columns in DEFAULTS.items():
+        alters = ", ".join(
+            f"ALTER COLUMN {column} SET DEFAULT {default}" for column, default in columns
+        )
+        op.execute(f"ALTER TABLE {table} {alters}")
+
+
+def downgrade() -> None:
+    """Downgrade schema: quita los DEFAULT."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    for table, columns in DEFAULTS.items():
+        alters = ", ".join(f"ALTER COLUMN {column} DROP DEFAULT" for column, _ in columns)
+        op.execute(f"ALTER TABLE {table} {alters}")
@@ -0,0 +1,88 @@
+"""timestamps to timestamptz
+
+Revision ID: c4e7a2b90f15
+Revises: 7b3e19c4d6a0
+Create Date: 2026-10-15 13:30:00.000000
+
+Convierte todas las columnas de fecha y hora de TIMESTAMP WITHOUT TIME ZONE
+a TIMESTAMPTZ y unifica el valor por defecto de created_at / updated_at en
+now() (antes solo supplier_category_discounts lo tenía).
+
+Los valores existentes se guardaron con datetime.utcnow(), es decir en UTC.
+Con el TimeZone de la sesión en UTC, PostgreSQL (12+) hace la conversión
+timestamp -> timestamptz sin reescribir las tablas ni sus índices.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e7a2b90f15'
+down_revision: Union[str, Sequence[str], None] = '7b3e19c4d6a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tablas que heredan de BaseModel (created_at / updated_at / deleted_at)
+BASE_TABLES = (
+    'users',
+    'businesses',
+    'categories',
+    'clients',
+    'suppliers',
+    'products',
+    'price_history',
+    'supplier_category_discounts',
+    'price_update_drafts',
+    'payment_methods',
+    'vouchers',
+    'voucher_items',
+    'voucher_payments',
+    'payments',
+    'client_accounts',
+    'cash_registers',
+    'cash_movements',
+    'purchase_orders',
+    'purchase_order_items',
+)
+
+# Columnas propias de cada tabla, además de las de BaseModel
+EXTRA_COLUMNS = {
+    'cash_registers': ('opened_at', 'closed_at'),
+    'purchase_orders': ('confirmed_at',),
+}
+
+
+def _alter_all(type_: str) -> None:
+    """Cambia el tipo de todas las columnas de fecha y hora a type_."""
+    op.execute("SET LOCAL timezone = 'UTC'")
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    for table in BASE_TABLES:
+        columns = ('created_at', 'updated_at', 'deleted_at') + EXTRA_COLUMNS.get(table, ())
+        alters = ", ".join(f"ALTER COLUMN {column} TYPE {type_}" for column in columns)
+        op.execute(f"ALTER TABLE {table} {alters}")
+
+
+def upgrade() -> None:
+    """Upgrade schema: TIMESTAMP -> TIMESTAMPTZ con default now()."""
+    _alter_all('TIMESTAMPTZ')
+    for table in BASE_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} "
+            "ALTER COLUMN created_at SET DEFAULT now(), "
+            "ALTER COLUMN updated_at SET DEFAULT now()"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema: vuelve a TIMESTAMP WITHOUT TIME ZONE (en UTC)."""
+    for table in BASE_TABLES:
+        if table == 'supplier_category_discounts':
+            continue
+        op.execute(
+            f"ALTER TABLE {table} "
+            "ALTER COLUMN created_at DROP DEFAULT, "
+            "ALTER COLUMN updated_at DROP DEFAULT"
+        )
+    _alter_all('TIMESTAMP WITHOUT TIME ZONE')
@@ -20,22 +20,15 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     # Agregar campos para Afip SDK
-    op.add_column(
-        'businesses',
-        sa.Column('afipsdk_access_token', sa.String(length=500), nullable=True),
-    )
-    op.add_column(
-        'businesses',
-        sa.Column('afip_cert', sa.Text(), nullable=True),
-    )
-    op.add_column(
-        'businesses',
-        sa.Column('afip_key', sa.Text(), nullable=True),
-    )
+    with op.batch_alter_table('businesses') as batch_op:
+        batch_op.add_column(sa.Column('afipsdk_access_token', sa.String(length=500), nullable=True))
+        batch_op.add_column(sa.Column('afip_cert', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('afip_key', sa.Text(), nullable=True))
 
 
 def downgrade() -> None:
-    op.drop_column('businesses', 'afip_key')
-    op.drop_column('businesses', 'afip_cert')
-    op.drop_column('businesses', 'afipsdk_access_token')
+    with op.batch_alter_table('businesses') as batch_op:
+        batch_op.drop_column('afip_key')
+        batch_op.drop_column('afip_cert')
+        batch_op.drop_column('afipsdk_access_token')
 
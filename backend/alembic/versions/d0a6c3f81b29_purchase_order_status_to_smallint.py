@@ -0,0 +1,43 @@
+"""purchase_orders.status to smallint
+
+Revision ID: d0a6c3f81b29
+Revises: b7d4e0a2c918
+Create Date: 2026-10-15 19:30:00.000000
+
+Pasa purchase_orders.status del ENUM nativo purchaseorderstatus a
+SMALLINT con CHECK, como el resto de las columnas enumeradas (códigos de
+PURCHASE_ORDER_STATUS_CODES en el modelo, tipo SmallIntEnum).
+ix_purchase_orders_status se reconstruye con el cambio de tipo.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd0a6c3f81b29'
+down_revision: Union[str, Sequence[str], None] = 'b7d4e0a2c918'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: ENUM purchaseorderstatus -> SMALLINT + CHECK."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute(
+        "ALTER TABLE purchase_orders ALTER COLUMN status TYPE SMALLINT "
+        "USING CASE status::text WHEN 'DRAFT' THEN 1 WHEN 'CONFIRMED' THEN 2 END"
+    )
+    op.create_check_constraint('ck_purchase_orders_status', 'purchase_orders', 'status BETWEEN 1 AND 2')
+    op.execute("DROP TYPE IF EXISTS purchaseorderstatus")
+
+
+def downgrade() -> None:
+    """Downgrade schema: SMALLINT -> ENUM purchaseorderstatus."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.drop_constraint('ck_purchase_orders_status', 'purchase_orders', type_='check')
+    op.execute("CREATE TYPE purchaseorderstatus AS ENUM ('DRAFT', 'CONFIRMED')")
+    op.execute(
+        "ALTER TABLE purchase_orders ALTER COLUMN status TYPE purchaseorderstatus "
+        "USING (CASE status WHEN 1 THEN 'DRAFT' WHEN 2 THEN 'CONFIRMED' END)::purchaseorderstatus"
+    )
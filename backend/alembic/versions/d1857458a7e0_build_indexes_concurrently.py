@@ -0,0 +1,49 @@
+"""build indexes concurrently
+
+Revision ID: d1857458a7e0
+Revises: be7642a071f8
+Create Date: 2026-10-15 10:30:00.000000
+
+Revisión no transaccional que contiene solo CREATE INDEX CONCURRENTLY.
+Los índices se sacaron de las revisiones que crean las tablas/columnas
+(74bbeb216fa7, d3f1b7c9a452, e8c2a4f1b369, fa3bbaaf3d7b) para que esas
+sigan siendo transaccionales y la construcción de índices no bloquee
+escrituras sobre tablas con datos.
+
+En bases que ya aplicaron las revisiones originales los índices existen
+y create_index_concurrently() no hace nada (IF NOT EXISTS).
+"""
+from typing import Sequence, Union
+
+from migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1857458a7e0'
+down_revision: Union[str, Sequence[str], None] = 'be7642a071f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = (
+    ('ix_supplier_category_discounts_category_id', 'supplier_category_discounts', ['category_id']),
+    ('ix_supplier_category_discounts_supplier_id', 'supplier_category_discounts', ['supplier_id']),
+    ('ix_vouchers_invoiced_voucher_id', 'vouchers', ['invoiced_voucher_id']),
+    ('ix_price_update_drafts_business_id', 'price_update_drafts', ['business_id']),
+    ('ix_cash_registers_id', 'cash_registers', ['id']),
+    ('ix_cash_registers_business_id', 'cash_registers', ['business_id']),
+    ('ix_cash_movements_id', 'cash_movements', ['id']),
+    ('ix_cash_movements_cash_register_id', 'cash_movements', ['cash_register_id']),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema: construye los índices sin bloquear escrituras."""
+    for index_name, table_name, columns in INDEXES:
+        create_index_concurrently(index_name, table_name, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema: elimina los índices sin bloquear escrituras."""
+    for index_name, table_name, _ in reversed(INDEXES):
+        drop_index_concurrently(index_name, table_name)
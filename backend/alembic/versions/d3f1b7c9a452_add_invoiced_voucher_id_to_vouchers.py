@@ -29,11 +29,7 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     """Upgrade schema: agrega invoiced_voucher_id para trackear cotizaciones facturadas."""
     op.add_column('vouchers', sa.Column('invoiced_voucher_id', sa.UUID(), nullable=True))
-    op.create_index(
-        'ix_vouchers_invoiced_voucher_id',
-        'vouchers',
-        ['invoiced_voucher_id'],
-    )
+    # ix_vouchers_invoiced_voucher_id se crea con CONCURRENTLY en d1857458a7e0
     op.create_foreign_key(
         'fk_vouchers_invoiced_voucher_id',
         'vouchers', 'vouchers',
@@ -45,5 +41,4 @@ def upgrade() -> None:
 def downgrade() -> None:
     """Downgrade schema: elimina invoiced_voucher_id."""
     op.drop_constraint('fk_vouchers_invoiced_voucher_id', 'vouchers', type_='foreignkey')
-    op.drop_index('ix_vouchers_invoiced_voucher_id', table_name='vouchers')
     op.drop_column('vouchers', 'invoiced_voucher_id')
@@ -0,0 +1,56 @@
+"""drop redundant id indexes
+
+Revision ID: e3b5d7f91a24
+Revises: a91f4d2c6b58
+Create Date: 2026-10-15 15:00:00.000000
+
+Elimina los índices ix_<tabla>_id. BaseModel.id declaraba index=True además
+de primary_key=True, y PostgreSQL ya crea un índice único para la clave
+primaria (<tabla>_pkey): cada INSERT mantenía dos B-trees idénticos.
+"""
+from typing import Sequence, Union
+
+from migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b5d7f91a24'
+down_revision: Union[str, Sequence[str], None] = 'a91f4d2c6b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tablas que heredan de BaseModel
+TABLES = (
+    'users',
+    'businesses',
+    'categories',
+    'clients',
+    'suppliers',
+    'products',
+    'price_history',
+    'supplier_category_discounts',
+    'price_update_drafts',
+    'payment_methods',
+    'vouchers',
+    'voucher_items',
+    'voucher_payments',
+    'payments',
+    'client_accounts',
+    'cash_registers',
+    'cash_movements',
+    'purchase_orders',
+    'purchase_order_items',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema: elimina los índices duplicados de la clave primaria."""
+    for table in TABLES:
+        drop_index_concurrently(f'ix_{table}_id', table)
+
+
+def downgrade() -> None:
+    """Downgrade schema: vuelve a crear los índices ix_<tabla>_id."""
+    for table in reversed(TABLES):
+        create_index_concurrently(f'ix_{table}_id', table, ['id'])
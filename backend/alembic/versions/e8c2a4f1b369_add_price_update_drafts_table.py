@@ -42,10 +42,9 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
     )
     op.create_index('ix_price_update_drafts_id', 'price_update_drafts', ['id'])
-    op.create_index('ix_price_update_drafts_business_id', 'price_update_drafts', ['business_id'])
+    # ix_price_update_drafts_business_id se crea con CONCURRENTLY en d1857458a7e0
 
 
 def downgrade() -> None:
-    op.drop_index('ix_price_update_drafts_business_id', table_name='price_update_drafts')
     op.drop_index('ix_price_update_drafts_id', table_name='price_update_drafts')
     op.drop_table('price_update_drafts')
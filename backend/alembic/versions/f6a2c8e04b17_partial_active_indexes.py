@@ -0,0 +1,59 @@
+"""partial indexes on active rows
+
+Revision ID: f6a2c8e04b17
+Revises: e3b5d7f91a24
+Create Date: 2026-10-15 15:30:00.000000
+
+Reemplaza los índices simples sobre business_id (owner_id en businesses)
+por índices parciales WHERE deleted_at IS NULL, compuestos con la columna
+de orden de cada listado. Todas las consultas por negocio filtran las
+filas eliminadas (soft delete), así el índice no guarda las filas
+eliminadas y los listados salen ya ordenados desde el índice.
+
+Los ORDER BY ... DESC se resuelven recorriendo el índice en sentido inverso.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a2c8e04b17'
+down_revision: Union[str, Sequence[str], None] = 'e3b5d7f91a24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (tabla, índice simple reemplazado, columna del índice simple, columnas del parcial)
+INDEXES = (
+    ('businesses', 'ix_businesses_owner_id', 'owner_id', ['owner_id']),
+    ('categories', 'ix_categories_business_id', 'business_id', ['business_id', 'name']),
+    ('clients', 'ix_clients_business_id', 'business_id', ['business_id', 'name']),
+    ('suppliers', 'ix_suppliers_business_id', 'business_id', ['business_id', 'name']),
+    ('products', 'ix_products_business_id', 'business_id', ['business_id', 'description']),
+    ('purchase_orders', 'ix_purchase_orders_business_id', 'business_id', ['business_id', 'created_at']),
+    ('price_update_drafts', 'ix_price_update_drafts_business_id', 'business_id', ['business_id', 'updated_at']),
+    ('cash_registers', 'ix_cash_registers_business_id', 'business_id', ['business_id']),
+    ('vouchers', 'ix_vouchers_business_id', 'business_id', ['business_id', 'created_at']),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema: índices parciales sobre filas activas."""
+    for table, old_index, _, columns in INDEXES:
+        create_index_concurrently(
+            f'ix_{table}_active',
+            table,
+            columns,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+        )
+        drop_index_concurrently(old_index, table)
+
+
+def downgrade() -> None:
+    """Downgrade schema: vuelve a los índices simples."""
+    for table, old_index, old_column, _ in reversed(INDEXES):
+        create_index_concurrently(old_index, table, [old_column])
+        drop_index_concurrently(f'ix_{table}_active', table)
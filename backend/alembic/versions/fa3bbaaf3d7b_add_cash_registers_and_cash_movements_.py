@@ -19,7 +19,15 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    """Upgrade schema: crea tablas cash_registers y cash_movements."""
+    """
+    Upgrade schema: crea tablas cash_registers y cash_movements.
+
+    Solo DDL transaccional (tablas + tipos ENUM). Los índices se construyen
+    con CONCURRENTLY en d1857458a7e0.
+    """
+    # Fallar rápido en lugar de quedar encolado detrás de una query larga
+    op.execute("SET LOCAL lock_timeout = '5s'")
+
     op.create_table(
         'cash_registers',
         sa.Column('business_id', sa.UUID(), nullable=False),
@@ -42,8 +50,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['opened_by'], ['users.id']),
         sa.PrimaryKeyConstraint('id'),
     )
-    op.create_index(op.f('ix_cash_registers_business_id'), 'cash_registers', ['business_id'], unique=False)
-    op.create_index(op.f('ix_cash_registers_id'), 'cash_registers', ['id'], unique=False)
 
     op.create_table(
         'cash_movements',
@@ -63,17 +69,11 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['voucher_id'], ['vouchers.id']),
         sa.PrimaryKeyConstraint('id'),
     )
-    op.create_index(op.f('ix_cash_movements_cash_register_id'), 'cash_movements', ['cash_register_id'], unique=False)
-    op.create_index(op.f('ix_cash_movements_id'), 'cash_movements', ['id'], unique=False)
 
 
 def downgrade() -> None:
     """Downgrade schema: elimina tablas de caja."""
-    op.drop_index(op.f('ix_cash_movements_id'), table_name='cash_movements')
-    op.drop_index(op.f('ix_cash_movements_cash_register_id'), table_name='cash_movements')
     op.drop_table('cash_movements')
-    op.drop_index(op.f('ix_cash_registers_id'), table_name='cash_registers')
-    op.drop_index(op.f('ix_cash_registers_business_id'), table_name='cash_registers')
     op.drop_table('cash_registers')
     op.execute("DROP TYPE IF EXISTS cashregisterstatus")
     op.execute("DROP TYPE IF EXISTS cashmovementtype")
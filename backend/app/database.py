@@ -1,20 +1,27 @@
 """
 Configuración de la base de datos PostgreSQL con SQLAlchemy async.
 """
+from collections.abc import AsyncIterator
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
-from app.config import get_settings
-
-settings = get_settings()
+from app.config import SETTINGS
 
 # Engine async con asyncpg
 engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_size=5,
-    max_overflow=10,
+    SETTINGS.DATABASE_URL,
+    echo=SETTINGS.DEBUG,
+    pool_size=SETTINGS.DB_POOL_SIZE,
+    max_overflow=SETTINGS.DB_MAX_OVERFLOW,
     pool_pre_ping=True,
+    pool_recycle=SETTINGS.DB_POOL_RECYCLE,
+    connect_args={
+        # Cache de prepared statements: del driver asyncpg y del dialecto SQLAlchemy
+        "statement_cache_size": SETTINGS.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": SETTINGS.DB_STATEMENT_CACHE_SIZE,
+        "server_settings": {"jit": "on" if SETTINGS.DB_JIT else "off"},
+    },
 )
 
 # Session factory
@@ -33,16 +40,14 @@ class Base(DeclarativeBase):
     pass
 
 
-async def get_db() -> AsyncSession:
+async def get_db() -> AsyncIterator[AsyncSession]:
     """
     Dependency para obtener una sesión de base de datos.
     Se usa con Depends() en los endpoints.
+    El context manager de la sesión la cierra al terminar el request.
     """
     async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 
 async def init_db() -> None:
@@ -2,29 +2,36 @@
 OctopusTrack API - Sistema ERP para Sanitarios, Ferreterías y Corralones.
 Punto de entrada de la aplicación FastAPI.
 """
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
-from app.config import get_settings
+from app.config import SETTINGS
 from app.database import close_db
-from app.routers import auth, categories, clients, products, suppliers, dashboard, pdf_test, vouchers, arca, business, payment_methods, price_update_drafts, cash, purchase_orders
+from app.routers import auth, categories, clients, products, suppliers, dashboard, vouchers, arca, business, payment_methods, price_update_drafts, cash, purchase_orders
 
-settings = get_settings()
+
+# Soporta desarrollo local con localhost/127.0.0.1 en cualquier puerto.
+# CORSMiddleware compila el patrón una sola vez al instanciarse.
+LOCAL_ORIGIN_REGEX = r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$"
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Maneja el ciclo de vida de la aplicación."""
-    # Startup
+    # Startup: log de configuración CORS para debugging
+    logger = logging.getLogger("uvicorn")
+    logger.info(f"CORS Origins configurados: {SETTINGS.CORS_ORIGINS}")
     yield
     # Shutdown
     await close_db()
 
 
 app = FastAPI(
-    title=settings.APP_NAME,
+    title=SETTINGS.APP_NAME,
     description="Sistema ERP para gestión comercial de sanitarios, ferreterías y corralones",
     version="1.0.0",
     lifespan=lifespan,
@@ -33,13 +40,10 @@ app = FastAPI(
 )
 
 
-# Logging de configuración CORS en startup
-@app.on_event("startup")
-async def log_cors_config():
-    """Log CORS configuration on startup for debugging."""
-    import logging
-    logger = logging.getLogger("uvicorn")
-    logger.info(f"CORS Origins configurados: {settings.CORS_ORIGINS}")
+# Compresión de respuestas: los listados JSON (movimientos de caja, historial,
+# comprobantes) se achican ~80%. Solo por encima de 1 KB y con nivel 5: casi
+# la misma relación que 9 con bastante menos CPU por respuesta.
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
 
 
 # CORS Middleware
@@ -47,9 +51,9 @@ async def log_cors_config():
 # Este debe ser el ÚLTIMO add_middleware para ejecutarse PRIMERO.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    # Soporta desarrollo local con localhost/127.0.0.1 en cualquier puerto
-    allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$",
+    # frozenset: búsqueda O(1) del Origin en cada request
+    allow_origins=SETTINGS.CORS_ORIGINS,
+    allow_origin_regex=LOCAL_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -60,19 +64,29 @@ app.add_middleware(
 # Routers
 # Auth router se monta sin prefijo /api/v1 para coincidir con Google OAuth callback
 app.include_router(auth.router)
-app.include_router(products.router, prefix=settings.API_V1_PREFIX)
-app.include_router(clients.router, prefix=settings.API_V1_PREFIX)
-app.include_router(suppliers.router, prefix=settings.API_V1_PREFIX)
-app.include_router(categories.router, prefix=settings.API_V1_PREFIX)
-app.include_router(dashboard.router, prefix=settings.API_V1_PREFIX)
-app.include_router(pdf_test.router, prefix=settings.API_V1_PREFIX)
-app.include_router(vouchers.router, prefix=settings.API_V1_PREFIX)
-app.include_router(arca.router, prefix=settings.API_V1_PREFIX)
-app.include_router(business.router, prefix=settings.API_V1_PREFIX)
-app.include_router(payment_methods.router, prefix=settings.API_V1_PREFIX)
-app.include_router(price_update_drafts.router, prefix=settings.API_V1_PREFIX)
-app.include_router(cash.router, prefix=settings.API_V1_PREFIX)
-app.include_router(purchase_orders.router, prefix=settings.API_V1_PREFIX)
+
+API_V1_ROUTERS = (
+    products,
+    clients,
+    suppliers,
+    categories,
+    dashboard,
+    vouchers,
+    arca,
+    business,
+    payment_methods,
+    price_update_drafts,
+    cash,
+    purchase_orders,
+)
+for module in API_V1_ROUTERS:
+    app.include_router(module.router, prefix=SETTINGS.API_V1_PREFIX)
+
+# Endpoint de prueba de PDF (sin autenticación): solo en modo DEBUG
+if SETTINGS.DEBUG:
+    from app.routers import pdf_test
+
+    app.include_router(pdf_test.router, prefix=SETTINGS.API_V1_PREFIX)
 
 
 @app.get("/health", tags=["Health"])
@@ -80,7 +94,7 @@ async def health_check():
     """Endpoint de salud para verificar que la API está funcionando."""
     return {
         "status": "healthy",
-        "app": settings.APP_NAME,
+        "app": SETTINGS.APP_NAME,
         "version": "1.0.0",
     }
 
@@ -89,7 +103,7 @@ async def health_check():
 async def root():
     """Endpoint raíz con información básica de la API."""
     return {
-        "message": f"Bienvenido a {settings.APP_NAME} API",
+        "message": f"Bienvenido a {SETTINGS.APP_NAME} API",
         "docs": "/docs",
         "health": "/health",
     }
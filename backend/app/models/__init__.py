@@ -18,6 +18,7 @@ from app.models.supplier_category_discount import SupplierCategoryDiscount
 from app.models.user import User
 from app.models.voucher import Voucher, VoucherStatus, VoucherType
 from app.models.voucher_item import VoucherItem
+from app.models.voucher_counter import CounterType, VoucherCounter
 from app.models.cash_register import (
     CashRegister,
     CashMovement,
@@ -48,6 +49,8 @@ __all__ = [
     "VoucherType",
     "VoucherStatus",
     "VoucherItem",
+    "VoucherCounter",
+    "CounterType",
     # Pagos y cuenta corriente
     "Payment",
     "PaymentMethod",
@@ -2,58 +2,99 @@
 Modelo base con campos comunes para todos los modelos.
 Implementa soft delete y timestamps automáticos.
 """
+import os
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
 
 
-class BaseModel(Base):
+def uuid7() -> uuid.UUID:
     """
-    Modelo abstracto base que proporciona:
-    - id: UUID como clave primaria
+    Genera un UUID versión 7 (RFC 9562): 48 bits de timestamp en ms + 74 bits aleatorios.
+
+    Al ser ordenado por tiempo, los INSERT agregan al final del índice de la
+    clave primaria en lugar de caer en una hoja al azar del B-tree.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # versión
+    value |= ((rand >> 62) & 0xFFF) << 64  # rand_a (12 bits)
+    value |= 0b10 << 62  # variante RFC 9562
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b (62 bits)
+    return uuid.UUID(int=value)
+
+
+def utcnow() -> datetime:
+    """Fecha y hora actual en UTC, con zona horaria (para columnas TIMESTAMPTZ)."""
+    return datetime.now(timezone.utc)
+
+
+class TimestampMixin:
+    """
+    Timestamps comunes, generados por la base (TIMESTAMPTZ):
     - created_at: Timestamp de creación
     - updated_at: Timestamp de última actualización
     - deleted_at: Timestamp de eliminación (soft delete)
     """
 
-    __abstract__ = True
-
-    id = Column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid.uuid4,
-        index=True,
-    )
-    created_at = Column(
-        DateTime,
-        default=datetime.utcnow,
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
         nullable=False,
     )
-    updated_at = Column(
-        DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
-    deleted_at = Column(
-        DateTime,
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
         nullable=True,
         default=None,
     )
 
+
+class BaseModel(TimestampMixin, Base):
+    """
+    Modelo abstracto base que proporciona:
+    - id: UUID como clave primaria
+    - created_at, updated_at, deleted_at (TimestampMixin)
+    """
+
+    __abstract__ = True
+    # Traer con RETURNING los valores que genera la base (created_at, updated_at)
+    # en el mismo INSERT/UPDATE: con expire_on_commit=False no hay lazy load posible
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid7,
+    )
+
     @property
     def is_deleted(self) -> bool:
         """Indica si el registro está eliminado (soft delete)."""
         return self.deleted_at is not None
 
     def soft_delete(self) -> None:
-        """Marca el registro como eliminado."""
-        self.deleted_at = datetime.utcnow()
+        """Marca el registro como eliminado (la fecha la pone la base al hacer flush)."""
+        self.deleted_at = func.now()
 
     def restore(self) -> None:
         """Restaura un registro eliminado."""
         self.deleted_at = None
+
+    def __repr__(self) -> str:
+        # Solo la identidad, leída de __dict__: nunca dispara un lazy load
+        # (en async fallaría) ni formatea atributos en logs y cascadas
+        return f"<{type(self).__name__} {self.__dict__.get('id')}>"
@@ -2,11 +2,16 @@
 Modelo del Negocio/Empresa.
 Contiene los datos del comercio para el membrete y facturación.
 """
-from sqlalchemy import Column, ForeignKey, String, Text
+from sqlalchemy import Column, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from app.models.base import BaseModel
+from app.models.types import Utf8Bytes
+
+# Grupo de columnas diferidas con credenciales ARCA/AFIP. Solo las usa la
+# emisión electrónica: cargarlas con options(undefer_group(AFIP_CREDENTIALS))
+AFIP_CREDENTIALS = "afip_credentials"
 
 
 class Business(BaseModel):
@@ -16,12 +21,19 @@ class Business(BaseModel):
     """
 
     __tablename__ = "businesses"
+    __table_args__ = (
+        # Negocios activos del usuario (get_current_business)
+        Index(
+            "ix_businesses_active",
+            "owner_id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     owner_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id"),
         nullable=False,
-        index=True,
     )
 
     # Datos del negocio
@@ -43,32 +55,35 @@ class Business(BaseModel):
 
     # Configuración de facturación
     sale_point = Column(String(5), default="0001")  # Punto de venta ARCA
-    last_quotation_number = Column(String(8), default="00000000")
-    last_receipt_number = Column(String(8), default="00000000")
-    last_invoice_a_number = Column(String(8), default="00000000")
-    last_invoice_b_number = Column(String(8), default="00000000")
-    last_invoice_c_number = Column(String(8), default="00000000")
-    last_purchase_order_number = Column(String(8), default="00000000")
+    # La numeración correlativa vive en voucher_counters (VoucherCounter)
     
     # Configuración ARCA/AFIP
-    arca_token = Column(Text, nullable=True)  # Token del WSAA
-    arca_sign = Column(Text, nullable=True)  # Sign del WSAA
+    arca_token = deferred(
+        Column(Utf8Bytes(), nullable=True), group=AFIP_CREDENTIALS, raiseload=True
+    )  # Token del WSAA
+    arca_sign = deferred(
+        Column(Utf8Bytes(), nullable=True), group=AFIP_CREDENTIALS, raiseload=True
+    )  # Sign del WSAA
     arca_token_expiration = Column(String(30), nullable=True)  # Fecha de expiración
     arca_cuit_representante = Column(String(13), nullable=True)  # CUIT representante
     arca_environment = Column(String(20), default="testing")  # testing o production
     
     # Configuración Afip SDK (https://afipsdk.com)
-    afipsdk_access_token = Column(String(500), nullable=True)
-    afip_cert = Column(Text, nullable=True)  # Contenido del certificado PEM
-    afip_key = Column(Text, nullable=True)   # Contenido de la clave privada PEM
+    afipsdk_access_token = deferred(
+        Column(String(500), nullable=True), group=AFIP_CREDENTIALS, raiseload=True
+    )
+    afip_cert = deferred(
+        Column(Utf8Bytes(), nullable=True), group=AFIP_CREDENTIALS, raiseload=True
+    )  # Contenido del certificado PEM
+    afip_key = deferred(
+        Column(Utf8Bytes(), nullable=True), group=AFIP_CREDENTIALS, raiseload=True
+    )  # Contenido de la clave privada PEM
 
     # Relaciones
     owner = relationship("User", back_populates="businesses")
-    products = relationship("Product", back_populates="business", lazy="dynamic")
-    clients = relationship("Client", back_populates="business", lazy="dynamic")
-    suppliers = relationship("Supplier", back_populates="business", lazy="dynamic")
-    categories = relationship("Category", back_populates="business", lazy="dynamic")
-    payment_methods_catalog = relationship("PaymentMethodCatalog", back_populates="business", lazy="dynamic")
-
-    def __repr__(self) -> str:
-        return f"<Business {self.name}>"
+    # Colecciones grandes: no se cargan implícitamente, consultar con select() paginado
+    products = relationship("Product", back_populates="business", lazy="raise_on_sql")
+    clients = relationship("Client", back_populates="business", lazy="raise_on_sql")
+    suppliers = relationship("Supplier", back_populates="business", lazy="raise_on_sql")
+    categories = relationship("Category", back_populates="business", lazy="raise_on_sql")
+    payment_methods_catalog = relationship("PaymentMethodCatalog", back_populates="business", lazy="raise_on_sql")
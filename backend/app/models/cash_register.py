@@ -6,19 +6,22 @@ CashMovement: cada movimiento individual dentro de la caja.
 import enum
 
 from sqlalchemy import (
+    CheckConstraint,
     Column,
     DateTime,
     Enum,
     ForeignKey,
-    Numeric,
+    Index,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
+from app.models.types import Money, SmallIntEnum
 
 
 class CashRegisterStatus(str, enum.Enum):
@@ -44,6 +47,23 @@ class CashPaymentMethod(str, enum.Enum):
     OTHER = "OTHER"
 
 
+# Códigos SMALLINT persistidos en cash_movements (estables, no renumerar)
+CASH_MOVEMENT_TYPE_CODES = {
+    CashMovementType.SALE: 1,
+    CashMovementType.PAYMENT_RECEIVED: 2,
+    CashMovementType.INCOME: 3,
+    CashMovementType.EXPENSE: 4,
+}
+
+CASH_PAYMENT_METHOD_CODES = {
+    CashPaymentMethod.CASH: 1,
+    CashPaymentMethod.CARD: 2,
+    CashPaymentMethod.TRANSFER: 3,
+    CashPaymentMethod.CHECK: 4,
+    CashPaymentMethod.OTHER: 5,
+}
+
+
 class CashRegister(BaseModel):
     """
     Caja diaria del negocio.
@@ -51,12 +71,26 @@ class CashRegister(BaseModel):
     El estado EXPIRED se calcula en runtime: status=OPEN y opened_at < NOW()-24hs.
     """
     __tablename__ = "cash_registers"
+    __table_args__ = (
+        # Cajas activas del negocio
+        Index(
+            "ix_cash_registers_active",
+            "business_id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Una sola caja abierta por negocio
+        Index(
+            "uq_cash_registers_business_open",
+            "business_id",
+            unique=True,
+            postgresql_where=text("status = 'OPEN' AND deleted_at IS NULL"),
+        ),
+    )
 
     business_id = Column(
         UUID(as_uuid=True),
         ForeignKey("businesses.id"),
         nullable=False,
-        index=True,
     )
     opened_by = Column(
         UUID(as_uuid=True),
@@ -69,19 +103,25 @@ class CashRegister(BaseModel):
         nullable=True,
     )
     status = Column(
-        Enum(CashRegisterStatus),
+        Enum(
+            CashRegisterStatus,
+            native_enum=False,
+            length=20,
+            create_constraint=True,
+            name="ck_cash_registers_status",
+        ),
         nullable=False,
         default=CashRegisterStatus.OPEN,
     )
 
     # Apertura
-    opening_amount = Column(Numeric(12, 2), nullable=False, default=0)
-    opened_at = Column(DateTime, nullable=False)
+    opening_amount = Column(Money(), nullable=False, default=0)
+    opened_at = Column(DateTime(timezone=True), nullable=False)
 
     # Cierre
-    closed_at = Column(DateTime, nullable=True)
-    counted_cash = Column(Numeric(12, 2), nullable=True)   # Efectivo físico contado
-    difference = Column(Numeric(12, 2), nullable=True)     # counted_cash - esperado efectivo; negativo=faltante
+    closed_at = Column(DateTime(timezone=True), nullable=True)
+    counted_cash = Column(Money(), nullable=True)   # Efectivo físico contado
+    difference = Column(Money(), nullable=True)     # counted_cash - esperado efectivo; negativo=faltante
     difference_reason = Column(Text, nullable=True)        # Obligatorio si difference != 0
     closing_pdf_path = Column(String(500), nullable=True)  # Ruta del PDF generado
 
@@ -95,9 +135,6 @@ class CashRegister(BaseModel):
         order_by="CashMovement.created_at",
     )
 
-    def __repr__(self) -> str:
-        return f"<CashRegister {self.opened_at.date()} status={self.status}>"
-
 
 class CashMovement(BaseModel):
     """
@@ -106,22 +143,34 @@ class CashMovement(BaseModel):
     Los de tipo INCOME y EXPENSE los crea el operador manualmente.
     """
     __tablename__ = "cash_movements"
+    __table_args__ = (
+        # Movimientos de una caja en orden cronológico (CashRegister.movements);
+        # también cubre las búsquedas por cash_register_id solo. INCLUDE permite
+        # sumar por tipo/método (resumen de caja) con un Index Only Scan
+        Index(
+            "ix_cash_movements_register_covering",
+            "cash_register_id",
+            "created_at",
+            postgresql_include=["type", "payment_method", "amount"],
+        ),
+        CheckConstraint("type BETWEEN 1 AND 4", name="ck_cash_movements_type"),
+        CheckConstraint("payment_method BETWEEN 1 AND 5", name="ck_cash_movements_payment_method"),
+    )
 
     cash_register_id = Column(
         UUID(as_uuid=True),
         ForeignKey("cash_registers.id"),
         nullable=False,
-        index=True,
     )
     type = Column(
-        Enum(CashMovementType),
+        SmallIntEnum(CashMovementType, CASH_MOVEMENT_TYPE_CODES),
         nullable=False,
     )
     payment_method = Column(
-        Enum(CashPaymentMethod),
+        SmallIntEnum(CashPaymentMethod, CASH_PAYMENT_METHOD_CODES),
         nullable=False,
     )
-    amount = Column(Numeric(12, 2), nullable=False)  # Siempre positivo
+    amount = Column(Money(), nullable=False)  # Siempre positivo
     description = Column(String(255), nullable=False)
 
     # Solo para movimientos automáticos
@@ -140,6 +189,3 @@ class CashMovement(BaseModel):
     cash_register = relationship("CashRegister", back_populates="movements")
     voucher = relationship("Voucher")
     user = relationship("User")
-
-    def __repr__(self) -> str:
-        return f"<CashMovement {self.type} {self.payment_method} ${self.amount}>"
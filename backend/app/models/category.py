@@ -2,7 +2,7 @@
 Modelo de Categoría de productos.
 Soporta categorías jerárquicas (padre-hijo).
 """
-from sqlalchemy import Column, ForeignKey, String, Text
+from sqlalchemy import Column, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -16,12 +16,20 @@ class Category(BaseModel):
     """
 
     __tablename__ = "categories"
+    __table_args__ = (
+        # Listado de categorías activas del negocio ordenado por nombre
+        Index(
+            "ix_categories_active",
+            "business_id",
+            "name",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     business_id = Column(
         UUID(as_uuid=True),
         ForeignKey("businesses.id"),
         nullable=False,
-        index=True,
     )
     parent_id = Column(
         UUID(as_uuid=True),
@@ -40,7 +48,4 @@ class Category(BaseModel):
         remote_side="Category.id",
         backref="subcategories",
     )
-    products = relationship("Product", back_populates="category", lazy="dynamic")
-
-    def __repr__(self) -> str:
-        return f"<Category {self.name}>"
+    products = relationship("Product", back_populates="category", lazy="raise_on_sql")
@@ -2,11 +2,18 @@
 Modelo de Cliente.
 Almacena información de clientes y su cuenta corriente.
 """
-from sqlalchemy import Column, ForeignKey, Numeric, String, Text
+from functools import cached_property
+
+from sqlalchemy import Column, ForeignKey, Index, String, Text, event, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 
 from app.models.base import BaseModel
+from app.models.types import Money
+
+
+# Campos que componen Client.full_address
+ADDRESS_FIELDS = ("street", "street_number", "floor", "apartment", "city", "province", "postal_code")
 
 
 class Client(BaseModel):
@@ -16,18 +23,34 @@ class Client(BaseModel):
     """
 
     __tablename__ = "clients"
+    __table_args__ = (
+        # Listado de clientes activos del negocio ordenado por nombre
+        Index(
+            "ix_clients_active",
+            "business_id",
+            "name",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Documento único por negocio entre clientes no eliminados
+        Index(
+            "uq_clients_business_document",
+            "business_id",
+            "document_number",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     business_id = Column(
         UUID(as_uuid=True),
         ForeignKey("businesses.id"),
         nullable=False,
-        index=True,
     )
 
     # Datos del cliente
     name = Column(String(255), nullable=False, index=True)  # Razón social / Nombre
     document_type = Column(String(10), nullable=False)  # CUIT, CUIL, DNI
-    document_number = Column(String(20), nullable=False, index=True)
+    document_number = Column(String(20), nullable=False)
     tax_condition = Column(String(50), nullable=False)  # RI, Monotributista, CF, Exento
 
     # Dirección
@@ -45,35 +68,42 @@ class Client(BaseModel):
     notes = Column(Text, nullable=True)
 
     # Cuenta corriente (saldo cacheado, se actualiza con movimientos)
-    current_balance = Column(Numeric(12, 2), default=0, nullable=False)
-    credit_limit = Column(Numeric(12, 2), default=0, nullable=True)
+    current_balance = Column(Money(), default=0, nullable=False)
+    credit_limit = Column(Money(), default=0, nullable=True)
 
     # Relaciones
     business = relationship("Business", back_populates="clients")
-    vouchers = relationship("Voucher", back_populates="client", lazy="dynamic")
-    account_movements = relationship("ClientAccount", back_populates="client", lazy="dynamic")
-    payments = relationship("Payment", back_populates="client", lazy="dynamic")
+    # Colecciones grandes: no se cargan implícitamente, consultar con select() paginado
+    vouchers = relationship("Voucher", back_populates="client", lazy="raise_on_sql")
+    account_movements = relationship("ClientAccount", back_populates="client", lazy="raise_on_sql")
+    payments = relationship("Payment", back_populates="client", lazy="raise_on_sql")
 
-    @property
+    @cached_property
     def full_address(self) -> str:
-        """Retorna la dirección completa formateada."""
-        parts = []
+        """
+        Retorna la dirección completa formateada.
+
+        Se calcula una vez por instancia; se invalida al modificar un campo
+        de la dirección o al recargar/expirar la fila.
+        """
+        street = None
         if self.street:
-            addr = self.street
-            if self.street_number:
-                addr += f" {self.street_number}"
+            street = " ".join(filter(None, (self.street, self.street_number)))
             if self.floor:
-                addr += f", Piso {self.floor}"
+                street = f"{street}, Piso {self.floor}"
             if self.apartment:
-                addr += f", Depto {self.apartment}"
-            parts.append(addr)
-        if self.city:
-            parts.append(self.city)
-        if self.province:
-            parts.append(self.province)
-        if self.postal_code:
-            parts.append(f"CP {self.postal_code}")
-        return ", ".join(parts)
-
-    def __repr__(self) -> str:
-        return f"<Client {self.name}>"
+                street = f"{street}, Depto {self.apartment}"
+        postal_code = f"CP {self.postal_code}" if self.postal_code else None
+        return ", ".join(filter(None, (street, self.city, self.province, postal_code)))
+
+    @validates(*ADDRESS_FIELDS)
+    def _invalidate_full_address(self, key: str, value):
+        self.__dict__.pop("full_address", None)
+        return value
+
+
+@event.listens_for(Client, "refresh")
+@event.listens_for(Client, "expire")
+def _reset_full_address(target: Client, *args) -> None:
+    """Descarta la dirección cacheada cuando la fila se recarga o expira."""
+    target.__dict__.pop("full_address", None)
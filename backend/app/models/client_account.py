@@ -4,11 +4,12 @@ Registra todos los movimientos que afectan el saldo.
 """
 import enum
 
-from sqlalchemy import Column, Date, Enum, ForeignKey, Numeric, String
+from sqlalchemy import CheckConstraint, Column, Date, ForeignKey, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
+from app.models.types import Money, SmallIntEnum
 
 
 class MovementType(str, enum.Enum):
@@ -22,6 +23,17 @@ class MovementType(str, enum.Enum):
     ADJUSTMENT_CREDIT = "adjustment_credit"  # Ajuste crédito (disminuye deuda)
 
 
+# Códigos SMALLINT persistidos en client_accounts.movement_type (estables, no renumerar)
+MOVEMENT_TYPE_CODES = {
+    MovementType.INVOICE: 1,
+    MovementType.PAYMENT: 2,
+    MovementType.CREDIT_NOTE: 3,
+    MovementType.DEBIT_NOTE: 4,
+    MovementType.ADJUSTMENT_DEBIT: 5,
+    MovementType.ADJUSTMENT_CREDIT: 6,
+}
+
+
 class ClientAccount(BaseModel):
     """
     Movimiento en la cuenta corriente de un cliente.
@@ -29,6 +41,9 @@ class ClientAccount(BaseModel):
     """
 
     __tablename__ = "client_accounts"
+    __table_args__ = (
+        CheckConstraint("movement_type BETWEEN 1 AND 6", name="ck_client_accounts_movement_type"),
+    )
 
     client_id = Column(
         UUID(as_uuid=True),
@@ -49,18 +64,15 @@ class ClientAccount(BaseModel):
 
     # Datos del movimiento
     date = Column(Date, nullable=False, index=True)
-    movement_type = Column(Enum(MovementType), nullable=False)
+    movement_type = Column(SmallIntEnum(MovementType, MOVEMENT_TYPE_CODES), nullable=False)
     description = Column(String(255), nullable=False)
 
     # Montos
-    debit = Column(Numeric(12, 2), default=0, nullable=False)  # Aumenta deuda
-    credit = Column(Numeric(12, 2), default=0, nullable=False)  # Disminuye deuda
-    balance = Column(Numeric(12, 2), nullable=False)  # Saldo después del movimiento
+    debit = Column(Money(), server_default=text("0"), nullable=False)  # Aumenta deuda
+    credit = Column(Money(), server_default=text("0"), nullable=False)  # Disminuye deuda
+    balance = Column(Money(), nullable=False)  # Saldo después del movimiento
 
     # Relaciones
     client = relationship("Client", back_populates="account_movements")
     voucher = relationship("Voucher")
     payment = relationship("Payment")
-
-    def __repr__(self) -> str:
-        return f"<ClientAccount {self.date}: {self.movement_type.value} D:{self.debit} C:{self.credit}>"
@@ -4,11 +4,12 @@ Registra los pagos recibidos de clientes.
 """
 import enum
 
-from sqlalchemy import Column, Date, Enum, ForeignKey, Numeric, String, Text
+from sqlalchemy import CheckConstraint, Column, Date, ForeignKey, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
+from app.models.types import Money, SmallIntEnum
 
 
 class PaymentMethod(str, enum.Enum):
@@ -23,6 +24,18 @@ class PaymentMethod(str, enum.Enum):
     OTHER = "other"  # Otro
 
 
+# Códigos SMALLINT persistidos en payments.method (estables, no renumerar)
+PAYMENT_METHOD_CODES = {
+    PaymentMethod.CASH: 1,
+    PaymentMethod.TRANSFER: 2,
+    PaymentMethod.CHECK: 3,
+    PaymentMethod.CREDIT_CARD: 4,
+    PaymentMethod.DEBIT_CARD: 5,
+    PaymentMethod.MERCADOPAGO: 6,
+    PaymentMethod.OTHER: 7,
+}
+
+
 class Payment(BaseModel):
     """
     Pago recibido de un cliente.
@@ -30,6 +43,9 @@ class Payment(BaseModel):
     """
 
     __tablename__ = "payments"
+    __table_args__ = (
+        CheckConstraint("method BETWEEN 1 AND 7", name="ck_payments_method"),
+    )
 
     business_id = Column(
         UUID(as_uuid=True),
@@ -57,8 +73,8 @@ class Payment(BaseModel):
 
     # Datos del pago
     date = Column(Date, nullable=False)
-    amount = Column(Numeric(12, 2), nullable=False)
-    method = Column(Enum(PaymentMethod), nullable=False)
+    amount = Column(Money(), nullable=False)
+    method = Column(SmallIntEnum(PaymentMethod, PAYMENT_METHOD_CODES), nullable=False)
 
     # Referencia (número de cheque, transferencia, etc.)
     reference = Column(String(100), nullable=True)
@@ -73,6 +89,3 @@ class Payment(BaseModel):
     business = relationship("Business")
     client = relationship("Client", back_populates="payments")
     voucher = relationship("Voucher", back_populates="payments")
-
-    def __repr__(self) -> str:
-        return f"<Payment {self.date}: ${self.amount} ({self.method.value})>"
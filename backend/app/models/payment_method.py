@@ -1,7 +1,7 @@
 """
 Modelo de Método de Pago.
 """
-from sqlalchemy import Column, String, Boolean, ForeignKey
+from sqlalchemy import Column, String, Boolean, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
@@ -26,5 +26,21 @@ class PaymentMethodCatalog(BaseModel):
     business = relationship("Business", back_populates="payment_methods_catalog")
     voucher_payments = relationship("VoucherPayment", back_populates="payment_method_catalog", cascade="all, delete-orphan")
 
-    def __repr__(self):
-        return f"<PaymentMethodCatalog {self.code}: {self.name}>"
+    # Constraints
+    __table_args__ = (
+        # Cubre el listado por negocio ordenado por nombre (Index Only Scan)
+        Index(
+            "ix_payment_methods_business",
+            "business_id",
+            "name",
+            postgresql_include=["id", "code", "is_active", "requires_reference"],
+        ),
+        # Código único por negocio solo entre métodos no eliminados
+        Index(
+            "uq_business_payment_code_live",
+            "business_id",
+            "code",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
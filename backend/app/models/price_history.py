@@ -45,6 +45,3 @@ class PriceHistory(BaseModel):
 
     # Relaciones
     product = relationship("Product", back_populates="price_history")
-
-    def __repr__(self) -> str:
-        return f"<PriceHistory {self.product_id}: {self.old_sale_price} -> {self.new_sale_price}>"
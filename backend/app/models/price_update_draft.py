@@ -4,8 +4,8 @@ Modelo para borradores de actualización masiva de precios.
 Permite al usuario guardar el estado intermedio del modal de edición masiva
 (lista de productos con cambios pendientes) y retomarlo después.
 """
-from sqlalchemy import Column, String, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from app.models.base import BaseModel
 
@@ -25,7 +25,6 @@ class PriceUpdateDraft(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("businesses.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Usuario que creó el borrador
@@ -45,9 +44,26 @@ class PriceUpdateDraft(BaseModel):
     filter_supplier_name = Column(String(255), nullable=True)
     filter_search = Column(String(255), nullable=True)
 
-    # Estado serializado de los productos editados (JSON string)
+    # Estado de los productos editados (JSONB)
     # Contiene array de EditableProduct con todos los campos modificados
-    products_data = Column(Text, nullable=False)
+    products_data = Column(JSONB, nullable=False)
 
     # Cantidad de productos en el borrador (para mostrar sin deserializar)
-    product_count = Column(String(10), nullable=False, default="0")
+    product_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # Borradores activos del negocio, más recientes primero (scan inverso)
+        Index(
+            "ix_price_update_drafts_active",
+            "business_id",
+            "updated_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Búsqueda de borradores que contienen un producto (products_data @> ...)
+        Index(
+            "ix_price_update_drafts_products_data",
+            "products_data",
+            postgresql_using="gin",
+            postgresql_ops={"products_data": "jsonb_path_ops"},
+        ),
+    )
@@ -3,12 +3,59 @@ Modelo de Producto.
 Incluye precios, bonificaciones, stock y cálculo automático de precio final.
 """
 from decimal import Decimal
+from functools import lru_cache
+from typing import Optional, Tuple
 
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, Numeric, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
+from app.models.types import Money, round_cents
+
+
+def _as_decimal(value) -> Decimal:
+    """Convierte a Decimal; los valores leídos de la base ya lo son y se usan tal cual."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+@lru_cache(maxsize=1024)
+def _price_factors(
+    d1: Decimal, d2: Decimal, d3: Decimal, extra_cost: Decimal, iva_rate: Decimal
+) -> Tuple[Decimal, Decimal, Optional[str]]:
+    """
+    Factores de precio neto y de venta para una combinación de bonificaciones.
+
+    Cacheado: en una actualización masiva los productos de un mismo proveedor
+    comparten bonificaciones, cargo extra e IVA, así cada producto solo paga
+    dos multiplicaciones en lugar de recalcular toda la cadena.
+    """
+    net_factor = (1 - d1 / 100) * (1 - d2 / 100) * (1 - d3 / 100) * (1 + extra_cost / 100)
+    sale_factor = net_factor * (1 + iva_rate / 100)
+
+    # Formato de descuento para mostrar
+    discounts = [d for d in (d1, d2, d3) if d > 0]
+    discount_display = "+".join([str(int(d)) for d in discounts]) if discounts else None
+
+    return net_factor, sale_factor, discount_display
+
+
+def compute_prices(
+    list_price: Decimal,
+    d1: Decimal,
+    d2: Decimal,
+    d3: Decimal,
+    extra_cost: Decimal,
+    iva_rate: Decimal,
+) -> Tuple[Decimal, Decimal, Optional[str]]:
+    """
+    Calcula precio neto, precio de venta y formato de descuento.
+    precio_con_bonif = precio_lista × (1 - bonif1/100) × (1 - bonif2/100) × (1 - bonif3/100)
+    precio_neto = precio_con_bonif × (1 + cargo_extra/100)
+    precio_venta = precio_neto × (1 + IVA/100)
+    """
+    net_factor, sale_factor, discount_display = _price_factors(d1, d2, d3, extra_cost, iva_rate)
+    return round_cents(list_price * net_factor), round_cents(list_price * sale_factor), discount_display
 
 
 class Product(BaseModel):
@@ -18,12 +65,28 @@ class Product(BaseModel):
     """
 
     __tablename__ = "products"
+    __table_args__ = (
+        # Listado de productos activos del negocio ordenado por descripción
+        Index(
+            "ix_products_active",
+            "business_id",
+            "description",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Código único por negocio entre productos no eliminados
+        Index(
+            "uq_products_business_code",
+            "business_id",
+            "code",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     business_id = Column(
         UUID(as_uuid=True),
         ForeignKey("businesses.id"),
         nullable=False,
-        index=True,
     )
     category_id = Column(
         UUID(as_uuid=True),
@@ -39,7 +102,7 @@ class Product(BaseModel):
     )
 
     # Códigos
-    code = Column(String(50), nullable=False, index=True)  # Código interno del negocio
+    code = Column(String(50), nullable=False)  # Código interno del negocio (único por negocio)
     supplier_code = Column(String(50), nullable=True, index=True)  # Código del proveedor
 
     # Descripción
@@ -47,8 +110,8 @@ class Product(BaseModel):
     details = Column(Text, nullable=True)  # Descripción extendida
 
     # Precios base
-    cost_price = Column(Numeric(12, 2), default=0, nullable=False)  # Precio de costo
-    list_price = Column(Numeric(12, 2), default=0, nullable=False)  # Precio de lista
+    cost_price = Column(Money(), default=0, nullable=False)  # Precio de costo
+    list_price = Column(Money(), default=0, nullable=False)  # Precio de lista
 
     # Bonificaciones en cadena
     discount_1 = Column(Numeric(5, 2), default=0, nullable=False)
@@ -60,8 +123,8 @@ class Product(BaseModel):
     extra_cost = Column(Numeric(5, 2), default=0, nullable=False)  # Porcentaje extra
 
     # Precios calculados
-    net_price = Column(Numeric(12, 2), default=0, nullable=False)  # Precio sin IVA
-    sale_price = Column(Numeric(12, 2), default=0, nullable=False)  # Precio final
+    net_price = Column(Money(), default=0, nullable=False)  # Precio sin IVA
+    sale_price = Column(Money(), default=0, nullable=False)  # Precio final
 
     # IVA
     iva_rate = Column(Numeric(5, 2), default=21.00, nullable=False)  # 10.5, 21, 27, 0
@@ -77,7 +140,7 @@ class Product(BaseModel):
     business = relationship("Business", back_populates="products")
     category = relationship("Category", back_populates="products")
     supplier = relationship("Supplier", back_populates="products")
-    price_history = relationship("PriceHistory", back_populates="product", lazy="dynamic")
+    price_history = relationship("PriceHistory", back_populates="product", lazy="raise_on_sql")
 
     def calculate_prices(self) -> None:
         """
@@ -85,33 +148,16 @@ class Product(BaseModel):
         precio_con_bonif = precio_lista × (1 - bonif1/100) × (1 - bonif2/100) × (1 - bonif3/100)
         precio_venta = precio_con_bonif × (1 + IVA/100)
         """
-        list_price = Decimal(str(self.list_price or 0))
-        d1 = Decimal(str(self.discount_1 or 0))
-        d2 = Decimal(str(self.discount_2 or 0))
-        d3 = Decimal(str(self.discount_3 or 0))
-        extra_cost = Decimal(str(self.extra_cost or 0))
-        iva_rate = Decimal(str(self.iva_rate or 21))
-
-        # Precio con bonificaciones (neto base)
-        net_base = list_price * (1 - d1 / 100) * (1 - d2 / 100) * (1 - d3 / 100)
-        
-        # Aplicar cargo extra sobre el neto
-        net_with_extra = net_base * (1 + extra_cost / 100)
-
-        # Precio final con IVA
-        sale = net_with_extra * (1 + iva_rate / 100)
-
-        self.net_price = round(net_with_extra, 2)
-        self.sale_price = round(sale, 2)
-
-        # Formato de descuento para mostrar
-        discounts = [d for d in [d1, d2, d3] if d > 0]
-        self.discount_display = "+".join([str(int(d)) for d in discounts]) if discounts else None
+        self.net_price, self.sale_price, self.discount_display = compute_prices(
+            _as_decimal(self.list_price or 0),
+            _as_decimal(self.discount_1 or 0),
+            _as_decimal(self.discount_2 or 0),
+            _as_decimal(self.discount_3 or 0),
+            _as_decimal(self.extra_cost or 0),
+            _as_decimal(self.iva_rate or 21),
+        )
 
     @property
     def is_low_stock(self) -> bool:
         """Indica si el stock está por debajo del mínimo."""
         return self.current_stock <= self.minimum_stock
-
-    def __repr__(self) -> str:
-        return f"<Product {self.code}: {self.description[:30]}>"
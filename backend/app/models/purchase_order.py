@@ -3,12 +3,26 @@ Modelos de Orden de Pedido y sus ítems.
 Registra las órdenes generadas a proveedores tras un control de inventario físico.
 """
 import enum
+from decimal import Decimal
+from uuid import UUID as PyUUID
 
-from sqlalchemy import Column, Enum, ForeignKey, Integer, Numeric, String, Text, DateTime
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Integer, Numeric, String, Text, DateTime, Index, func, select, text, update
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
+from app.models.types import Money, SmallIntEnum, round_cents
+
+_ZERO = Decimal(0)
+_HUNDRED = Decimal(100)
+
+
+def _as_decimal(value) -> Decimal:
+    """Convierte a Decimal; los valores leídos de la base (Numeric, Money) ya lo son y se usan tal cual."""
+    if value is None:
+        return _ZERO
+    return value if isinstance(value, Decimal) else Decimal(str(value))
 
 
 class PurchaseOrderStatus(str, enum.Enum):
@@ -18,6 +32,12 @@ class PurchaseOrderStatus(str, enum.Enum):
     CONFIRMED = "confirmed"  # Confirmada — solo lectura
 
 
+# Códigos SMALLINT persistidos en purchase_orders.status (estables, no renumerar)
+PURCHASE_ORDER_STATUS_CODES = {
+    PurchaseOrderStatus.DRAFT: 1,
+    PurchaseOrderStatus.CONFIRMED: 2,
+}
+
 class PurchaseOrder(BaseModel):
     """
     Orden de pedido a un proveedor.
@@ -26,12 +46,21 @@ class PurchaseOrder(BaseModel):
     """
 
     __tablename__ = "purchase_orders"
+    __table_args__ = (
+        # Órdenes activas del negocio, más recientes primero (scan inverso)
+        Index(
+            "ix_purchase_orders_active",
+            "business_id",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        CheckConstraint("status BETWEEN 1 AND 2", name="ck_purchase_orders_status"),
+    )
 
     business_id = Column(
         UUID(as_uuid=True),
         ForeignKey("businesses.id"),
         nullable=False,
-        index=True,
     )
     supplier_id = Column(
         UUID(as_uuid=True),
@@ -52,8 +81,8 @@ class PurchaseOrder(BaseModel):
     )
 
     status = Column(
-        Enum(PurchaseOrderStatus),
-        default=PurchaseOrderStatus.DRAFT,
+        SmallIntEnum(PurchaseOrderStatus, PURCHASE_ORDER_STATUS_CODES),
+        server_default=text("1"),  # DRAFT
         nullable=False,
         index=True,
     )
@@ -62,14 +91,14 @@ class PurchaseOrder(BaseModel):
     sale_point = Column(String(4), nullable=False, default="0001")
     number = Column(String(8), nullable=False, default="00000001")
 
-    # Totales calculados
-    subtotal = Column(Numeric(14, 2), default=0, nullable=False)   # Sin IVA
-    total_iva = Column(Numeric(14, 2), default=0, nullable=False)  # IVA total
-    total = Column(Numeric(14, 2), default=0, nullable=False)      # subtotal + IVA
+    # Totales calculados (los completa recalculate_totals_in_db; el INSERT los omite)
+    subtotal = Column(Money(), server_default=text("0"), nullable=False)   # Sin IVA
+    total_iva = Column(Money(), server_default=text("0"), nullable=False)  # IVA total
+    total = Column(Money(), server_default=text("0"), nullable=False)      # subtotal + IVA
 
     notes = Column(Text, nullable=True)
 
-    confirmed_at = Column(DateTime, nullable=True)
+    confirmed_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relaciones
     business = relationship("Business")
@@ -80,6 +109,7 @@ class PurchaseOrder(BaseModel):
         "PurchaseOrderItem",
         back_populates="purchase_order",
         cascade="all, delete-orphan",
+        lazy="selectin",
     )
 
     @property
@@ -89,14 +119,41 @@ class PurchaseOrder(BaseModel):
 
     def recalculate_totals(self) -> None:
         """Recalcula subtotal, total_iva y total a partir de los ítems."""
-        subtotal = sum(item.subtotal or 0 for item in self.items)
-        total_iva = sum(item.iva_amount or 0 for item in self.items)
-        self.subtotal = round(subtotal, 2)
-        self.total_iva = round(total_iva, 2)
-        self.total = round(subtotal + total_iva, 2)
-
-    def __repr__(self) -> str:
-        return f"<PurchaseOrder {self.id} status={self.status}>"
+        subtotal = _ZERO
+        total_iva = _ZERO
+        for item in self.items:
+            subtotal += item.subtotal or _ZERO
+            total_iva += item.iva_amount or _ZERO
+        self.subtotal = round_cents(subtotal)
+        self.total_iva = round_cents(total_iva)
+        self.total = round_cents(subtotal + total_iva)
+
+    @classmethod
+    async def recalculate_totals_in_db(cls, session: AsyncSession, order_id: PyUUID) -> None:
+        """
+        Recalcula subtotal, total_iva y total de la orden sumando sus ítems
+        en la base: un único UPDATE con subconsultas escalares SUM(...) sobre
+        los ítems de la orden, sin cargarlos. Los ítems ya deben estar
+        escritos (flush). No hace commit.
+
+        Los totales por ítem ya están redondeados a 2 decimales, así las
+        sumas dan exactamente lo mismo que recalculate_totals().
+        """
+        def items_sum(column):
+            return (
+                select(func.coalesce(func.sum(column), 0))
+                .where(PurchaseOrderItem.purchase_order_id == order_id)
+                .scalar_subquery()
+            )
+
+        subtotal = items_sum(PurchaseOrderItem.subtotal)
+        total_iva = items_sum(PurchaseOrderItem.iva_amount)
+        await session.execute(
+            update(cls)
+            .where(cls.id == order_id)
+            .values(subtotal=subtotal, total_iva=total_iva, total=subtotal + total_iva)
+            .execution_options(synchronize_session=False)
+        )
 
 
 class PurchaseOrderItem(BaseModel):
@@ -122,41 +179,41 @@ class PurchaseOrderItem(BaseModel):
     )
 
     # Datos del conteo físico
-    system_stock = Column(Integer, default=0, nullable=False)   # Stock del sistema al momento del conteo
+    system_stock = Column(Integer, server_default=text("0"), nullable=False)   # Stock del sistema al momento del conteo
     counted_stock = Column(Integer, nullable=True)              # Stock físico contado por el operador
 
     # Cantidad a pedir
-    quantity_to_order = Column(Integer, default=0, nullable=False)
+    quantity_to_order = Column(Integer, server_default=text("0"), nullable=False)
 
     # Precio de costo unitario (con bonificaciones aplicadas, sin IVA)
     # Editable manualmente si el proveedor actualizó precios
-    unit_cost = Column(Numeric(12, 2), default=0, nullable=False)
+    unit_cost = Column(Money(), server_default=text("0"), nullable=False)
 
     # IVA del producto
-    iva_rate = Column(Numeric(5, 2), default=21.00, nullable=False)
+    iva_rate = Column(Numeric(5, 2), server_default=text("21.00"), nullable=False)
 
     # Totales por ítem
-    subtotal = Column(Numeric(14, 2), default=0, nullable=False)    # unit_cost × quantity_to_order
-    iva_amount = Column(Numeric(14, 2), default=0, nullable=False)  # subtotal × iva_rate / 100
-    total = Column(Numeric(14, 2), default=0, nullable=False)       # subtotal + iva_amount
+    subtotal = Column(Money(), server_default=text("0"), nullable=False)    # unit_cost × quantity_to_order
+    iva_amount = Column(Money(), server_default=text("0"), nullable=False)  # subtotal × iva_rate / 100
+    total = Column(Money(), server_default=text("0"), nullable=False)       # subtotal + iva_amount
 
     # Relaciones
     purchase_order = relationship("PurchaseOrder", back_populates="items")
     product = relationship("Product")
 
+    @staticmethod
+    def compute_totals(unit_cost, quantity_to_order, iva_rate) -> tuple[Decimal, Decimal, Decimal]:
+        """Devuelve (subtotal, iva_amount, total) de un ítem, redondeados a 2 decimales."""
+        subtotal = _as_decimal(unit_cost) * (quantity_to_order or 0)
+        iva_amount = subtotal * _as_decimal(iva_rate) / _HUNDRED
+        return (
+            round_cents(subtotal),
+            round_cents(iva_amount),
+            round_cents(subtotal + iva_amount),
+        )
+
     def recalculate(self) -> None:
         """Recalcula subtotal, iva_amount y total para este ítem."""
-        from decimal import Decimal
-        unit_cost = Decimal(str(self.unit_cost or 0))
-        qty = Decimal(str(self.quantity_to_order or 0))
-        iva_rate = Decimal(str(self.iva_rate or 0))
-
-        subtotal = unit_cost * qty
-        iva_amount = subtotal * iva_rate / 100
-
-        self.subtotal = round(subtotal, 2)
-        self.iva_amount = round(iva_amount, 2)
-        self.total = round(subtotal + iva_amount, 2)
-
-    def __repr__(self) -> str:
-        return f"<PurchaseOrderItem product={self.product_id} qty={self.quantity_to_order}>"
+        self.subtotal, self.iva_amount, self.total = self.compute_totals(
+            self.unit_cost, self.quantity_to_order, self.iva_rate
+        )
@@ -2,7 +2,7 @@
 Modelo de Proveedor.
 Almacena información de proveedores y condiciones comerciales.
 """
-from sqlalchemy import Column, ForeignKey, Numeric, String, Text
+from sqlalchemy import Column, ForeignKey, Index, Numeric, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -17,12 +17,20 @@ class Supplier(BaseModel):
     """
 
     __tablename__ = "suppliers"
+    __table_args__ = (
+        # Listado de proveedores activos del negocio ordenado por nombre
+        Index(
+            "ix_suppliers_active",
+            "business_id",
+            "name",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     business_id = Column(
         UUID(as_uuid=True),
         ForeignKey("businesses.id"),
         nullable=False,
-        index=True,
     )
 
     # Datos del proveedor
@@ -43,7 +51,7 @@ class Supplier(BaseModel):
 
     # Relaciones
     business = relationship("Business", back_populates="suppliers")
-    products = relationship("Product", back_populates="supplier", lazy="dynamic")
+    products = relationship("Product", back_populates="supplier", lazy="raise_on_sql")
     categories = relationship(
         "Category",
         secondary=supplier_category,
@@ -56,6 +64,3 @@ class Supplier(BaseModel):
         lazy="selectin",
         overlaps="supplier"  # Evitar warnings de overlaps
     )
-
-    def __repr__(self) -> str:
-        return f"<Supplier {self.name}>"
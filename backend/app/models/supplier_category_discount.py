@@ -40,6 +40,3 @@ class SupplierCategoryDiscount(BaseModel):
     # Relaciones (usar strings para evitar circular imports)
     supplier = relationship("Supplier", back_populates="category_discounts", overlaps="supplier")
     category = relationship("Category")
-
-    def __repr__(self) -> str:
-        return f"<SupplierCategoryDiscount supplier={self.supplier_id} category={self.category_id}>"
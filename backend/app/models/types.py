@@ -0,0 +1,106 @@
+"""
+Tipos de columna personalizados compartidos por los modelos.
+"""
+import enum
+from decimal import ROUND_HALF_UP, Context, Decimal
+from typing import Mapping, Optional, Type
+
+from sqlalchemy import BigInteger, LargeBinary, SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+# Contexto fijo para redondear a centavos: ROUND_HALF_UP (el medio centavo
+# sube, como en los comprobantes), sin depender del contexto decimal del hilo
+_CENTS_CONTEXT = Context(prec=28, rounding=ROUND_HALF_UP)
+_CENT = Decimal("0.01")
+
+
+def round_cents(value: Decimal) -> Decimal:
+    """Redondea un Decimal a 2 decimales; el medio centavo redondea hacia arriba."""
+    return value.quantize(_CENT, context=_CENTS_CONTEXT)
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Persiste un Enum de Python como SMALLINT (2 bytes) en lugar de un
+    tipo ENUM nativo de PostgreSQL.
+
+    Los miembros siguen siendo los del Enum (la API no cambia); en la base
+    se guarda el código entero indicado en `codes`. Los códigos deben ser
+    estables: nunca reutilizar ni renumerar uno existente.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[enum.Enum], codes: Mapping[enum.Enum, int]):
+        super().__init__()
+        self.enum_class = enum_class
+        # Tupla (hashable) para que el tipo pueda participar de la caché de SQL
+        self.codes = tuple(codes.items())
+        self._to_code = dict(self.codes)
+        self._from_code = {code: member for member, code in self.codes}
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        # Los miembros de un Enum str tienen el mismo hash que su valor: el
+        # dict resuelve tanto el miembro como el string sin pasar por el Enum
+        code = self._to_code.get(value)
+        if code is None:
+            code = self._to_code[self.enum_class(value)]
+        return code
+
+    def process_result_value(self, value, dialect) -> Optional[enum.Enum]:
+        if value is None:
+            return None
+        return self._from_code[value]
+
+
+class Money(TypeDecorator):
+    """
+    Importe en pesos persistido como BIGINT en centavos.
+
+    En Python se sigue trabajando con Decimal de 2 decimales (los schemas
+    y servicios no cambian); en la base el valor es un entero de 8 bytes,
+    con aritmética y SUM() de enteros en lugar de NUMERIC.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        return int(round_cents(value).scaleb(2))
+
+    def process_result_value(self, value, dialect) -> Optional[Decimal]:
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-2)
+
+
+class Utf8Bytes(TypeDecorator):
+    """
+    Texto persistido como BYTEA codificado en UTF-8.
+
+    Pensado para credenciales (certificados/claves PEM, token y sign del
+    WSAA): en Python siguen siendo str, en la base no pasan por la
+    validación de codificación de TEXT y, con STORAGE EXTERNAL, se guardan
+    fuera de línea sin comprimir.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        return value.encode("utf-8") if isinstance(value, str) else bytes(value)
+
+    def process_result_value(self, value, dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return bytes(value).decode("utf-8")
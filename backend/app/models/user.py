@@ -24,6 +24,3 @@ class User(BaseModel):
 
     # Relaciones
     businesses = relationship("Business", back_populates="owner", lazy="selectin")
-
-    def __repr__(self) -> str:
-        return f"<User {self.email}>"
@@ -4,11 +4,21 @@ Representa cotizaciones, remitos y facturas.
 """
 import enum
 
-from sqlalchemy import Column, Date, Enum, ForeignKey, Numeric, String, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, CheckConstraint, Column, Computed, Date, ForeignKey, Index, Numeric, String, Text, exists, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import aliased, deferred, relationship
 
 from app.models.base import BaseModel
+from app.models.types import Money, SmallIntEnum
+
+
+# Grupo de columnas diferidas con la respuesta cruda de ARCA: ningún listado
+# ni respuesta las usa; cargarlas con options(undefer_group(ARCA_PAYLOAD))
+ARCA_PAYLOAD = "arca_payload"
+# Textos libres del comprobante (observaciones, motivo de baja): tampoco
+# salen en listados ni respuestas; cargarlos con undefer_group(VOUCHER_NOTES)
+VOUCHER_NOTES = "voucher_notes"
 
 
 class VoucherType(str, enum.Enum):
@@ -26,6 +36,21 @@ class VoucherType(str, enum.Enum):
     DEBIT_NOTE_B = "debit_note_b"  # Nota de Débito B
     DEBIT_NOTE_C = "debit_note_c"  # Nota de Débito C
 
+    @classmethod
+    def is_invoice(cls, value: "VoucherType") -> bool:
+        """Factura A, B o C."""
+        return value in INVOICE_TYPES
+
+    @classmethod
+    def is_credit_note(cls, value: "VoucherType") -> bool:
+        """Nota de crédito A, B o C."""
+        return value in CREDIT_NOTE_TYPES
+
+    @classmethod
+    def is_debit_note(cls, value: "VoucherType") -> bool:
+        """Nota de débito A, B o C."""
+        return value in DEBIT_NOTE_TYPES
+
 
 class VoucherStatus(str, enum.Enum):
     """Estados posibles de un comprobante."""
@@ -35,6 +60,60 @@ class VoucherStatus(str, enum.Enum):
     CANCELLED = "cancelled"  # Anulado
 
 
+# Códigos SMALLINT persistidos en vouchers.voucher_type / vouchers.status.
+# Son estables: agregar valores nuevos al final, nunca renumerar.
+VOUCHER_TYPE_CODES = {
+    VoucherType.QUOTATION: 1,
+    VoucherType.RECEIPT: 2,
+    VoucherType.INVOICE_A: 3,
+    VoucherType.INVOICE_B: 4,
+    VoucherType.INVOICE_C: 5,
+    VoucherType.CREDIT_NOTE_A: 6,
+    VoucherType.CREDIT_NOTE_B: 7,
+    VoucherType.CREDIT_NOTE_C: 8,
+    VoucherType.DEBIT_NOTE_A: 9,
+    VoucherType.DEBIT_NOTE_B: 10,
+    VoucherType.DEBIT_NOTE_C: 11,
+}
+
+# Agrupaciones de tipos, armadas una sola vez (pertenencia O(1), sin
+# construir tuplas ni comparar strings por comprobante)
+INVOICE_TYPES = frozenset({
+    VoucherType.INVOICE_A,
+    VoucherType.INVOICE_B,
+    VoucherType.INVOICE_C,
+})
+CREDIT_NOTE_TYPES = frozenset({
+    VoucherType.CREDIT_NOTE_A,
+    VoucherType.CREDIT_NOTE_B,
+    VoucherType.CREDIT_NOTE_C,
+})
+DEBIT_NOTE_TYPES = frozenset({
+    VoucherType.DEBIT_NOTE_A,
+    VoucherType.DEBIT_NOTE_B,
+    VoucherType.DEBIT_NOTE_C,
+})
+# Comprobantes que se autorizan electrónicamente en ARCA
+ARCA_TYPES = INVOICE_TYPES | CREDIT_NOTE_TYPES | DEBIT_NOTE_TYPES
+
+# Letra impresa en el PDF; el resto de los tipos usa "X"
+VOUCHER_LETTERS = {
+    VoucherType.INVOICE_A: "A",
+    VoucherType.CREDIT_NOTE_A: "A",
+    VoucherType.INVOICE_B: "B",
+    VoucherType.CREDIT_NOTE_B: "B",
+    VoucherType.INVOICE_C: "C",
+    VoucherType.CREDIT_NOTE_C: "C",
+    VoucherType.RECEIPT: "R",
+}
+
+VOUCHER_STATUS_CODES = {
+    VoucherStatus.DRAFT: 1,
+    VoucherStatus.CONFIRMED: 2,
+    VoucherStatus.CANCELLED: 3,
+}
+
+
 class Voucher(BaseModel):
     """
     Comprobante de venta.
@@ -42,12 +121,34 @@ class Voucher(BaseModel):
     """
 
     __tablename__ = "vouchers"
+    __table_args__ = (
+        # Comprobantes activos del negocio, más recientes primero (scan inverso)
+        Index(
+            "ix_vouchers_active",
+            "business_id",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Ventas del período (dashboard): igualdad en negocio/estado/tipo y
+        # rango de fechas en un único recorrido; total en INCLUDE para que
+        # SUM/COUNT se resuelvan con Index Only Scan
+        Index(
+            "ix_vouchers_sales",
+            "business_id",
+            "status",
+            "voucher_type",
+            "date",
+            postgresql_where=text("deleted_at IS NULL"),
+            postgresql_include=["total"],
+        ),
+        CheckConstraint("voucher_type BETWEEN 1 AND 11", name="ck_vouchers_voucher_type"),
+        CheckConstraint("status BETWEEN 1 AND 3", name="ck_vouchers_status"),
+    )
 
     business_id = Column(
         UUID(as_uuid=True),
         ForeignKey("businesses.id"),
         nullable=False,
-        index=True,
     )
     client_id = Column(
         UUID(as_uuid=True),
@@ -62,42 +163,55 @@ class Voucher(BaseModel):
     )
 
     # Tipo y estado
-    voucher_type = Column(Enum(VoucherType), nullable=False, index=True)
-    status = Column(Enum(VoucherStatus), default=VoucherStatus.DRAFT, nullable=False)
+    voucher_type = Column(SmallIntEnum(VoucherType, VOUCHER_TYPE_CODES), nullable=False, index=True)
+    status = Column(
+        SmallIntEnum(VoucherStatus, VOUCHER_STATUS_CODES),
+        server_default=text("1"),  # DRAFT
+        nullable=False,
+    )
 
     # Numeración
     sale_point = Column(String(5), nullable=False)  # 0001
     number = Column(String(8), nullable=False)  # 00000001
+    # Número completo (0001-00000001), generado por la base; vuelve en el
+    # RETURNING del INSERT/UPDATE (eager_defaults)
+    full_number = Column(String(14), Computed("sale_point || '-' || number", persisted=True))
 
     # Fechas
     date = Column(Date, nullable=False)
     due_date = Column(Date, nullable=True)  # Vigencia de cotización o vencimiento
 
     # Descuento general del comprobante (% aplicado sobre el subtotal de todos los ítems)
-    general_discount = Column(Numeric(5, 2), default=0, nullable=False)
+    general_discount = Column(Numeric(5, 2), server_default=text("0"), nullable=False)
 
     # Totales
-    subtotal = Column(Numeric(12, 2), default=0, nullable=False)  # Sin IVA
-    iva_amount = Column(Numeric(12, 2), default=0, nullable=False)
-    total = Column(Numeric(12, 2), default=0, nullable=False)
+    subtotal = Column(Money(), server_default=text("0"), nullable=False)  # Sin IVA
+    iva_amount = Column(Money(), server_default=text("0"), nullable=False)
+    total = Column(Money(), server_default=text("0"), nullable=False)
 
     # Datos ARCA (para facturas electrónicas)
     cae = Column(String(20), nullable=True)
     cae_expiration = Column(Date, nullable=True)
-    arca_response = Column(Text, nullable=True)  # JSON completo de la respuesta
+    arca_response = deferred(  # JSON completo de la respuesta
+        Column(JSONB, nullable=True), group=ARCA_PAYLOAD, raiseload=True
+    )
     barcode = Column(String(100), nullable=True)  # Código de barras
-    qr_data = Column(Text, nullable=True)  # Datos para QR
+    qr_data = deferred(  # Datos para QR
+        Column(Text, nullable=True), group=ARCA_PAYLOAD, raiseload=True
+    )
 
     # Observaciones
-    notes = Column(Text, nullable=True)
-    internal_notes = Column(Text, nullable=True)  # Notas internas (no salen en PDF)
+    notes = deferred(Column(Text, nullable=True), group=VOUCHER_NOTES, raiseload=True)
+    internal_notes = deferred(  # Notas internas (no salen en PDF)
+        Column(Text, nullable=True), group=VOUCHER_NOTES, raiseload=True
+    )
 
     # Para remitos
-    show_prices = Column(String(1), default="S")  # S/N - Mostrar precios en remito
+    show_prices = Column(Boolean, default=True, nullable=False)  # Mostrar precios en remito
     
     # Auditoría de eliminación
-    deleted_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    deletion_reason = Column(Text, nullable=True)
+    deleted_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    deletion_reason = deferred(Column(Text, nullable=True), group=VOUCHER_NOTES, raiseload=True)
 
     # Relaciones
     business = relationship("Business")
@@ -109,7 +223,7 @@ class Voucher(BaseModel):
         cascade="all, delete-orphan",
         lazy="selectin",
     )
-    payments = relationship("Payment", back_populates="voucher", lazy="dynamic")
+    payments = relationship("Payment", back_populates="voucher", lazy="raise_on_sql")
     voucher_payments = relationship("VoucherPayment", back_populates="voucher", cascade="all, delete-orphan", lazy="selectin")
     
     # Relación jerárquica (para Notas de Crédito que apuntan a una Factura)
@@ -135,19 +249,19 @@ class Voucher(BaseModel):
         lazy="selectin",
     )
 
-    @property
-    def full_number(self) -> str:
-        """Retorna el número completo del comprobante."""
-        return f"{self.sale_point}-{self.number}"
-
-    @property
+    @hybrid_property
     def has_credit_note(self) -> bool:
         """Indica si el comprobante tiene notas de crédito asociadas."""
-        if not self.credit_notes:
-            return False
-        # Verificar si alguno de los hijos es una nota de crédito
-        # Convertimos enum a string por seguridad
-        return any("credit_note" in str(child.voucher_type) for child in self.credit_notes)
-
-    def __repr__(self) -> str:
-        return f"<Voucher {self.voucher_type.value} {self.full_number}>"
+        return any(
+            child.voucher_type in CREDIT_NOTE_TYPES for child in self.credit_notes or ()
+        )
+
+    @has_credit_note.inplace.expression
+    @classmethod
+    def _has_credit_note_expression(cls):
+        """EXISTS sobre los hijos: no hace falta cargar credit_notes para filtrar."""
+        child = aliased(cls)
+        return exists().where(
+            child.related_voucher_id == cls.id,
+            child.voucher_type.in_(CREDIT_NOTE_TYPES),
+        )
@@ -0,0 +1,82 @@
+"""
+Modelo de Contador de numeración.
+Lleva el último número correlativo emitido por negocio y tipo de comprobante.
+"""
+import enum
+from uuid import UUID as PyUUID
+
+from sqlalchemy import BigInteger, CheckConstraint, Column, ForeignKey, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.base import BaseModel
+from app.models.types import SmallIntEnum
+
+
+class CounterType(str, enum.Enum):
+    """Series con numeración correlativa propia."""
+
+    QUOTATION = "quotation"  # Cotización
+    RECEIPT = "receipt"  # Remito
+    INVOICE_A = "invoice_a"  # Factura A
+    INVOICE_B = "invoice_b"  # Factura B
+    INVOICE_C = "invoice_c"  # Factura C
+    PURCHASE_ORDER = "purchase_order"  # Orden de pedido
+
+
+# Códigos SMALLINT persistidos en voucher_counters.counter_type (estables, no renumerar)
+COUNTER_TYPE_CODES = {
+    CounterType.QUOTATION: 1,
+    CounterType.RECEIPT: 2,
+    CounterType.INVOICE_A: 3,
+    CounterType.INVOICE_B: 4,
+    CounterType.INVOICE_C: 5,
+    CounterType.PURCHASE_ORDER: 6,
+}
+
+
+class VoucherCounter(BaseModel):
+    """
+    Último número emitido de una serie del negocio.
+
+    Una fila por (negocio, serie): emitir un comprobante bloquea solo la
+    fila de su serie, no la de businesses ni la de las otras series.
+    """
+
+    __tablename__ = "voucher_counters"
+    __table_args__ = (
+        UniqueConstraint("business_id", "counter_type", name="uq_voucher_counters_business_type"),
+        CheckConstraint("counter_type BETWEEN 1 AND 6", name="ck_voucher_counters_counter_type"),
+    )
+
+    business_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("businesses.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    counter_type = Column(SmallIntEnum(CounterType, COUNTER_TYPE_CODES), nullable=False)
+    last_number = Column(BigInteger, nullable=False, default=0)
+
+    @classmethod
+    async def next_number(
+        cls, session: AsyncSession, business_id: PyUUID, counter_type: CounterType
+    ) -> int:
+        """
+        Incrementa el contador de la serie y retorna el nuevo número.
+
+        Es un único INSERT ... ON CONFLICT DO UPDATE ... RETURNING: crea la
+        fila la primera vez y la incrementa de forma atómica las siguientes.
+        La fila queda bloqueada hasta el commit de la transacción, así dos
+        emisiones de la misma serie nunca obtienen el mismo número.
+        """
+        stmt = insert(cls).values(
+            business_id=business_id,
+            counter_type=counter_type,
+            last_number=1,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_voucher_counters_business_type",
+            set_={"last_number": cls.last_number + 1, "updated_at": func.now()},
+        ).returning(cls.last_number)
+        result = await session.execute(stmt)
+        return result.scalar_one()
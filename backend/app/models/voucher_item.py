@@ -2,11 +2,12 @@
 Modelo de Ítem de Comprobante.
 Representa cada línea/producto de un comprobante.
 """
-from sqlalchemy import Column, ForeignKey, Integer, Numeric, String
+from sqlalchemy import Column, ForeignKey, Integer, Numeric, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
+from app.models.types import Money
 
 
 class VoucherItem(BaseModel):
@@ -36,18 +37,18 @@ class VoucherItem(BaseModel):
     # Cantidades y precios
     quantity = Column(Numeric(12, 2), nullable=False)
     unit = Column(String(20), default="unidad", nullable=False)
-    unit_price = Column(Numeric(12, 2), nullable=False)  # Precio unitario sin IVA
+    unit_price = Column(Money(), nullable=False)  # Precio unitario sin IVA
 
     # Descuento adicional por línea
-    discount_percent = Column(Numeric(5, 2), default=0, nullable=False)
+    discount_percent = Column(Numeric(5, 2), server_default=text("0"), nullable=False)
 
     # IVA
     iva_rate = Column(Numeric(5, 2), nullable=False)
-    iva_amount = Column(Numeric(12, 2), nullable=False)
+    iva_amount = Column(Money(), nullable=False)
 
     # Totales de la línea
-    subtotal = Column(Numeric(12, 2), nullable=False)  # Precio × Cantidad - Descuento
-    total = Column(Numeric(12, 2), nullable=False)  # Subtotal + IVA
+    subtotal = Column(Money(), nullable=False)  # Precio × Cantidad - Descuento
+    total = Column(Money(), nullable=False)  # Subtotal + IVA
 
     # Orden en el comprobante
     line_number = Column(Integer, default=1, nullable=False)
@@ -55,6 +56,3 @@ class VoucherItem(BaseModel):
     # Relaciones
     voucher = relationship("Voucher", back_populates="items")
     product = relationship("Product")
-
-    def __repr__(self) -> str:
-        return f"<VoucherItem {self.code}: {self.quantity} x {self.unit_price}>"
@@ -36,6 +36,3 @@ class VoucherPayment(BaseModel):
     __table_args__ = (
         CheckConstraint('amount > 0', name='positive_amount'),
     )
-
-    def __repr__(self):
-        return f"<VoucherPayment {self.payment_method_catalog.name if self.payment_method_catalog else 'Unknown'}: ${self.amount}>"
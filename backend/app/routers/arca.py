@@ -5,14 +5,16 @@ Permite gestionar el access token, emitir facturas electrónicas y diagnosticar.
 Documentación Afip SDK: https://docs.afipsdk.com/integracion/python
 """
 import logging
-from datetime import datetime
+from datetime import date, datetime
+from typing import Any, Awaitable
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import Load, undefer_group
 
 from app.database import get_db
-from app.models.business import Business
-from app.models.voucher import Voucher, VoucherStatus, VoucherType
+from app.models.business import AFIP_CREDENTIALS, Business
+from app.models.voucher import ARCA_TYPES, Voucher, VoucherStatus
 from app.models.client import Client
 from app.schemas.arca_schemas import (
     AfipSdkConfigUpdate,
@@ -31,9 +33,11 @@ async def get_business(
     business_id: str,
     db: AsyncSession = Depends(get_db),
 ) -> Business:
-    """Obtiene el negocio por ID."""
+    """Obtiene el negocio por ID, con las credenciales ARCA/AFIP cargadas."""
     result = await db.execute(
-        select(Business).where(Business.id == business_id)
+        select(Business)
+        .where(Business.id == business_id)
+        .options(undefer_group(AFIP_CREDENTIALS))
     )
     business = result.scalar_one_or_none()
 
@@ -46,6 +50,26 @@ async def get_business(
     return business
 
 
+async def _call_sdk(awaitable: Awaitable[Any], error_message: str) -> Any:
+    """
+    Espera una consulta al SDK y traduce sus errores a HTTPException:
+    ValueError → 400 con el mensaje, cualquier otra → 500 (y se loguea).
+    """
+    try:
+        return await awaitable
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"{error_message}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error: {str(e)}",
+        )
+
+
 # ============================================================================
 # Configuración Afip SDK
 # ============================================================================
@@ -89,8 +113,9 @@ async def update_arca_config(
     if config.arca_environment is not None:
         business.arca_environment = config.arca_environment
 
+    # Sin refresh: expire_on_commit=False deja los valores recién asignados,
+    # y un refresh recargaría las credenciales sin undefer_group (raiseload)
     await db.commit()
-    await db.refresh(business)
 
     logger.info(f"Configuración Afip SDK actualizada para negocio {business.id}")
 
@@ -138,19 +163,7 @@ async def get_server_status(
     Verifica el estado del servidor ARCA/AFIP.
     """
     service = AfipSdkService(business)
-    try:
-        return await service.get_server_status()
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Error al verificar estado del servidor: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error: {str(e)}",
-        )
+    return await _call_sdk(service.get_server_status(), "Error al verificar estado del servidor")
 
 
 # ============================================================================
@@ -165,24 +178,24 @@ async def test_invoice(
     Envía una factura de prueba para verificar que la integración funciona.
     Usa datos mínimos: Factura B, Consumidor Final, 1 producto de $121 ($100 + IVA 21%).
     """
-    service = AfipSdkService(business)
+    # Validar configuración antes de crear el servicio
+    if not business.afipsdk_access_token:
+        return {
+            "success": False,
+            "step": "config",
+            "message": "No hay access_token de Afip SDK configurado.",
+        }
 
-    try:
-        # Validar configuración
-        if not business.afipsdk_access_token:
-            return {
-                "success": False,
-                "step": "config",
-                "message": "No hay access_token de Afip SDK configurado.",
-            }
+    if not business.cuit:
+        return {
+            "success": False,
+            "step": "config",
+            "message": "El CUIT del negocio no está configurado.",
+        }
 
-        if not business.cuit:
-            return {
-                "success": False,
-                "step": "config",
-                "message": "El CUIT del negocio no está configurado.",
-            }
+    service = AfipSdkService(business)
 
+    try:
         sale_point = int(business.sale_point or "1")
         cbte_fch = datetime.now().strftime("%Y%m%d")
 
@@ -262,19 +275,7 @@ async def get_last_voucher(
         voucher_type: Tipo de comprobante código AFIP (default 6 = Factura B)
     """
     service = AfipSdkService(business)
-    try:
-        return await service.get_last_voucher(sale_point, voucher_type)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Error al obtener último comprobante: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error: {str(e)}",
-        )
+    return await _call_sdk(service.get_last_voucher(sale_point, voucher_type), "Error al obtener último comprobante")
 
 
 @router.get("/voucher-info/{business_id}")
@@ -288,19 +289,7 @@ async def get_voucher_info(
     Obtiene información de un comprobante emitido.
     """
     service = AfipSdkService(business)
-    try:
-        return await service.get_voucher_info(number, sale_point, voucher_type)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Error al obtener info del comprobante: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error: {str(e)}",
-        )
+    return await _call_sdk(service.get_voucher_info(number, sale_point, voucher_type), "Error al obtener info del comprobante")
 
 
 @router.get("/sales-points/{business_id}")
@@ -311,19 +300,7 @@ async def get_sales_points(
     Obtiene los puntos de venta habilitados en ARCA.
     """
     service = AfipSdkService(business)
-    try:
-        return await service.get_sales_points()
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Error al obtener puntos de venta: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error: {str(e)}",
-        )
+    return await _call_sdk(service.get_sales_points(), "Error al obtener puntos de venta")
 
 
 # ============================================================================
@@ -341,32 +318,44 @@ async def emit_electronic_invoice(
     El comprobante debe estar en estado DRAFT o CONFIRMED.
     Solo se pueden emitir facturas (A, B, C) y notas de crédito/débito.
     """
-    # Obtener voucher
+    # Comprobante, negocio (con credenciales) y cliente en una sola consulta;
+    # business_id y client_id son NOT NULL con FK: sin fila, no hay comprobante.
+    # Del negocio y del cliente solo se traen las columnas que usa
+    # AfipSdkService.emit_invoice; el resto queda en raiseload.
     result = await db.execute(
-        select(Voucher).where(Voucher.id == request.voucher_id)
+        select(Voucher, Business, Client)
+        .join(Business, Voucher.business_id == Business.id)
+        .join(Client, Voucher.client_id == Client.id)
+        .where(Voucher.id == request.voucher_id)
+        .options(
+            Load(Business).load_only(
+                Business.cuit,
+                Business.sale_point,
+                Business.arca_environment,
+                Business.afipsdk_access_token,
+                Business.afip_cert,
+                Business.afip_key,
+                raiseload=True,
+            ),
+            Load(Client).load_only(
+                Client.document_type,
+                Client.document_number,
+                Client.tax_condition,
+                raiseload=True,
+            ),
+        )
     )
-    voucher = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not voucher:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Comprobante no encontrado",
         )
+    voucher, business, client = row
 
     # Validar que sea un tipo facturable
-    facturable_types = [
-        VoucherType.INVOICE_A,
-        VoucherType.INVOICE_B,
-        VoucherType.INVOICE_C,
-        VoucherType.CREDIT_NOTE_A,
-        VoucherType.CREDIT_NOTE_B,
-        VoucherType.CREDIT_NOTE_C,
-        VoucherType.DEBIT_NOTE_A,
-        VoucherType.DEBIT_NOTE_B,
-        VoucherType.DEBIT_NOTE_C,
-    ]
-
-    if voucher.voucher_type not in facturable_types:
+    if voucher.voucher_type not in ARCA_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"El tipo de comprobante {voucher.voucher_type.value} no se puede facturar electrónicamente",
@@ -379,23 +368,6 @@ async def emit_electronic_invoice(
             detail="Este comprobante ya tiene CAE asignado. No se puede volver a emitir.",
         )
 
-    # Obtener negocio y cliente
-    result = await db.execute(
-        select(Business).where(Business.id == voucher.business_id)
-    )
-    business = result.scalar_one_or_none()
-
-    result = await db.execute(
-        select(Client).where(Client.id == voucher.client_id)
-    )
-    client = result.scalar_one_or_none()
-
-    if not business or not client:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Negocio o cliente no encontrado",
-        )
-
     # Crear servicio Afip SDK
     service = AfipSdkService(business)
 
@@ -408,13 +380,10 @@ async def emit_electronic_invoice(
             # Actualizar voucher con datos de ARCA
             voucher.cae = arca_response["CAE"]
             if arca_response.get("CAEFchVto"):
-                voucher.cae_expiration = datetime.strptime(
-                    arca_response["CAEFchVto"], "%Y-%m-%d"
-                ).date()
+                voucher.cae_expiration = date.fromisoformat(arca_response["CAEFchVto"])
             voucher.status = VoucherStatus.CONFIRMED
 
             await db.commit()
-            await db.refresh(voucher)
 
             logger.info(f"Factura emitida exitosamente. CAE: {voucher.cae}")
 
@@ -2,6 +2,8 @@
 Router de Autenticación.
 Endpoints para login con Google OAuth y gestión de sesiones JWT.
 """
+from urllib.parse import urlencode
+
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import RedirectResponse
 from pydantic import BaseModel
@@ -10,11 +12,21 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.services.auth_service import AuthService
 from app.utils.security import get_current_user
-from app.config import get_settings
+from app.config import SETTINGS
 
-settings = get_settings()
 router = APIRouter(prefix="/auth", tags=["Autenticación"])
 
+# URL de autorización de Google: todos los parámetros salen de SETTINGS,
+# que no cambia en runtime, así que se arma una sola vez al importar
+GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth?" + urlencode({
+    "client_id": SETTINGS.GOOGLE_CLIENT_ID,
+    "redirect_uri": SETTINGS.GOOGLE_REDIRECT_URI,
+    "response_type": "code",
+    "scope": "openid email profile",
+    "access_type": "offline",
+    "prompt": "select_account",
+})
+
 
 class GoogleLoginRequest(BaseModel):
     """Request para login con Google."""
@@ -52,20 +64,7 @@ async def google_login():
     Inicia el flujo de autenticación con Google OAuth 2.0.
     Redirige al usuario a la página de autorización de Google.
     """
-    from urllib.parse import urlencode
-
-    # Parámetros para el authorization endpoint de Google
-    params = {
-        "client_id": settings.GOOGLE_CLIENT_ID,
-        "redirect_uri": settings.GOOGLE_REDIRECT_URI,
-        "response_type": "code",
-        "scope": "openid email profile",
-        "access_type": "offline",
-        "prompt": "select_account",
-    }
-
-    auth_url = f"https://accounts.google.com/o/oauth2/v2/auth?{urlencode(params)}"
-    return RedirectResponse(url=auth_url)
+    return RedirectResponse(url=GOOGLE_AUTH_URL)
 
 
 @router.get("/google/callback")
@@ -94,7 +93,7 @@ async def google_callback(
         )
 
     # Redirigir al frontend con los tokens en la URL
-    frontend_url = settings.FRONTEND_URL
+    frontend_url = SETTINGS.FRONTEND_URL
     access_token = result["access_token"]
     refresh_token = result["refresh_token"]
 
@@ -161,18 +160,18 @@ async def get_current_user_info(
     )
 
 
-@router.post("/logout")
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 async def logout():
     """
     Cierra la sesión del usuario.
     En JWT stateless esto es manejado por el frontend
-    descartando los tokens almacenados.
+    descartando los tokens almacenados (sin cuerpo de respuesta).
     """
-    return {"message": "Sesión cerrada correctamente", "success": True}
 
 
 @router.post("/dev-login", response_model=TokenResponse)
 async def dev_login(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -180,7 +179,7 @@ async def dev_login(
     Solo disponible cuando DEBUG=True.
     Obtiene el primer usuario activo de la base de datos y genera tokens JWT.
     """
-    if not settings.DEBUG:
+    if not SETTINGS.DEBUG:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Endpoint no disponible en producción",
@@ -189,10 +188,16 @@ async def dev_login(
     from sqlalchemy import select
     from app.models.user import User
 
-    # Obtener el primer usuario activo
-    query = select(User).where(User.is_active.is_(True)).limit(1)
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
+    # El id del usuario resuelto queda en el estado de la app: las llamadas
+    # siguientes (suites E2E) lo buscan por clave primaria
+    dev_user_id = getattr(request.app.state, "dev_user_id", None)
+    user = await db.get(User, dev_user_id) if dev_user_id else None
+    if user is None or not user.is_active:
+        # Obtener el primer usuario activo
+        query = select(User).where(User.is_active.is_(True)).limit(1)
+        result = await db.execute(query)
+        user = result.scalar_one_or_none()
+        request.app.state.dev_user_id = user.id if user else None
 
     if not user:
         raise HTTPException(
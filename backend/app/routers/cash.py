@@ -77,19 +77,8 @@ async def get_history(
     """
     Retorna el historial de cajas cerradas (últimas 30), de más reciente a más antigua.
     """
-    registers = await service.get_history(db, business_id)
-    return [
-        CashRegisterSummaryResponse(
-            id=r.id,
-            status=r.status,
-            is_expired=False,
-            opening_amount=r.opening_amount,
-            opened_at=r.opened_at,
-            closed_at=r.closed_at,
-            difference=r.difference,
-        )
-        for r in registers
-    ]
+    # FastAPI valida la lista ORM contra el response_model (from_attributes)
+    return await service.get_history(db, business_id)
 
 
 @router.get("/{cash_register_id}/movements", response_model=List[CashMovementResponse])
@@ -101,41 +90,7 @@ async def list_movements(
     """
     Lista todos los movimientos de una caja específica.
     """
-    register_response = await service.get_summary(db, business_id, cash_register_id)
-    # Reusamos el get_summary para validar que la caja pertenece al negocio
-    # y luego obtenemos los movimientos directamente
-    from sqlalchemy import select, and_
-    from app.models.cash_register import CashRegister, CashMovement
-    from sqlalchemy.orm import selectinload
-
-    result = await db.execute(
-        select(CashRegister)
-        .options(selectinload(CashRegister.movements))
-        .where(
-            and_(
-                CashRegister.id == cash_register_id,
-                CashRegister.business_id == business_id,
-                CashRegister.deleted_at.is_(None),
-            )
-        )
-    )
-    register = result.scalar_one_or_none()
-    if not register:
-        raise HTTPException(status_code=404, detail="Caja no encontrada.")
-
-    return [
-        CashMovementResponse(
-            id=m.id,
-            type=m.type,
-            payment_method=m.payment_method,
-            amount=m.amount,
-            description=m.description,
-            voucher_id=m.voucher_id,
-            created_by=m.created_by,
-            created_at=m.created_at,
-        )
-        for m in register.movements
-    ]
+    return await service.list_movements(db, business_id, cash_register_id)
 
 
 @router.post("/{cash_register_id}/movements", response_model=CashMovementResponse, status_code=status.HTTP_201_CREATED)
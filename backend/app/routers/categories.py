@@ -17,7 +17,8 @@ from app.schemas.category import (
     CategoryUpdate,
     CategoryWithChildren,
 )
-from app.services.category_service import CategoryService
+from app.services.category_service import CATEGORY_TREE_CACHE, CategoryService
+from app.utils.responses import dump_json, json_response
 from app.utils.security import get_current_business
 
 router = APIRouter(prefix="/categories", tags=["Categorías"])
@@ -49,13 +50,14 @@ async def list_categories(
     categories, total = await service.list(business_id, params)
     pages = (total + per_page - 1) // per_page if per_page else 0
 
-    return PaginatedResponse(
-        items=[CategoryResponse.model_validate(c) for c in categories],
-        total=total,
-        page=page,
-        per_page=per_page,
-        pages=pages,
-    )
+    page_data = {
+        "items": categories,
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "pages": pages,
+    }
+    return json_response(dump_json(PaginatedResponse[CategoryResponse], page_data))
 
 
 @router.get("/tree", response_model=list[CategoryWithChildren])
@@ -67,21 +69,19 @@ async def get_category_tree(
     Obtiene el árbol completo de categorías.
     Útil para selectores y navegación jerárquica.
     """
-    service = CategoryService(db)
-    categories = await service.get_tree(business_id)
-
-    def build_tree(category) -> CategoryWithChildren:
-        return CategoryWithChildren(
-            id=category.id,
-            created_at=category.created_at,
-            updated_at=category.updated_at,
-            name=category.name,
-            description=category.description,
-            parent_id=category.parent_id,
-            subcategories=[build_tree(sub) for sub in category.subcategories if not sub.deleted_at],
-        )
-
-    return [build_tree(c) for c in categories]
+    # El árbol cambia poco: se sirve el JSON ya serializado mientras no
+    # venza ni lo invalide una escritura de categorías
+    content = CATEGORY_TREE_CACHE.get(business_id)
+    if content is None:
+        service = CategoryService(db)
+        # get_tree deja cargadas solo las subcategorías activas en todos
+        # los niveles: pydantic-core valida y serializa el árbol ORM
+        # (from_attributes) sin recorrerlo en Python
+        roots = await service.get_tree(business_id)
+        content = dump_json(list[CategoryWithChildren], roots)
+        CATEGORY_TREE_CACHE.set(business_id, content)
+
+    return json_response(content)
 
 
 @router.post("", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
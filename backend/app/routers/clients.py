@@ -12,6 +12,7 @@ from app.database import get_db
 from app.schemas.base import MessageResponse, PaginatedResponse
 from app.schemas.client import ClientCreate, ClientListParams, ClientResponse, ClientUpdate
 from app.services.client_service import ClientService
+from app.utils.responses import dump_json, json_response
 from app.utils.security import get_current_business
 
 router = APIRouter(prefix="/clients", tags=["Clientes"])
@@ -43,13 +44,14 @@ async def list_clients(
     clients, total = await service.list(business_id, params)
     pages = (total + per_page - 1) // per_page if per_page else 0
 
-    return PaginatedResponse(
-        items=[ClientResponse.model_validate(c) for c in clients],
-        total=total,
-        page=page,
-        per_page=per_page,
-        pages=pages,
-    )
+    page_data = {
+        "items": clients,
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "pages": pages,
+    }
+    return json_response(dump_json(PaginatedResponse[ClientResponse], page_data))
 
 
 @router.post("", response_model=ClientResponse, status_code=status.HTTP_201_CREATED)
@@ -61,15 +63,15 @@ async def create_client(
     """Crea un nuevo cliente."""
     service = ClientService(db)
 
-    # Verificar si el documento ya existe
-    existing = await service.get_by_document(data.document_number, business_id)
-    if existing:
+    # El documento repetido lo detecta uq_clients_business_document en el
+    # mismo INSERT (sin SELECT previo ni condición de carrera)
+    try:
+        client = await service.create(business_id, data)
+    except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Ya existe un cliente con el documento '{data.document_number}'",
+            detail=str(e),
         )
-
-    client = await service.create(business_id, data)
     return ClientResponse.model_validate(client)
 
 
@@ -101,7 +103,13 @@ async def update_client(
 ):
     """Actualiza un cliente existente."""
     service = ClientService(db)
-    client = await service.update(client_id, business_id, data)
+    try:
+        client = await service.update(client_id, business_id, data)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
     if not client:
         raise HTTPException(
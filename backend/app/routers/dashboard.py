@@ -6,21 +6,19 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import extract, func, select
+from sqlalchemy import func, select, true, type_coerce
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.client import Client
 from app.models.product import Product
-from app.models.voucher import Voucher, VoucherStatus, VoucherType
+from app.models.types import Money
+from app.models.voucher import INVOICE_TYPES, Voucher, VoucherStatus
 from app.schemas.base import BaseSchema
 from app.utils.security import get_current_business
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
-# Tipos de comprobante que representan ventas reales (facturas emitidas)
-INVOICE_TYPES = {VoucherType.INVOICE_A, VoucherType.INVOICE_B, VoucherType.INVOICE_C}
-
 
 class DashboardSummary(BaseSchema):
     """Resumen del dashboard."""
@@ -47,64 +45,81 @@ async def get_dashboard_summary(
     filter_month = month or today.month
     filter_year = year or today.year
 
-    # Total de productos
-    products_query = select(func.count(Product.id)).where(
-        Product.business_id == business_id,
-        Product.deleted_at.is_(None)
-    )
-    total_products = (await db.execute(products_query)).scalar() or 0
+    # Todo el resumen sale de una sola consulta (un round-trip):
+    # los agregados de productos en una pasada con FILTER, los de ventas
+    # en otra, y clientes como subconsulta escalar
 
-    # Total de clientes
-    clients_query = select(func.count(Client.id)).where(
-        Client.business_id == business_id,
-        Client.deleted_at.is_(None)
+    # Productos: total, con stock bajo y valor del inventario
+    # (precio de costo * stock, en centavos -> Money)
+    product_stats = (
+        select(
+            func.count().label("total_products"),
+            func.count()
+            .filter(Product.current_stock <= Product.minimum_stock)
+            .label("low_stock_products"),
+            type_coerce(
+                func.sum(Product.cost_price * Product.current_stock), Money()
+            ).label("total_value"),
+        )
+        .where(
+            Product.business_id == business_id,
+            Product.deleted_at.is_(None)
+        )
+        .subquery()
     )
-    total_clients = (await db.execute(clients_query)).scalar() or 0
 
-    # Productos con stock bajo
-    low_stock_query = select(func.count(Product.id)).where(
-        Product.business_id == business_id,
-        Product.deleted_at.is_(None),
-        Product.current_stock <= Product.minimum_stock
+    # Total de clientes
+    total_clients = (
+        select(func.count())
+        .where(
+            Client.business_id == business_id,
+            Client.deleted_at.is_(None)
+        )
+        .scalar_subquery()
     )
-    low_stock_products = (await db.execute(low_stock_query)).scalar() or 0
 
-    # Valor total del inventario (precio de costo * stock)
-    value_query = select(func.sum(Product.cost_price * Product.current_stock)).where(
-        Product.business_id == business_id,
-        Product.deleted_at.is_(None)
+    # Ventas del período: solo facturas (A, B, C) confirmadas en el mes/año
+    # indicado. Rango de fechas (no extract) para usar ix_vouchers_sales
+    period_start = date(filter_year, filter_month, 1)
+    period_end = (
+        date(filter_year + 1, 1, 1) if filter_month == 12
+        else date(filter_year, filter_month + 1, 1)
     )
-    total_value = (await db.execute(value_query)).scalar() or 0.0
-
-    # Suma de ventas: solo facturas (A, B, C) confirmadas en el mes/año indicado
-    sales_query = select(func.sum(Voucher.total)).where(
-        Voucher.business_id == business_id,
-        Voucher.deleted_at.is_(None),
-        Voucher.status == VoucherStatus.CONFIRMED,
-        Voucher.voucher_type.in_(INVOICE_TYPES),
-        extract('month', Voucher.date) == filter_month,
-        extract('year', Voucher.date) == filter_year,
+    # Suma y cantidad en una sola pasada por el índice
+    sales_stats = (
+        select(
+            func.sum(Voucher.total).label("total_sales"),
+            func.count().label("total_invoices"),
+        )
+        .where(
+            Voucher.business_id == business_id,
+            Voucher.deleted_at.is_(None),
+            Voucher.status == VoucherStatus.CONFIRMED,
+            Voucher.voucher_type.in_(INVOICE_TYPES),
+            Voucher.date >= period_start,
+            Voucher.date < period_end,
+        )
+        .subquery()
     )
-    total_sales = (await db.execute(sales_query)).scalar() or 0.0
 
-    # Cantidad de facturas en el período
-    invoices_count_query = select(func.count(Voucher.id)).where(
-        Voucher.business_id == business_id,
-        Voucher.deleted_at.is_(None),
-        Voucher.status == VoucherStatus.CONFIRMED,
-        Voucher.voucher_type.in_(INVOICE_TYPES),
-        extract('month', Voucher.date) == filter_month,
-        extract('year', Voucher.date) == filter_year,
-    )
-    total_invoices = (await db.execute(invoices_count_query)).scalar() or 0
+    # Ambos agregados devuelven exactamente una fila: JOIN ON true
+    summary_query = select(
+        product_stats.c.total_products,
+        product_stats.c.low_stock_products,
+        product_stats.c.total_value,
+        total_clients.label("total_clients"),
+        sales_stats.c.total_sales,
+        sales_stats.c.total_invoices,
+    ).select_from(product_stats.join(sales_stats, true()))
+    row = (await db.execute(summary_query)).one()
 
     return DashboardSummary(
-        total_products=total_products,
-        total_clients=total_clients,
-        low_stock_products=low_stock_products,
-        total_value=float(total_value),
-        total_sales=float(total_sales),
-        total_invoices=int(total_invoices),
+        total_products=row.total_products,
+        total_clients=row.total_clients,
+        low_stock_products=row.low_stock_products,
+        total_value=float(row.total_value or 0),
+        total_sales=float(row.total_sales or 0),
+        total_invoices=row.total_invoices,
         filter_month=filter_month,
         filter_year=filter_year,
     )
@@ -4,12 +4,14 @@ Router de métodos de pago.
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import load_only
 from typing import List
 from uuid import UUID
 
 from app.database import get_db
 from app.models.payment_method import PaymentMethodCatalog
 from app.schemas.payment_method import PaymentMethodResponse
+from app.utils.responses import dump_json, json_response
 from app.utils.security import get_current_business
 
 router = APIRouter(prefix="/payment-methods", tags=["Payment Methods"])
@@ -25,9 +27,20 @@ async def list_payment_methods(
     
     Retorna todos los métodos de pago configurados para el negocio actual.
     Solo se muestran los métodos activos (is_active = True).
+    Carga solo las columnas de la respuesta, todas presentes en
+    ix_payment_methods_business.
     """
     result = await db.execute(
         select(PaymentMethodCatalog)
+        .options(
+            load_only(
+                PaymentMethodCatalog.business_id,
+                PaymentMethodCatalog.name,
+                PaymentMethodCatalog.code,
+                PaymentMethodCatalog.is_active,
+                PaymentMethodCatalog.requires_reference,
+            )
+        )
         .where(
             PaymentMethodCatalog.business_id == business_id,
             PaymentMethodCatalog.is_active == True,
@@ -36,4 +49,4 @@ async def list_payment_methods(
     )
     
     methods = result.scalars().all()
-    return methods
+    return json_response(dump_json(List[PaymentMethodResponse], methods))
@@ -3,8 +3,7 @@ Endpoint temporal para probar la generación de PDF.
 """
 from datetime import datetime
 from fastapi import APIRouter
-from fastapi.responses import StreamingResponse
-import io
+from fastapi.responses import Response
 
 from app.services.pdf_service import pdf_service
 
@@ -71,10 +70,10 @@ async def preview_pdf(voucher_type: str):
         context["voucher"]["code_type"] = "000"
         context["voucher"]["cae"] = None
 
-    pdf_bytes = pdf_service.generate_voucher_pdf(context)
+    pdf_bytes = await pdf_service.generate_voucher_pdf(context)
     
-    return StreamingResponse(
-        io.BytesIO(pdf_bytes),
+    return Response(
+        content=pdf_bytes,
         media_type="application/pdf",
         headers={"Content-Disposition": f"attachment; filename=comprobante_{voucher_type}.pdf"}
     )
@@ -1,17 +1,18 @@
 """
 Router para borradores de actualización masiva de precios.
 """
-import json
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from sqlalchemy import select, desc
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.database import get_db
 from app.models.price_update_draft import PriceUpdateDraft
+from app.utils.responses import dump_json, json_response
 from app.utils.security import get_current_business, get_current_user
 
 router = APIRouter(prefix="/price-update-drafts", tags=["Price Update Drafts"])
@@ -46,6 +47,16 @@ class DraftResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @field_validator("id", mode="before")
+    @classmethod
+    def _id_to_str(cls, value):
+        return value if isinstance(value, str) else str(value)
+
+    @field_validator("created_at", "updated_at", mode="before")
+    @classmethod
+    def _datetime_to_iso(cls, value):
+        return value if isinstance(value, str) else value.isoformat()
+
 
 class DraftDetailResponse(DraftResponse):
     products: list  # array deserializado
@@ -59,8 +70,11 @@ async def list_drafts(
     business_id: UUID = Depends(get_current_business),
 ):
     """Lista todos los borradores del negocio, ordenados por más reciente."""
+    # El listado no necesita products_data (puede pesar cientos de KB por
+    # borrador): se usa product_count, que no requiere leer el JSONB
     result = await db.execute(
         select(PriceUpdateDraft)
+        .options(defer(PriceUpdateDraft.products_data, raiseload=True))
         .where(
             PriceUpdateDraft.business_id == business_id,
             PriceUpdateDraft.deleted_at.is_(None),
@@ -69,19 +83,7 @@ async def list_drafts(
     )
     drafts = result.scalars().all()
 
-    return [
-        DraftResponse(
-            id=str(d.id),
-            name=d.name,
-            product_count=int(d.product_count or 0),
-            filter_category_name=d.filter_category_name,
-            filter_supplier_name=d.filter_supplier_name,
-            filter_search=d.filter_search,
-            created_at=d.created_at.isoformat(),
-            updated_at=d.updated_at.isoformat(),
-        )
-        for d in drafts
-    ]
+    return json_response(dump_json(List[DraftResponse], drafts))
 
 
 @router.post("", response_model=DraftResponse, status_code=status.HTTP_201_CREATED)
@@ -110,18 +112,19 @@ async def save_draft(
         filter_supplier_id=UUID(data.filters.supplier_id) if data.filters and data.filters.supplier_id else None,
         filter_supplier_name=data.filters.supplier_name if data.filters else None,
         filter_search=data.filters.search if data.filters else None,
-        products_data=json.dumps(data.products),
-        product_count=str(len(data.products)),
+        products_data=data.products,
+        product_count=len(data.products),
     )
 
     db.add(draft)
+    # created_at/updated_at vuelven en el RETURNING (eager_defaults); sin
+    # refresh() para no volver a leer products_data
     await db.commit()
-    await db.refresh(draft)
 
     return DraftResponse(
         id=str(draft.id),
         name=draft.name,
-        product_count=int(draft.product_count),
+        product_count=draft.product_count,
         filter_category_name=draft.filter_category_name,
         filter_supplier_name=draft.filter_supplier_name,
         filter_search=draft.filter_search,
@@ -152,13 +155,13 @@ async def get_draft(
     return DraftDetailResponse(
         id=str(draft.id),
         name=draft.name,
-        product_count=int(draft.product_count or 0),
+        product_count=draft.product_count,
         filter_category_name=draft.filter_category_name,
         filter_supplier_name=draft.filter_supplier_name,
         filter_search=draft.filter_search,
         created_at=draft.created_at.isoformat(),
         updated_at=draft.updated_at.isoformat(),
-        products=json.loads(draft.products_data),
+        products=draft.products_data,
     )
 
 
@@ -188,16 +191,17 @@ async def update_draft(
         draft.filter_supplier_id = UUID(data.filters.supplier_id) if data.filters.supplier_id else None
         draft.filter_supplier_name = data.filters.supplier_name
         draft.filter_search = data.filters.search
-    draft.products_data = json.dumps(data.products)
-    draft.product_count = str(len(data.products))
+    draft.products_data = data.products
+    draft.product_count = len(data.products)
 
+    # created_at/updated_at vuelven en el RETURNING (eager_defaults); sin
+    # refresh() para no volver a leer products_data
     await db.commit()
-    await db.refresh(draft)
 
     return DraftResponse(
         id=str(draft.id),
         name=draft.name,
-        product_count=int(draft.product_count),
+        product_count=draft.product_count,
         filter_category_name=draft.filter_category_name,
         filter_supplier_name=draft.filter_supplier_name,
         filter_search=draft.filter_search,
@@ -6,10 +6,9 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-import io
 
 from app.database import get_db
 from app.models.product import Product
@@ -65,7 +64,7 @@ async def bulk_delete_alt(
     import logging
     from uuid import UUID as PyUUID
     from app.models.business import Business
-    from datetime import datetime
+    from app.models.base import utcnow
     
     logger = logging.getLogger("uvicorn")
     logger.info(f"=== BULK DELETE ALT (POST) START ===")
@@ -94,7 +93,7 @@ async def bulk_delete_alt(
         
         # Eliminar
         count = 0
-        now = datetime.utcnow()
+        now = utcnow()
         for product in products:
             product.deleted_at = now
             count += 1
@@ -146,8 +145,8 @@ async def list_products(
     products, total = await service.list(business_id, params)
     pages = (total + per_page - 1) // per_page if per_page else 0
 
-    return PaginatedResponse(
-        items=[ProductResponse.model_validate(p) for p in products],
+    return PaginatedResponse[ProductResponse](
+        items=products,
         total=total,
         page=page,
         per_page=per_page,
@@ -161,18 +160,16 @@ async def create_product(
     db: AsyncSession = Depends(get_db),
     business_id: UUID = Depends(get_current_business),
 ):
-    """Crea un nuevo producto."""
+    """Crea un nuevo producto. El código repetido lo rechaza uq_products_business_code."""
     service = ProductService(db)
 
-    # Verificar si el código ya existe
-    existing = await service.get_by_code(data.code, business_id)
-    if existing:
+    try:
+        product = await service.create(business_id, data)
+    except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Ya existe un producto con el código '{data.code}'",
+            detail=str(e),
         )
-
-    product = await service.create(business_id, data)
     return ProductResponse.model_validate(product)
 
 
@@ -205,7 +202,13 @@ async def update_product(
 ):
     """Actualiza un producto existente."""
     service = ProductService(db)
-    product = await service.update(product_id, business_id, data, current_user.id)
+    try:
+        product = await service.update(product_id, business_id, data, current_user.id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
     if not product:
         raise HTTPException(
@@ -344,8 +347,8 @@ async def export_products_excel(
     from datetime import datetime
     filename = f"productos-{datetime.now().strftime('%Y%m%d-%H%M%S')}.xlsx"
     
-    return StreamingResponse(
-        io.BytesIO(content),
+    return Response(
+        content=content,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
@@ -366,8 +369,8 @@ async def export_full_backup(
     from datetime import datetime
     filename = f"backup-productos-completo-{datetime.now().strftime('%Y%m%d-%H%M%S')}.xlsx"
     
-    return StreamingResponse(
-        io.BytesIO(content),
+    return Response(
+        content=content,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
@@ -385,7 +388,7 @@ async def bulk_delete_products(
     import logging
     from uuid import UUID as PyUUID
     from app.models.business import Business
-    from datetime import datetime
+    from app.models.base import utcnow
     
     logger = logging.getLogger("uvicorn")
     
@@ -420,7 +423,7 @@ async def bulk_delete_products(
         
         # Eliminar
         count = 0
-        now = datetime.utcnow()
+        now = utcnow()
         for product in products:
             product.deleted_at = now
             count += 1
@@ -534,9 +537,15 @@ async def apply_price_update(
     request: PriceUpdateRequest,
     db: AsyncSession = Depends(get_db),
     business_id = Depends(get_current_business),
+    current_user = Depends(get_current_user),
 ):
-    """Aplica actualización masiva de precios."""
+    """
+    Aplica actualización masiva de precios.
+    Los valores se calculan en Python y se escriben con sentencias por
+    conjunto (ProductService.bulk_update), registrando el historial de precios.
+    """
     from decimal import Decimal as D
+    from app.models.product import compute_prices
     
     query = select(Product).where(
         Product.id.in_(request.product_ids),
@@ -555,8 +564,13 @@ async def apply_price_update(
         FieldToUpdate.EXTRA_COST: "extra_cost",
         FieldToUpdate.CURRENT_STOCK: "current_stock",
     }[request.field]
+    affects_prices = request.field != FieldToUpdate.CURRENT_STOCK
+    columns = [field_attr]
+    if affects_prices:
+        columns += ["net_price", "sale_price", "discount_display"]
     
-    count = 0
+    rows = []
+    history = []
     for product in products:
         current_value = D(str(getattr(product, field_attr)))
         
@@ -571,15 +585,44 @@ async def apply_price_update(
         else:
             new_value = current_value
         
-        setattr(product, field_attr, round(new_value, 2))
+        row = {"id": product.id, field_attr: round(new_value, 2)}
         
-        if request.field in [FieldToUpdate.LIST_PRICE, FieldToUpdate.DISCOUNT_1, 
-                             FieldToUpdate.DISCOUNT_2, FieldToUpdate.DISCOUNT_3, 
-                             FieldToUpdate.EXTRA_COST]:
-            product.calculate_prices()
+        if affects_prices:
+            # Mismo cálculo que Product.calculate_prices, con el valor nuevo
+            # (los valores leídos de la base ya son Decimal y no nulos)
+            inputs = {
+                "list_price": product.list_price,
+                "discount_1": product.discount_1,
+                "discount_2": product.discount_2,
+                "discount_3": product.discount_3,
+                "extra_cost": product.extra_cost,
+                field_attr: row[field_attr],
+            }
+            row["net_price"], row["sale_price"], row["discount_display"] = compute_prices(
+                inputs["list_price"],
+                inputs["discount_1"],
+                inputs["discount_2"],
+                inputs["discount_3"],
+                inputs["extra_cost"],
+                product.iva_rate,
+            )
+            if row["sale_price"] != product.sale_price:
+                history.append({
+                    "product_id": product.id,
+                    "changed_by": current_user.id,
+                    "old_list_price": product.list_price,
+                    "old_net_price": product.net_price,
+                    "old_sale_price": product.sale_price,
+                    "new_list_price": inputs["list_price"],
+                    "new_net_price": row["net_price"],
+                    "new_sale_price": row["sale_price"],
+                    "change_reason": "Actualización masiva",
+                })
         
-        count += 1
+        rows.append(row)
     
+    count = len(rows)
+    await ProductService(db).bulk_update(business_id, rows, columns, history)
     await db.commit()
     
     return PriceUpdateApplyResponse(
@@ -6,7 +6,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -76,7 +76,7 @@ async def download_inventory_count_pdf(
         if first.category:
             category_name = first.category.name
 
-    pdf_bytes = pdf_service.generate_inventory_count_pdf(
+    pdf_bytes = await pdf_service.generate_inventory_count_pdf(
         business=business,
         products=products,
         supplier_name=supplier_name,
@@ -91,8 +91,8 @@ async def download_inventory_count_pdf(
     from datetime import date
     filename = f"planilla_conteo{suffix}_{date.today().strftime('%Y_%m_%d')}.pdf"
 
-    return StreamingResponse(
-        iter([pdf_bytes]),
+    return Response(
+        content=pdf_bytes,
         media_type="application/pdf",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
@@ -257,7 +257,7 @@ async def download_purchase_order_pdf(
     # Cargar objeto Business completo para el PDF
     business = await db.get(Business, current_business)
 
-    pdf_bytes = pdf_service.generate_purchase_order_pdf(
+    pdf_bytes = await pdf_service.generate_purchase_order_pdf(
         business=business,
         order=order,
     )
@@ -266,8 +266,8 @@ async def download_purchase_order_pdf(
     supplier_slug = (getattr(order, 'supplier_name', None) or "sin_proveedor").replace(" ", "_")[:20]
     filename = f"orden_pedido_{supplier_slug}_{date.today().strftime('%Y_%m_%d')}.pdf"
 
-    return StreamingResponse(
-        iter([pdf_bytes]),
+    return Response(
+        content=pdf_bytes,
         media_type="application/pdf",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
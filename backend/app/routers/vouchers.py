@@ -3,15 +3,14 @@ Router de Comprobantes.
 """
 from typing import Optional
 from uuid import UUID
-import io
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.voucher import Voucher, VoucherType, VoucherStatus
-from app.models.business import Business
+from app.models.business import AFIP_CREDENTIALS, Business
 from app.models.client import Client
 from app.schemas.base import PaginatedResponse
 from app.schemas.voucher import VoucherCreate, VoucherResponse, ConvertQuotationToInvoice
@@ -21,10 +20,7 @@ from app.services.afip_sdk_service import AfipSdkService
 from app.services.cash_register_service import get_open_cash_register
 from app.utils.security import get_current_business, get_current_user
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
-
-# Tipos de comprobante que requieren caja abierta para emitirse
-INVOICE_TYPES = {VoucherType.INVOICE_A, VoucherType.INVOICE_B, VoucherType.INVOICE_C}
+from sqlalchemy.orm import selectinload, undefer_group
 
 router = APIRouter(prefix="/vouchers", tags=["Ventas"])
 
@@ -52,8 +48,8 @@ async def list_vouchers(
     
     pages = (total + per_page - 1) // per_page if per_page else 0
     
-    return PaginatedResponse(
-        items=[VoucherResponse.model_validate(v) for v in vouchers],
+    return PaginatedResponse[VoucherResponse](
+        items=vouchers,
         total=total,
         page=page,
         per_page=per_page,
@@ -74,7 +70,7 @@ async def create_voucher(
     Las facturas (A, B, C) requieren que haya una caja abierta.
     """
     # Validar caja abierta para facturas
-    if data.voucher_type in INVOICE_TYPES:
+    if VoucherType.is_invoice(data.voucher_type):
         open_register = await get_open_cash_register(db, business_id)
         if not open_register:
             raise HTTPException(
@@ -108,8 +104,8 @@ async def get_voucher_pdf(
         pdf_bytes = await service.generate_pdf(voucher_id, business_id)
         print(f"✅ [PDF] PDF generado exitosamente. Tamaño: {len(pdf_bytes)} bytes")
         
-        return StreamingResponse(
-            io.BytesIO(pdf_bytes),
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"inline; filename=voucher_{voucher_id}.pdf"
@@ -188,8 +184,8 @@ async def list_pending_quotations(
 
     pages = (total + per_page - 1) // per_page if per_page else 0
 
-    return PaginatedResponse(
-        items=[VoucherResponse.model_validate(v) for v in vouchers],
+    return PaginatedResponse[VoucherResponse](
+        items=vouchers,
         total=total,
         page=page,
         per_page=per_page,
@@ -288,7 +284,13 @@ async def create_credit_note(
         )
         
         # 2. Obtener business y cliente para emitir en AFIP
-        business = await db.get(Business, business_id)
+        # populate_existing: el negocio ya está en la sesión (numeración) sin las credenciales
+        business = await db.get(
+            Business,
+            business_id,
+            options=[undefer_group(AFIP_CREDENTIALS)],
+            populate_existing=True,
+        )
         if not business:
             raise ValueError("Negocio no encontrado")
         
@@ -320,18 +322,15 @@ async def create_credit_note(
             raise ValueError(f"Error al emitir NC en AFIP: {afip_result.get('error')}")
         
         # 5. Actualizar la NC con los datos de AFIP
-        from datetime import datetime
+        from datetime import date
         
         credit_note.cae = afip_result.get("CAE")
         
         # Convertir CAEFchVto de string a date
         cae_expiration_str = afip_result.get("CAEFchVto")
         if cae_expiration_str:
-            # Formato: "2026-02-23" o "20260223"
-            if "-" in cae_expiration_str:
-                credit_note.cae_expiration = datetime.strptime(cae_expiration_str, "%Y-%m-%d").date()
-            else:
-                credit_note.cae_expiration = datetime.strptime(cae_expiration_str, "%Y%m%d").date()
+            # Formato: "2026-02-23" o "20260223" (fromisoformat acepta ambos desde 3.11)
+            credit_note.cae_expiration = date.fromisoformat(cae_expiration_str)
         
         credit_note.number = str(afip_result.get("voucherNumber")).zfill(8)
         
@@ -2,7 +2,9 @@
 Schemas para Business (Negocio).
 """
 from typing import Optional
-from pydantic import BaseModel, Field
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BusinessBase(BaseModel):
@@ -38,8 +40,10 @@ class BusinessUpdate(BaseModel):
 
 
 class BusinessResponse(BaseModel):
-    """Schema de respuesta para Business."""
-    id: str
+    """Schema de respuesta para Business (se valida directo desde el ORM)."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID  # En JSON se serializa como string, igual que antes
     name: str
     cuit: str
     tax_condition: str
@@ -55,6 +59,3 @@ class BusinessResponse(BaseModel):
     
     # Configuración ARCA (solo lectura, se edita en /arca)
     arca_environment: Optional[str]
-    
-    class Config:
-        from_attributes = True
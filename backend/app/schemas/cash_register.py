@@ -109,7 +109,7 @@ class CashRegisterSummaryResponse(BaseModel):
     """Respuesta resumida de la caja (sin lista de movimientos)."""
     id: UUID
     status: CashRegisterStatus
-    is_expired: bool
+    is_expired: bool = False  # el historial solo lista cajas cerradas
     opening_amount: Decimal
     opened_at: datetime
     closed_at: Optional[datetime]
@@ -10,12 +10,11 @@ from google.oauth2 import id_token
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import get_settings
+from app.config import SETTINGS
 from app.models.business import Business
 from app.models.user import User
 from app.utils.security import create_access_token, create_refresh_token, verify_token
 
-settings = get_settings()
 
 
 class AuthService:
@@ -34,11 +33,11 @@ class AuthService:
             idinfo = id_token.verify_oauth2_token(
                 token,
                 google_requests.Request(),
-                settings.GOOGLE_CLIENT_ID,
+                SETTINGS.GOOGLE_CLIENT_ID,
             )
 
             # Verificar que el token es para nuestra app
-            if idinfo["aud"] != settings.GOOGLE_CLIENT_ID:
+            if idinfo["aud"] != SETTINGS.GOOGLE_CLIENT_ID:
                 return None
 
             return {
@@ -106,9 +105,9 @@ class AuthService:
                     "https://oauth2.googleapis.com/token",
                     data={
                         "code": code,
-                        "client_id": settings.GOOGLE_CLIENT_ID,
-                        "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                        "redirect_uri": settings.GOOGLE_REDIRECT_URI,
+                        "client_id": SETTINGS.GOOGLE_CLIENT_ID,
+                        "client_secret": SETTINGS.GOOGLE_CLIENT_SECRET,
+                        "redirect_uri": SETTINGS.GOOGLE_REDIRECT_URI,
                         "grant_type": "authorization_code",
                     },
                 )
@@ -126,7 +125,7 @@ class AuthService:
                 idinfo = id_token.verify_oauth2_token(
                     id_token_str,
                     google_requests.Request(),
-                    settings.GOOGLE_CLIENT_ID,
+                    SETTINGS.GOOGLE_CLIENT_ID,
                 )
 
                 return {
@@ -4,14 +4,16 @@ Contiene toda la lógica de negocio de apertura, cierre y movimientos de caja.
 """
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import select, and_, desc
+from pydantic import TypeAdapter
+from sqlalchemy import select, and_, desc, func, type_coerce
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.models.base import utcnow
 from app.models.cash_register import (
     CashMovement,
     CashMovementType,
@@ -19,6 +21,7 @@ from app.models.cash_register import (
     CashRegister,
     CashRegisterStatus,
 )
+from app.models.types import Money
 from app.models.user import User
 from app.schemas.cash_register import (
     CashCloseRequest,
@@ -29,15 +32,20 @@ from app.schemas.cash_register import (
     CashSummaryResponse,
     PaymentMethodSummary,
 )
+from app.utils.db import commit_unique
 
 EXPIRED_THRESHOLD_HOURS = 24
 
+# Valida la lista de movimientos ORM de una sola vez en pydantic-core
+# (from_attributes), sin armar cada respuesta campo por campo en Python
+_MOVEMENTS_ADAPTER = TypeAdapter(List[CashMovementResponse])
+
 
 def _is_expired(cash_register: CashRegister) -> bool:
     """Calcula si una caja abierta está vencida (> 24hs)."""
     if cash_register.status != CashRegisterStatus.OPEN:
         return False
-    threshold = datetime.utcnow() - timedelta(hours=EXPIRED_THRESHOLD_HOURS)
+    threshold = utcnow() - timedelta(hours=EXPIRED_THRESHOLD_HOURS)
     return cash_register.opened_at < threshold
 
 
@@ -45,19 +53,7 @@ def _to_response(cash_register: CashRegister, with_movements: bool = True) -> Ca
     """Convierte un CashRegister ORM a su schema de respuesta."""
     movements = []
     if with_movements and cash_register.movements:
-        movements = [
-            CashMovementResponse(
-                id=m.id,
-                type=m.type,
-                payment_method=m.payment_method,
-                amount=m.amount,
-                description=m.description,
-                voucher_id=m.voucher_id,
-                created_by=m.created_by,
-                created_at=m.created_at,
-            )
-            for m in cash_register.movements
-        ]
+        movements = _MOVEMENTS_ADAPTER.validate_python(cash_register.movements)
 
     return CashRegisterResponse(
         id=cash_register.id,
@@ -121,30 +117,33 @@ async def open_cash(
     """
     Abre una nueva caja para el negocio.
     Reglas:
-    - Solo puede haber una caja abierta a la vez.
+    - Solo puede haber una caja abierta a la vez (uq_cash_registers_business_open).
     - Si hay una caja vencida (>24hs), el operador debe cerrarla primero.
-    """
-    existing = await get_open_cash_register(db, business_id)
-    if existing:
-        if _is_expired(existing):
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Hay una caja vencida (más de 24hs abierta). Cerrala antes de abrir una nueva.",
-            )
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Ya hay una caja abierta. Cerrala antes de abrir una nueva.",
-        )
 
+    Se inserta directamente: la caja existente solo se busca si el índice
+    único rechaza el INSERT, para armar el mensaje de error.
+    """
     register = CashRegister(
         business_id=business_id,
         opened_by=current_user.id,
         status=CashRegisterStatus.OPEN,
         opening_amount=data.opening_amount,
-        opened_at=datetime.utcnow(),
+        opened_at=utcnow(),
     )
     db.add(register)
-    await db.commit()
+    try:
+        await commit_unique(
+            db,
+            {"uq_cash_registers_business_open": "Ya hay una caja abierta. Cerrala antes de abrir una nueva."},
+        )
+    except ValueError as e:
+        existing = await get_open_cash_register(db, business_id)
+        if existing and _is_expired(existing):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Hay una caja vencida (más de 24hs abierta). Cerrala antes de abrir una nueva.",
+            ) from e
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
     await db.refresh(register)
 
     # Recargar con relaciones
@@ -194,7 +193,7 @@ async def close_cash(
 
     register.status = CashRegisterStatus.CLOSED
     register.closed_by = current_user.id
-    register.closed_at = datetime.utcnow()
+    register.closed_at = utcnow()
     register.counted_cash = data.counted_cash
     register.difference = difference
     register.difference_reason = data.difference_reason
@@ -258,13 +257,14 @@ async def add_movement(
     )
 
 
-async def get_summary(
+async def list_movements(
     db: AsyncSession,
     business_id: UUID,
     cash_register_id: UUID,
-) -> CashSummaryResponse:
+) -> List[CashMovementResponse]:
     """
-    Calcula el resumen de totales de una caja agrupado por método de pago.
+    Lista los movimientos de una caja del negocio.
+    El filtro por business_id de la misma consulta valida la pertenencia.
     """
     result = await db.execute(
         select(CashRegister)
@@ -284,27 +284,76 @@ async def get_summary(
             detail="Caja no encontrada.",
         )
 
-    return _calculate_summary(register)
+    return _MOVEMENTS_ADAPTER.validate_python(register.movements)
+
 
+async def get_summary(
+    db: AsyncSession,
+    business_id: UUID,
+    cash_register_id: UUID,
+) -> CashSummaryResponse:
+    """
+    Calcula el resumen de totales de una caja agrupado por método de pago.
+    """
+    result = await db.execute(
+        select(CashRegister).where(
+            and_(
+                CashRegister.id == cash_register_id,
+                CashRegister.business_id == business_id,
+                CashRegister.deleted_at.is_(None),
+            )
+        )
+    )
+    register = result.scalar_one_or_none()
+    if not register:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Caja no encontrada.",
+        )
+
+    # Totales agrupados en la base: Index Only Scan sobre
+    # ix_cash_movements_register_covering, sin traer los movimientos
+    totals = await db.execute(
+        select(
+            CashMovement.type,
+            CashMovement.payment_method,
+            type_coerce(func.sum(CashMovement.amount), Money()),
+        )
+        .where(CashMovement.cash_register_id == register.id)
+        .group_by(CashMovement.type, CashMovement.payment_method)
+    )
+    return _calculate_summary(register, totals.all())
+
+
+def _calculate_summary(
+    register: CashRegister,
+    totals: Optional[Iterable[Tuple[CashMovementType, CashPaymentMethod, Decimal]]] = None,
+) -> CashSummaryResponse:
+    """
+    Calcula totales por método de pago.
+
+    totals son tuplas (tipo, método, importe), ya agrupadas o no; si no se
+    pasan se usan los movimientos cargados de la caja.
+    """
+    if totals is None:
+        totals = ((mv.type, mv.payment_method, mv.amount) for mv in register.movements)
 
-def _calculate_summary(register: CashRegister) -> CashSummaryResponse:
-    """Calcula totales por método de pago a partir de los movimientos."""
     # Inicializar acumuladores por método
     by_method: dict[CashPaymentMethod, PaymentMethodSummary] = {
         method: PaymentMethodSummary(payment_method=method)
         for method in CashPaymentMethod
     }
 
-    for mv in register.movements:
-        summary = by_method[mv.payment_method]
-        if mv.type == CashMovementType.SALE:
-            summary.total_sales += mv.amount
-        elif mv.type == CashMovementType.PAYMENT_RECEIVED:
-            summary.total_payments_received += mv.amount
-        elif mv.type == CashMovementType.INCOME:
-            summary.total_income += mv.amount
-        elif mv.type == CashMovementType.EXPENSE:
-            summary.total_expense += mv.amount
+    for movement_type, payment_method, amount in totals:
+        summary = by_method[payment_method]
+        if movement_type == CashMovementType.SALE:
+            summary.total_sales += amount
+        elif movement_type == CashMovementType.PAYMENT_RECEIVED:
+            summary.total_payments_received += amount
+        elif movement_type == CashMovementType.INCOME:
+            summary.total_income += amount
+        elif movement_type == CashMovementType.EXPENSE:
+            summary.total_expense += amount
 
     # Calcular neto por método
     for summary in by_method.values():
@@ -384,9 +433,7 @@ async def generate_closure_pdf(
     Genera el PDF de cierre de una caja.
     Funciona tanto para cajas recién cerradas como para histórico.
     """
-    from pathlib import Path
-    from jinja2 import Environment, FileSystemLoader
-    from weasyprint import HTML
+    from app.services.pdf_service import env as jinja_env, render_pdf
     from sqlalchemy import select
     from app.models.business import Business
     from app.models.user import User
@@ -527,9 +574,8 @@ async def generate_closure_pdf(
         "movements": movements_data,
     }
 
-    # Renderizar con Jinja2 y WeasyPrint
-    TEMPLATE_DIR = Path(__file__).parent.parent / "templates" / "pdf"
-    jinja_env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)))
+    # Renderizar con Jinja2 (plantilla compilada y cacheada en el Environment
+    # compartido de pdf_service) y WeasyPrint
     template = jinja_env.get_template("cash_register_closure.html")
     html_content = template.render(**context)
-    return HTML(string=html_content).write_pdf()
+    return await render_pdf(html_content)
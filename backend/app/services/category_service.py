@@ -2,16 +2,22 @@
 Servicio de Categorías.
 Contiene toda la lógica de negocio para categorías jerárquicas.
 """
-from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.models.base import utcnow
 from app.models.category import Category
 from app.schemas.category import CategoryCreate, CategoryListParams, CategoryUpdate
+from app.utils.cache import TTLCache
+from app.utils.pagination import page_total
+
+# Árbol de categorías serializado (JSON) por business_id. Lo invalidan
+# create/update/soft_delete después del commit
+CATEGORY_TREE_CACHE = TTLCache(ttl=300)
 
 
 class CategoryService:
@@ -35,6 +41,7 @@ class CategoryService:
 
         self.db.add(category)
         await self.db.commit()
+        CATEGORY_TREE_CACHE.invalidate(business_id)
         await self.db.refresh(category)
         return category
 
@@ -74,11 +81,6 @@ class CategoryService:
         elif params.root_only:
             base_conditions.append(Category.parent_id.is_(None))
 
-        # Conteo
-        count_query = select(func.count(Category.id)).where(*base_conditions)
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
-
         # Query paginada
         offset = (params.page - 1) * params.per_page
         query = (
@@ -92,23 +94,62 @@ class CategoryService:
         result = await self.db.execute(query)
         categories = list(result.scalars().all())
 
+        total = await page_total(self.db, categories, offset, params.per_page, *base_conditions)
+
         return categories, total
 
-    async def get_tree(self, business_id: UUID) -> list[Category]:
-        """Obtiene el árbol completo de categorías."""
+    async def get_tree(self, business_id: UUID) -> List[Category]:
+        """
+        Obtiene el árbol completo de categorías.
+
+        Trae todas las categorías activas del negocio en una sola consulta y
+        arma el árbol en memoria: subcategories queda cargada en todos los
+        niveles, sin una consulta por nivel.
+        """
         query = (
             select(Category)
-            .options(selectinload(Category.subcategories))
             .where(
                 Category.business_id == business_id,
                 Category.deleted_at.is_(None),
-                Category.parent_id.is_(None),  # Solo categorías raíz
             )
             .order_by(Category.name)
         )
 
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        categories = list(result.scalars().all())
+
+        children: dict[UUID, list[Category]] = {c.id: [] for c in categories}
+        roots = []
+        for category in categories:
+            if category.parent_id is None:
+                roots.append(category)
+            elif category.parent_id in children:
+                children[category.parent_id].append(category)
+        for category in categories:
+            set_committed_value(category, "subcategories", children[category.id])
+
+        return roots
+
+    def _descendants(self, category_id: UUID, business_id: UUID):
+        """
+        CTE recursiva sobre parent_id con los IDs de las subcategorías
+        activas (todos los niveles) de una categoría.
+        """
+        descendants = (
+            select(Category.id)
+            .where(
+                Category.parent_id == category_id,
+                Category.business_id == business_id,
+                Category.deleted_at.is_(None),
+            )
+            .cte("descendants", recursive=True, nesting=True)
+        )
+        return descendants.union_all(
+            select(Category.id).where(
+                Category.parent_id == descendants.c.id,
+                Category.deleted_at.is_(None),
+            )
+        )
 
     async def update(
         self,
@@ -128,12 +169,23 @@ class CategoryService:
             parent = await self.get_by_id(data.parent_id, business_id)
             if not parent:
                 raise ValueError("Categoría padre no encontrada")
+            descendants = self._descendants(category_id, business_id)
+            is_descendant = await self.db.scalar(
+                select(
+                    select(descendants.c.id)
+                    .where(descendants.c.id == data.parent_id)
+                    .exists()
+                )
+            )
+            if is_descendant:
+                raise ValueError("Una categoría no puede moverse dentro de sus subcategorías")
 
         update_data = data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(category, field, value)
 
         await self.db.commit()
+        CATEGORY_TREE_CACHE.invalidate(business_id)
         await self.db.refresh(category)
         return category
 
@@ -146,23 +198,16 @@ class CategoryService:
         if not category:
             return False
 
-        # Eliminar subcategorías recursivamente
-        await self._delete_subcategories(category_id, business_id)
+        # Eliminar subcategorías de todos los niveles en un solo UPDATE
+        descendants = self._descendants(category_id, business_id)
+        await self.db.execute(
+            update(Category)
+            .where(Category.id.in_(select(descendants.c.id)))
+            .values(deleted_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
 
-        category.deleted_at = datetime.utcnow()
+        category.deleted_at = utcnow()
         await self.db.commit()
+        CATEGORY_TREE_CACHE.invalidate(business_id)
         return True
-
-    async def _delete_subcategories(self, parent_id: UUID, business_id: UUID) -> None:
-        """Elimina subcategorías recursivamente."""
-        query = select(Category).where(
-            Category.parent_id == parent_id,
-            Category.business_id == business_id,
-            Category.deleted_at.is_(None),
-        )
-        result = await self.db.execute(query)
-        subcategories = result.scalars().all()
-
-        for subcategory in subcategories:
-            await self._delete_subcategories(subcategory.id, business_id)
-            subcategory.deleted_at = datetime.utcnow()
@@ -2,16 +2,18 @@
 Servicio de Clientes.
 Contiene toda la lógica de negocio para clientes.
 """
-from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.base import utcnow
 from app.models.client import Client
 from app.schemas.client import ClientCreate, ClientListParams, ClientUpdate
+from app.utils.db import commit_unique
+from app.utils.pagination import page_total
 
 
 class ClientService:
@@ -20,6 +22,13 @@ class ClientService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def _commit(self, document_number: str) -> None:
+        """Hace commit; un documento repetido en el negocio se informa como ValueError."""
+        await commit_unique(
+            self.db,
+            {"uq_clients_business_document": f"Ya existe un cliente con el documento '{document_number}'"},
+        )
+
     async def create(self, business_id: UUID, data: ClientCreate) -> Client:
         """Crea un nuevo cliente."""
         client = Client(
@@ -28,7 +37,7 @@ class ClientService:
         )
 
         self.db.add(client)
-        await self.db.commit()
+        await self._commit(client.document_number)
         await self.db.refresh(client)
         return client
 
@@ -89,11 +98,6 @@ class ClientService:
         elif params.has_balance is False:
             base_conditions.append(Client.current_balance == Decimal("0"))
 
-        # Conteo
-        count_query = select(func.count(Client.id)).where(*base_conditions)
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
-
         # Query paginada
         offset = (params.page - 1) * params.per_page
         query = (
@@ -107,6 +111,8 @@ class ClientService:
         result = await self.db.execute(query)
         clients = list(result.scalars().all())
 
+        total = await page_total(self.db, clients, offset, params.per_page, *base_conditions)
+
         return clients, total
 
     async def update(
@@ -124,7 +130,7 @@ class ClientService:
         for field, value in update_data.items():
             setattr(client, field, value)
 
-        await self.db.commit()
+        await self._commit(client.document_number)
         await self.db.refresh(client)
         return client
 
@@ -134,7 +140,7 @@ class ClientService:
         if not client:
             return False
 
-        client.deleted_at = datetime.utcnow()
+        client.deleted_at = utcnow()
         await self.db.commit()
         return True
 
@@ -11,7 +11,7 @@ import pandas as pd
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.product import Product
+from app.models.product import Product, compute_prices
 from app.models.category import Category
 from app.models.supplier import Supplier
 from app.schemas.product import ProductCreate, ProductUpdate
@@ -50,23 +50,7 @@ class ExcelService:
     def _calculate_prices(self, list_price: Decimal, d1: Decimal, d2: Decimal, d3: Decimal, 
                          extra_cost: Decimal, iva_rate: Decimal) -> Tuple[Decimal, Decimal, str]:
         """Calcula precio neto y final, igual que el modelo Product."""
-        # Precio con bonificaciones (neto base)
-        net_base = list_price * (1 - d1 / 100) * (1 - d2 / 100) * (1 - d3 / 100)
-        
-        # Aplicar cargo extra sobre el neto
-        net_with_extra = net_base * (1 + extra_cost / 100)
-        
-        # Precio final con IVA
-        sale = net_with_extra * (1 + iva_rate / 100)
-        
-        net_price = round(net_with_extra, 2)
-        sale_price = round(sale, 2)
-        
-        # Formato de descuento para mostrar
-        discounts = [d for d in [d1, d2, d3] if d > 0]
-        discount_display = "+".join([str(int(d)) for d in discounts]) if discounts else None
-        
-        return net_price, sale_price, discount_display
+        return compute_prices(list_price, d1, d2, d3, extra_cost, iva_rate)
 
     async def preview_import(self, business_id: UUID, file_content: bytes) -> ImportPreviewResponse:
         """
@@ -233,6 +217,8 @@ class ExcelService:
         created = 0
         updated = 0
         errors: List[str] = []
+        # Códigos creados en este lote: uq_products_business_code rechazaría el commit entero
+        new_codes: set = set()
         
         for row in request.rows:
             # Saltar filas con errores
@@ -242,6 +228,11 @@ class ExcelService:
             
             try:
                 if row.is_new:
+                    if row.code in new_codes:
+                        errors.append(f"Fila {row.row_number}: Código '{row.code}' repetido en el archivo")
+                        continue
+                    new_codes.add(row.code)
+
                     # Crear nuevo producto
                     new_product = Product(
                         business_id=business_id,
@@ -339,6 +330,8 @@ class ExcelService:
             "updated": 0,
             "errors": []
         }
+        # Productos creados en este lote, por código (sin autoflush no aparecen en el SELECT)
+        created_by_code: dict = {}
 
         for index, row in df.iterrows():
             summary["processed"] += 1
@@ -379,6 +372,9 @@ class ExcelService:
                 result = await self.db.execute(query)
                 existing_product = result.scalar_one_or_none()
 
+                if existing_product is None:
+                    existing_product = created_by_code.get(code)
+
                 if existing_product:
                     # Actualizar
                     for key, value in product_data.items():
@@ -392,6 +388,7 @@ class ExcelService:
                     new_product = Product(**product_data)
                     new_product.calculate_prices()
                     self.db.add(new_product)
+                    created_by_code[code] = new_product
                     summary["created"] += 1
 
             except Exception as e:
@@ -646,7 +643,7 @@ class ExcelService:
         Elimina TODOS los productos de un negocio (soft delete).
         Retorna un resumen de la operación.
         """
-        from datetime import datetime
+        from app.models.base import utcnow
         
         query = select(Product).where(
             Product.business_id == business_id,
@@ -657,7 +654,7 @@ class ExcelService:
         products = result.scalars().all()
         
         count = 0
-        now = datetime.utcnow()
+        now = utcnow()
         
         for product in products:
             product.deleted_at = now
@@ -3,6 +3,7 @@ Servicio de generación de PDF.
 Utiliza Jinja2 y WeasyPrint para generar comprobantes.
 Genera QR de AFIP para facturas electrónicas.
 """
+import asyncio
 import base64
 import io
 import json
@@ -14,19 +15,32 @@ import qrcode
 from jinja2 import Environment, FileSystemLoader
 from weasyprint import HTML
 
-from app.config import get_settings
+from app.config import SETTINGS
 
-settings = get_settings()
-
-# Configurar Jinja2
+# Configurar Jinja2. Las plantillas se compilan una vez y quedan en la caché
+# del Environment; fuera de DEBUG no se vuelve a hacer stat del archivo en
+# cada get_template (en producción las plantillas solo cambian con un deploy)
 TEMPLATE_DIR = Path(__file__).parent.parent / "templates" / "pdf"
-env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)))
+env = Environment(
+    loader=FileSystemLoader(str(TEMPLATE_DIR)),
+    auto_reload=SETTINGS.DEBUG,
+)
+
+
+async def render_pdf(html: str) -> bytes:
+    """
+    Convierte HTML ya renderizado a PDF con WeasyPrint.
+
+    WeasyPrint es sincrónico y maqueta el documento completo antes de escribir
+    el primer byte: se ejecuta en un hilo para no bloquear el event loop.
+    """
+    return await asyncio.to_thread(HTML(string=html).write_pdf)
 
 
 class PdfService:
     """Servicio para generar PDFs."""
 
-    def generate_voucher_pdf(self, context: Dict[str, Any]) -> bytes:
+    async def generate_voucher_pdf(self, context: Dict[str, Any]) -> bytes:
         """
         Genera un PDF de comprobante (Cotización, Remito).
         
@@ -44,15 +58,14 @@ class PdfService:
         try:
             template = env.get_template("voucher.html")
             html_content = template.render(**context)
-            pdf_bytes = HTML(string=html_content).write_pdf()
-            return pdf_bytes
+            return await render_pdf(html_content)
         except Exception as e:
             print(f"Error al generar PDF: {str(e)}")
             import traceback
             traceback.print_exc()
             raise
 
-    def generate_invoice_arca_pdf(self, context: Dict[str, Any]) -> bytes:
+    async def generate_invoice_arca_pdf(self, context: Dict[str, Any]) -> bytes:
         """
         Genera un PDF de factura electrónica ARCA/AFIP.
         Usa el template específico con CAE, QR y formato fiscal.
@@ -71,8 +84,7 @@ class PdfService:
         try:
             template = env.get_template("invoice_arca.html")
             html_content = template.render(**context)
-            pdf_bytes = HTML(string=html_content).write_pdf()
-            return pdf_bytes
+            return await render_pdf(html_content)
         except Exception as e:
             print(f"Error al generar PDF factura ARCA: {str(e)}")
             import traceback
@@ -159,7 +171,7 @@ class PdfService:
 
         return f"data:image/png;base64,{img_base64}"
 
-    def generate_inventory_count_pdf(
+    async def generate_inventory_count_pdf(
         self,
         business,
         products: list,
@@ -210,14 +222,14 @@ class PdfService:
 
             template = env.get_template("inventory_count.html")
             html_content = template.render(**context)
-            return HTML(string=html_content).write_pdf()
+            return await render_pdf(html_content)
         except Exception as e:
             print(f"Error al generar planilla de conteo: {e}")
             import traceback
             traceback.print_exc()
             raise
 
-    def generate_purchase_order_pdf(
+    async def generate_purchase_order_pdf(
         self,
         business,
         order,
@@ -265,7 +277,7 @@ class PdfService:
 
             template = env.get_template("purchase_order.html")
             html_content = template.render(**context)
-            return HTML(string=html_content).write_pdf()
+            return await render_pdf(html_content)
         except Exception as e:
             print(f"Error al generar PDF orden de pedido: {e}")
             import traceback
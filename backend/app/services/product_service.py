@@ -2,16 +2,21 @@
 Servicio de Productos.
 Contiene toda la lógica de negocio para productos.
 """
-from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import column, func, insert, or_, select, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.base import utcnow
 from app.models.product import Product
 from app.models.price_history import PriceHistory
 from app.schemas.product import ProductCreate, ProductListParams, ProductUpdate
+from app.utils.db import commit_unique
+
+
+# Filas por sentencia en bulk_update (PostgreSQL admite hasta 32767 parámetros)
+BULK_UPDATE_BATCH_SIZE = 1000
 
 
 class ProductService:
@@ -20,6 +25,13 @@ class ProductService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def _commit(self, code: str) -> None:
+        """Hace commit; un código repetido en el negocio se informa como ValueError."""
+        await commit_unique(
+            self.db,
+            {"uq_products_business_code": f"Ya existe un producto con el código '{code}'"},
+        )
+
     async def create(self, business_id: UUID, data: ProductCreate) -> Product:
         """Crea un nuevo producto con cálculo automático de precios."""
         product = Product(
@@ -29,7 +41,7 @@ class ProductService:
         product.calculate_prices()
 
         self.db.add(product)
-        await self.db.commit()
+        await self._commit(product.code)
         await self.db.refresh(product)
         return product
 
@@ -98,7 +110,7 @@ class ProductService:
             base_conditions.append(Product.current_stock <= Product.minimum_stock)
 
         # Query de conteo
-        count_query = select(func.count(Product.id)).where(*base_conditions)
+        count_query = select(func.count()).where(*base_conditions)
         count_result = await self.db.execute(count_query)
         total = count_result.scalar() or 0
 
@@ -159,17 +171,53 @@ class ProductService:
                 )
                 self.db.add(history)
 
-        await self.db.commit()
+        await self._commit(product.code)
         await self.db.refresh(product)
         return product
 
+    async def bulk_update(
+        self,
+        business_id: UUID,
+        rows: List[Dict[str, Any]],
+        columns: Sequence[str],
+        history: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Actualiza muchos productos con sentencias por conjunto, sin commit.
+
+        rows son dicts con "id" y los valores nuevos de `columns`. Se envían
+        en lotes como UPDATE products ... FROM (VALUES ...) v WHERE id = v.id,
+        una sentencia por lote en lugar de un UPDATE por producto. history
+        son filas de PriceHistory y van en INSERT multi-fila.
+        """
+        table = Product.__table__
+        for start in range(0, len(rows), BULK_UPDATE_BATCH_SIZE):
+            batch = rows[start:start + BULK_UPDATE_BATCH_SIZE]
+            new_values = values(
+                column("id", table.c.id.type),
+                *(column(name, table.c[name].type) for name in columns),
+                name="v",
+            ).data([(row["id"], *(row[name] for name in columns)) for row in batch])
+            await self.db.execute(
+                update(Product)
+                .where(
+                    Product.id == new_values.c.id,
+                    Product.business_id == business_id,
+                )
+                .values({name: new_values.c[name] for name in columns})
+                .execution_options(synchronize_session=False)
+            )
+
+        if history:
+            await self.db.execute(insert(PriceHistory), history)
+
     async def soft_delete(self, product_id: UUID, business_id: UUID) -> bool:
         """Elimina un producto (soft delete)."""
         product = await self.get_by_id(product_id, business_id)
         if not product:
             return False
 
-        product.deleted_at = datetime.utcnow()
+        product.deleted_at = utcnow()
         await self.db.commit()
         return True
 
@@ -2,22 +2,24 @@
 Servicio de Órdenes de Pedido.
 Gestiona el ciclo completo: conteo físico → orden → confirmación.
 """
-from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Iterable, List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, selectinload
 
+from app.models.base import utcnow
 from app.models.business import Business
 from app.models.category import Category
 from app.models.product import Product
 from app.models.purchase_order import PurchaseOrder, PurchaseOrderItem, PurchaseOrderStatus
 from app.models.supplier import Supplier
+from app.models.types import round_cents
 from app.models.user import User
-from app.schemas.purchase_order import PurchaseOrderCreate, PurchaseOrderUpdate
+from app.models.voucher_counter import CounterType, VoucherCounter
+from app.schemas.purchase_order import PurchaseOrderCreate, PurchaseOrderItemCreate, PurchaseOrderUpdate
 
 
 class PurchaseOrderService:
@@ -42,7 +44,7 @@ class PurchaseOrderService:
         d3 = Decimal(str(product.discount_3 or 0))
 
         cost = list_price * (1 - d1 / 100) * (1 - d2 / 100) * (1 - d3 / 100)
-        return round(cost, 2)
+        return round_cents(cost)
 
     async def _enrich_item(self, item: PurchaseOrderItem) -> PurchaseOrderItem:
         """Agrega datos del producto, categoría y proveedor al ítem para respuestas."""
@@ -68,6 +70,36 @@ class PurchaseOrderService:
             await self._enrich_item(item)
         return order
 
+    async def _insert_items(
+        self,
+        order_id: UUID,
+        items_data: Iterable[PurchaseOrderItemCreate],
+    ) -> None:
+        """
+        Inserta los ítems de una orden en un único INSERT multi-fila, con los
+        totales por ítem ya calculados. No construye objetos ORM: quien llama
+        recarga la orden con populate_existing.
+        """
+        rows = []
+        for item_data in items_data:
+            subtotal, iva_amount, total = PurchaseOrderItem.compute_totals(
+                item_data.unit_cost, item_data.quantity_to_order, item_data.iva_rate
+            )
+            rows.append({
+                "purchase_order_id": order_id,
+                "product_id": item_data.product_id,
+                "system_stock": item_data.system_stock,
+                "counted_stock": item_data.counted_stock,
+                "quantity_to_order": item_data.quantity_to_order,
+                "unit_cost": item_data.unit_cost,
+                "iva_rate": item_data.iva_rate,
+                "subtotal": subtotal,
+                "iva_amount": iva_amount,
+                "total": total,
+            })
+        if rows:
+            await self.db.execute(insert(PurchaseOrderItem), rows)
+
     # ------------------------------------------------------------------
     # CRUD
     # ------------------------------------------------------------------
@@ -85,9 +117,9 @@ class PurchaseOrderService:
         """
         # Obtener el business para leer el punto de venta y asignar numeración correlativa
         business = await self.db.get(Business, business_id)
-        last_num = int(business.last_purchase_order_number or "0")
-        next_num = last_num + 1
-        business.last_purchase_order_number = str(next_num).zfill(8)
+        next_num = await VoucherCounter.next_number(
+            self.db, business_id, CounterType.PURCHASE_ORDER
+        )
 
         order = PurchaseOrder(
             business_id=business_id,
@@ -102,41 +134,25 @@ class PurchaseOrderService:
         self.db.add(order)
         await self.db.flush()  # Para obtener el ID antes de agregar ítems
 
-        for item_data in data.items:
-            item = PurchaseOrderItem(
-                purchase_order_id=order.id,
-                product_id=item_data.product_id,
-                system_stock=item_data.system_stock,
-                counted_stock=item_data.counted_stock,
-                quantity_to_order=item_data.quantity_to_order,
-                unit_cost=item_data.unit_cost,
-                iva_rate=item_data.iva_rate,
-            )
-            item.recalculate()
-            self.db.add(item)
+        await self._insert_items(order.id, data.items)
 
-        await self.db.flush()
-        await self.db.refresh(order)
-
-        # Recargar con relaciones para recalcular totales
-        result = await self.db.execute(
-            select(PurchaseOrder)
-            .options(selectinload(PurchaseOrder.items))
-            .where(PurchaseOrder.id == order.id)
-        )
-        order = result.scalar_one()
-        order.recalculate_totals()
+        # Totales del encabezado sumados en la base, sin recargar los ítems
+        await PurchaseOrder.recalculate_totals_in_db(self.db, order.id)
 
         await self.db.commit()
-        await self.db.refresh(order)
-        return await self.get_by_id(order.id, business_id)
+        return await self.get_by_id(order.id, business_id, populate_existing=True)
 
     async def get_by_id(
         self,
         order_id: UUID,
         business_id: UUID,
+        populate_existing: bool = False,
     ) -> Optional[PurchaseOrder]:
-        """Obtiene una orden de pedido con todos sus ítems y relaciones."""
+        """
+        Obtiene una orden de pedido con todos sus ítems y relaciones.
+        populate_existing=True pisa lo que ya esté cargado en la sesión
+        (tras escribir con UPDATE directo o reemplazar los ítems).
+        """
         result = await self.db.execute(
             select(PurchaseOrder)
             .options(
@@ -153,6 +169,7 @@ class PurchaseOrderService:
                 PurchaseOrder.business_id == business_id,
                 PurchaseOrder.deleted_at.is_(None),
             )
+            .execution_options(populate_existing=populate_existing)
         )
         order = result.scalar_one_or_none()
         if order:
@@ -169,44 +186,57 @@ class PurchaseOrderService:
         per_page: int = 20,
     ) -> dict:
         """Lista órdenes de pedido con filtros y paginación."""
+        # El listado solo necesita la cantidad de ítems: se cuenta en SQL
+        # en lugar de cargar la colección (noload anula el lazy="selectin")
+        items_count = (
+            select(func.count())
+            .where(PurchaseOrderItem.purchase_order_id == PurchaseOrder.id)
+            .correlate(PurchaseOrder)
+            .scalar_subquery()
+        )
+        base_conditions = [
+            PurchaseOrder.business_id == business_id,
+            PurchaseOrder.deleted_at.is_(None),
+        ]
+
+        if supplier_id:
+            base_conditions.append(PurchaseOrder.supplier_id == supplier_id)
+        if category_id:
+            base_conditions.append(PurchaseOrder.category_id == category_id)
+        if status:
+            base_conditions.append(PurchaseOrder.status == status)
+
         base_query = (
             select(PurchaseOrder)
             .options(
                 selectinload(PurchaseOrder.supplier),
                 selectinload(PurchaseOrder.category),
                 selectinload(PurchaseOrder.created_by_user),
-                selectinload(PurchaseOrder.items),
-            )
-            .where(
-                PurchaseOrder.business_id == business_id,
-                PurchaseOrder.deleted_at.is_(None),
+                noload(PurchaseOrder.items),
             )
+            .where(*base_conditions)
         )
 
-        if supplier_id:
-            base_query = base_query.where(PurchaseOrder.supplier_id == supplier_id)
-        if category_id:
-            base_query = base_query.where(PurchaseOrder.category_id == category_id)
-        if status:
-            base_query = base_query.where(PurchaseOrder.status == status)
-
-        # Total
+        # Total: COUNT directo sobre la tabla con los mismos filtros, no sobre
+        # una subconsulta con todas las columnas de la orden
         count_result = await self.db.execute(
-            select(func.count()).select_from(base_query.subquery())
+            select(func.count()).where(*base_conditions)
         )
         total = count_result.scalar_one()
 
         # Paginación
         offset = (page - 1) * per_page
         result = await self.db.execute(
-            base_query.order_by(PurchaseOrder.created_at.desc())
+            base_query.add_columns(items_count.label("items_count"))
+            .order_by(PurchaseOrder.created_at.desc())
             .offset(offset)
             .limit(per_page)
         )
-        orders = result.scalars().all()
+        rows = result.all()
+        orders = [order for order, _ in rows]
 
         # Enriquecer con nombres
-        for order in orders:
+        for order, count in rows:
             if order.supplier:
                 order.supplier_name = order.supplier.name
             if order.category:
@@ -215,7 +245,7 @@ class PurchaseOrderService:
                 order.created_by_name = (
                     order.created_by_user.name or order.created_by_user.email
                 )
-            order.items_count = len(order.items)
+            order.items_count = count
 
         return {
             "items": orders,
@@ -250,32 +280,13 @@ class PurchaseOrderService:
                 await self.db.delete(item)
             await self.db.flush()
 
-            for item_data in data.items:
-                item = PurchaseOrderItem(
-                    purchase_order_id=order.id,
-                    product_id=item_data.product_id,
-                    system_stock=item_data.system_stock,
-                    counted_stock=item_data.counted_stock,
-                    quantity_to_order=item_data.quantity_to_order,
-                    unit_cost=item_data.unit_cost,
-                    iva_rate=item_data.iva_rate,
-                )
-                item.recalculate()
-                self.db.add(item)
-
-            await self.db.flush()
-
-            # Recargar ítems para recalcular totales
-            result = await self.db.execute(
-                select(PurchaseOrder)
-                .options(selectinload(PurchaseOrder.items))
-                .where(PurchaseOrder.id == order.id)
-            )
-            order = result.scalar_one()
-            order.recalculate_totals()
+            await self._insert_items(order.id, data.items)
+            await PurchaseOrder.recalculate_totals_in_db(self.db, order.id)
 
         await self.db.commit()
-        return await self.get_by_id(order_id, business_id)
+        # populate_existing: la colección cargada al inicio todavía tiene los
+        # ítems eliminados y el encabezado los totales anteriores
+        return await self.get_by_id(order_id, business_id, populate_existing=True)
 
     async def confirm(
         self,
@@ -292,7 +303,7 @@ class PurchaseOrderService:
             raise ValueError("La orden no tiene ítems")
 
         order.status = PurchaseOrderStatus.CONFIRMED
-        order.confirmed_at = datetime.utcnow()
+        order.confirmed_at = utcnow()
         await self.db.commit()
         return await self.get_by_id(order_id, business_id)
 
@@ -316,7 +327,7 @@ class PurchaseOrderService:
         business_id: UUID,
         supplier_id: Optional[UUID] = None,
         category_id: Optional[UUID] = None,
-    ) -> list[Product]:
+    ) -> List[Product]:
         """
         Retorna los productos activos para generar la planilla de conteo.
         Filtra por proveedor y/o categoría.
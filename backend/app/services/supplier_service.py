@@ -2,7 +2,6 @@
 Servicio de Proveedores.
 Contiene toda la lógica de negocio para proveedores.
 """
-from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
@@ -10,6 +9,7 @@ from sqlalchemy import delete, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.models.base import utcnow
 from app.models.supplier import Supplier
 from app.models.category import Category
 from app.schemas.supplier import SupplierCreate, SupplierListParams, SupplierUpdate
@@ -101,7 +101,7 @@ class SupplierService:
             base_conditions.append(search_filter)
 
         # Conteo
-        count_query = select(func.count(Supplier.id)).where(*base_conditions)
+        count_query = select(func.count()).where(*base_conditions)
         count_result = await self.db.execute(count_query)
         total = count_result.scalar() or 0
 
@@ -178,6 +178,6 @@ class SupplierService:
         if not supplier:
             return False
 
-        supplier.deleted_at = datetime.utcnow()
+        supplier.deleted_at = utcnow()
         await self.db.commit()
         return True
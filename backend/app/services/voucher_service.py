@@ -8,17 +8,27 @@ from uuid import UUID
 
 from sqlalchemy import desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer_group
 
 from app.models.business import Business
 from app.models.client import Client
 from app.models.product import Product
 from app.models.user import User
-from app.models.voucher import Voucher, VoucherStatus, VoucherType
+from app.models.voucher import ARCA_PAYLOAD, VOUCHER_LETTERS, Voucher, VoucherStatus, VoucherType
+from app.models.voucher_counter import CounterType, VoucherCounter
 from app.models.voucher_item import VoucherItem
 from app.schemas.voucher import VoucherCreate
 from app.services.pdf_service import pdf_service
 
+# Tipos de comprobante con numeración correlativa propia (ver VoucherCounter)
+NUMBERED_TYPES = {
+    CounterType.QUOTATION.value,
+    CounterType.RECEIPT.value,
+    CounterType.INVOICE_A.value,
+    CounterType.INVOICE_B.value,
+    CounterType.INVOICE_C.value,
+}
+
 
 class VoucherService:
     def __init__(self, db: AsyncSession):
@@ -32,34 +42,18 @@ class VoucherService:
         if not client or client.business_id != business_id:
             raise ValueError("Cliente no encontrado")
 
-        # 2. Obtener business para numeración correlativa
+        # 2. Obtener business para el punto de venta
         business = await self.db.get(Business, business_id)
         if not business:
             raise ValueError("Negocio no encontrado")
         
-        # 3. Obtener siguiente número según tipo
+        # 3. Obtener siguiente número según tipo (las NC/ND no tienen serie propia)
         voucher_type_str = data.voucher_type.value if hasattr(data.voucher_type, 'value') else str(data.voucher_type)
         
-        if voucher_type_str == "quotation":
-            last_number = int(business.last_quotation_number or "0")
-            next_number = last_number + 1
-            business.last_quotation_number = str(next_number).zfill(8)
-        elif voucher_type_str == "receipt":
-            last_number = int(business.last_receipt_number or "0")
-            next_number = last_number + 1
-            business.last_receipt_number = str(next_number).zfill(8)
-        elif voucher_type_str == "invoice_a":
-            last_number = int(business.last_invoice_a_number or "0")
-            next_number = last_number + 1
-            business.last_invoice_a_number = str(next_number).zfill(8)
-        elif voucher_type_str == "invoice_b":
-            last_number = int(business.last_invoice_b_number or "0")
-            next_number = last_number + 1
-            business.last_invoice_b_number = str(next_number).zfill(8)
-        elif voucher_type_str == "invoice_c":
-            last_number = int(business.last_invoice_c_number or "0")
-            next_number = last_number + 1
-            business.last_invoice_c_number = str(next_number).zfill(8)
+        if voucher_type_str in NUMBERED_TYPES:
+            next_number = await VoucherCounter.next_number(
+                self.db, business_id, CounterType(voucher_type_str)
+            )
         else:
             next_number = 1 
         
@@ -73,7 +67,7 @@ class VoucherService:
             number=str(next_number).zfill(8),
             date=data.date,
             notes=data.notes,
-            show_prices="S" if data.show_prices else "N",
+            show_prices=data.show_prices,
             general_discount=data.general_discount,
         )
         
@@ -189,8 +183,17 @@ class VoucherService:
         # Necesitamos recargar con las relaciones para el PDF o respuesta completa
         return await self.get_by_id(voucher.id, business_id)
 
-    async def get_by_id(self, voucher_id: UUID, business_id: UUID) -> Optional[Voucher]:
-        """Obtiene un comprobante por ID con todas sus relaciones."""
+    async def get_by_id(
+        self,
+        voucher_id: UUID,
+        business_id: UUID,
+        with_arca_payload: bool = False,
+    ) -> Optional[Voucher]:
+        """
+        Obtiene un comprobante por ID con todas sus relaciones.
+        with_arca_payload=True carga además las columnas diferidas de ARCA
+        (arca_response, qr_data), que solo usa el PDF.
+        """
         query = (
             select(Voucher)
             .options(
@@ -204,6 +207,8 @@ class VoucherService:
                 Voucher.business_id == business_id
             )
         )
+        if with_arca_payload:
+            query = query.options(undefer_group(ARCA_PAYLOAD))
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
@@ -232,14 +237,12 @@ class VoucherService:
         if search:
             search_pattern = f"%{search}%"
             base_conditions.append(
-                or_(
-                    Voucher.number.ilike(search_pattern),
-                    Voucher.sale_point.ilike(search_pattern)
-                )
+                # full_number incluye punto de venta y número ("0001-00000123")
+                Voucher.full_number.ilike(search_pattern)
             )
         
         # Contar total
-        count_query = select(func.count(Voucher.id)).where(*base_conditions)
+        count_query = select(func.count()).where(*base_conditions)
         total_result = await self.db.execute(count_query)
         total = total_result.scalar() or 0
         
@@ -284,41 +287,34 @@ class VoucherService:
 
     async def generate_pdf(self, voucher_id: UUID, business_id: UUID) -> bytes:
         """Genera el PDF de un comprobante existente."""
-        voucher = await self.get_by_id(voucher_id, business_id)
+        voucher = await self.get_by_id(voucher_id, business_id, with_arca_payload=True)
         if not voucher:
             raise ValueError("Comprobante no encontrado")
             
         # Determinar letra
-        letter = "X"
-        if "invoice_a" in voucher.voucher_type.value or "credit_note_a" in voucher.voucher_type.value:
-            letter = "A"
-        elif "invoice_b" in voucher.voucher_type.value or "credit_note_b" in voucher.voucher_type.value:
-            letter = "B"
-        elif "invoice_c" in voucher.voucher_type.value or "credit_note_c" in voucher.voucher_type.value:
-            letter = "C"
-        elif "receipt" in voucher.voucher_type.value:
-            letter = "R"
+        voucher_type = voucher.voucher_type
+        letter = VOUCHER_LETTERS.get(voucher_type, "X")
         
         # Si es factura o NC con CAE, usar template ARCA
         is_arca_document = (
-            ("invoice" in voucher.voucher_type.value or "credit_note" in voucher.voucher_type.value)
+            (VoucherType.is_invoice(voucher_type) or VoucherType.is_credit_note(voucher_type))
             and voucher.cae
         )
 
         if is_arca_document:
-            return self._generate_arca_pdf(voucher, letter)
+            return await self._generate_arca_pdf(voucher, letter)
         else:
-            return self._generate_voucher_pdf(voucher, letter)
+            return await self._generate_voucher_pdf(voucher, letter)
 
-    def _generate_arca_pdf(self, voucher, letter: str) -> bytes:
+    async def _generate_arca_pdf(self, voucher, letter: str) -> bytes:
         """Genera PDF de factura electrónica ARCA con CAE, QR y formato fiscal."""
         from app.services.afip_sdk_service import AfipSdkService
 
         # Determinar tipo de documento
         type_name = "FACTURA"
-        if "credit_note" in voucher.voucher_type.value:
+        if VoucherType.is_credit_note(voucher.voucher_type):
             type_name = "NOTA DE CRÉDITO"
-        elif "debit_note" in voucher.voucher_type.value:
+        elif VoucherType.is_debit_note(voucher.voucher_type):
             type_name = "NOTA DE DÉBITO"
 
         # Dirección del cliente
@@ -441,13 +437,13 @@ class VoucherService:
             },
         }
 
-        return pdf_service.generate_invoice_arca_pdf(context)
+        return await pdf_service.generate_invoice_arca_pdf(context)
 
-    def _generate_voucher_pdf(self, voucher, letter: str) -> bytes:
+    async def _generate_voucher_pdf(self, voucher, letter: str) -> bytes:
         """Genera PDF de comprobante genérico (cotización, remito)."""
         # Nombre del tipo
         type_name = "COTIZACIÓN"
-        if "invoice" in voucher.voucher_type.value: type_name = "FACTURA"
+        if VoucherType.is_invoice(voucher.voucher_type): type_name = "FACTURA"
         elif "receipt" in voucher.voucher_type.value: type_name = "REMITO"
         
         context = {
@@ -479,10 +475,10 @@ class VoucherService:
                 "type_name": type_name,
                 "number": f"{voucher.sale_point}-{voucher.number}",
                 "date": voucher.date.strftime("%d/%m/%Y"),
-                "show_prices": voucher.show_prices == "S",
+                "show_prices": voucher.show_prices,
                 "cae": voucher.cae,
                 "cae_due_date": voucher.cae_expiration.strftime("%d/%m/%Y") if voucher.cae_expiration else None,
-                "qr_data": voucher.qr_data if hasattr(voucher, "qr_data") else None,
+                "qr_data": voucher.qr_data,
             },
             "items": [
                 {
@@ -503,7 +499,7 @@ class VoucherService:
             }
         }
         
-        return pdf_service.generate_voucher_pdf(context)
+        return await pdf_service.generate_voucher_pdf(context)
 
     async def list_pending_quotations(
         self,
@@ -570,7 +566,7 @@ class VoucherService:
                 pass
 
         # Contar total
-        count_query = select(func.count(Voucher.id)).where(*base_conditions)
+        count_query = select(func.count()).where(*base_conditions)
         total_result = await self.db.execute(count_query)
         total = total_result.scalar() or 0
 
@@ -657,20 +653,15 @@ class VoucherService:
         if client.tax_condition == "RI":
             invoice_type = VoucherType.INVOICE_A
 
-        # 3. Obtener business para numeración
+        # 3. Obtener business para el punto de venta
         business = await self.db.get(Business, business_id)
         if not business:
             raise ValueError("Negocio no encontrado")
 
         # 4. Obtener siguiente número de factura
-        if invoice_type == VoucherType.INVOICE_A:
-            last_number = int(business.last_invoice_a_number or "0")
-            next_number = last_number + 1
-            business.last_invoice_a_number = str(next_number).zfill(8)
-        else:
-            last_number = int(business.last_invoice_b_number or "0")
-            next_number = last_number + 1
-            business.last_invoice_b_number = str(next_number).zfill(8)
+        next_number = await VoucherCounter.next_number(
+            self.db, business_id, CounterType(invoice_type.value)
+        )
 
         # 5. Crear la factura
         from datetime import date as date_type
@@ -688,7 +679,7 @@ class VoucherService:
             number=str(next_number).zfill(8),
             date=date_type.today(),
             notes=f"Facturado desde Cotización {quotation.full_number}",
-            show_prices="S",
+            show_prices=True,
             general_discount=quotation_general_discount,
         )
 
@@ -827,11 +818,7 @@ class VoucherService:
             raise ValueError("Factura original no encontrada")
         
         # Validar que sea una factura (no cotización ni remito)
-        if original_voucher.voucher_type not in [
-            VoucherType.INVOICE_A,
-            VoucherType.INVOICE_B,
-            VoucherType.INVOICE_C
-        ]:
+        if not VoucherType.is_invoice(original_voucher.voucher_type):
             raise ValueError("Solo se pueden crear Notas de Crédito de facturas")
         
         # Validar que tenga CAE (esté emitida)
@@ -868,7 +855,7 @@ class VoucherService:
             number=voucher_number,  # Temporal, será reemplazado por el número de AFIP
             date=date.today(),
             notes=f"NC de Factura {original_voucher.full_number}. Motivo: {reason}",
-            show_prices="S",  # S = Sí, N = No (String, no Boolean)
+            show_prices=True,
             created_by=user_id,
             related_voucher_id=original_voucher.id,
         )
@@ -0,0 +1,86 @@
+"""
+Fixtures compartidas de los tests.
+
+Los tests que tocan la base necesitan un PostgreSQL descartable en
+TEST_DATABASE_URL (ej: postgresql+asyncpg://postgres@localhost:5432/octo_test):
+las tablas se crean al inicio de la sesión y se eliminan al final. Sin esa
+variable esos tests se saltean.
+"""
+import os
+from uuid import uuid4
+
+import pytest
+
+# La URL de prueba tiene que estar en el entorno antes de importar app.config
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app.config import SETTINGS  # noqa: E402
+from app.database import Base, async_session_maker, engine  # noqa: E402
+from app.models.business import Business  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.utils.security import create_access_token  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+async def database():
+    """Crea el esquema en la base de prueba y lo elimina al terminar la sesión."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL no configurada")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db(database):
+    """Sesión de base de datos; al terminar el test vacía todas las tablas."""
+    async with async_session_maker() as session:
+        yield session
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    async with database.begin() as conn:
+        await conn.execute(text(f"TRUNCATE {tables} CASCADE"))
+
+
+@pytest.fixture
+async def business(db) -> Business:
+    """Usuario con su negocio, listo para autenticar requests."""
+    user = User(
+        email=f"{uuid4().hex}@test.local",
+        name="Usuario de prueba",
+        google_id=uuid4().hex,
+    )
+    db.add(user)
+    await db.flush()
+    business = Business(
+        owner_id=user.id,
+        name="Negocio de prueba",
+        cuit="20-12345678-9",
+        tax_condition="Responsable Inscripto",
+    )
+    db.add(business)
+    await db.commit()
+    return business
+
+
+@pytest.fixture
+async def client(business):
+    """Cliente HTTP contra la app, autenticado como dueño de `business`."""
+    from app.main import app
+
+    token = create_access_token(business.owner_id, f"{business.owner_id}@test.local")
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport,
+        base_url=f"http://test{SETTINGS.API_V1_PREFIX}",
+        headers={"Authorization": f"Bearer {token}"},
+    ) as http_client:
+        yield http_client
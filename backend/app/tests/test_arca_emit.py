@@ -0,0 +1,117 @@
+"""
+Tests de POST /arca/emit-invoice con el cliente de Afip SDK simulado.
+
+El endpoint carga negocio y cliente con load_only(..., raiseload=True):
+el test corre AfipSdkService.emit_invoice real sobre esas filas, así que
+si el servicio pasa a leer una columna fuera de la lista falla acá con
+el error de raiseload en lugar de en producción.
+"""
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.models.client import Client
+from app.models.product import Product
+from app.models.voucher import Voucher, VoucherStatus, VoucherType
+from app.models.voucher_item import VoucherItem
+
+
+class FakeAfip:
+    """Reemplaza afip.Afip: registra las opciones y los comprobantes enviados."""
+
+    instances: list["FakeAfip"] = []
+
+    def __init__(self, options: dict):
+        self.options = options
+        self.sent: list[dict] = []
+        self.ElectronicBilling = self
+        FakeAfip.instances.append(self)
+
+    def createNextVoucher(self, data: dict) -> dict:
+        self.sent.append(data)
+        return {"CAE": "76123456789012", "CAEFchVto": "2026-10-25", "voucherNumber": 1}
+
+
+@pytest.fixture
+def fake_afip(monkeypatch):
+    FakeAfip.instances = []
+    monkeypatch.setattr("app.services.afip_sdk_service.Afip", FakeAfip)
+    return FakeAfip
+
+
+@pytest.fixture
+async def invoice(db, business) -> Voucher:
+    """Factura B en borrador con un ítem, de un negocio con access token."""
+    business.afipsdk_access_token = "token-de-prueba"
+    customer = Client(
+        business_id=business.id,
+        name="Cliente",
+        document_type="CUIT",
+        document_number="20-11111111-2",
+        tax_condition="Responsable Inscripto",
+    )
+    product = Product(business_id=business.id, code="P-1", description="Producto")
+    db.add_all([customer, product])
+    await db.flush()
+    voucher = Voucher(
+        business_id=business.id,
+        client_id=customer.id,
+        voucher_type=VoucherType.INVOICE_B,
+        status=VoucherStatus.DRAFT,
+        sale_point="0001",
+        number="00000001",
+        date=date(2026, 10, 15),
+        subtotal=Decimal("100.00"),
+        iva_amount=Decimal("21.00"),
+        total=Decimal("121.00"),
+    )
+    db.add(voucher)
+    await db.flush()
+    db.add(VoucherItem(
+        voucher_id=voucher.id,
+        product_id=product.id,
+        code="P-1",
+        description="Producto",
+        quantity=Decimal("1"),
+        unit_price=Decimal("100.00"),
+        iva_rate=Decimal("21.00"),
+        iva_amount=Decimal("21.00"),
+        subtotal=Decimal("100.00"),
+        total=Decimal("121.00"),
+    ))
+    await db.commit()
+    return voucher
+
+
+async def test_emit_invoice(client, invoice, fake_afip):
+    response = await client.post("/arca/emit-invoice", json={"voucher_id": str(invoice.id)})
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["success"] is True
+    assert body["cae"] == "76123456789012"
+    assert body["cae_expiration"] == "2026-10-25"
+    assert body["voucher_number"] == "0001-00000001"
+
+    [afip] = fake_afip.instances
+    assert afip.options == {
+        "CUIT": afip.options["CUIT"],
+        "access_token": "token-de-prueba",
+        "production": False,
+    }
+    [sent] = afip.sent
+    assert sent["CbteTipo"] == 6
+    assert sent["PtoVta"] == 1
+    assert (sent["DocTipo"], sent["DocNro"]) == (80, 20111111112)
+    assert sent["CondicionIVAReceptorId"] == 1
+    assert (sent["ImpNeto"], sent["ImpIVA"], sent["ImpTotal"]) == (100.0, 21.0, 121.0)
+
+
+async def test_emit_invoice_twice_is_rejected(client, invoice, fake_afip):
+    first = await client.post("/arca/emit-invoice", json={"voucher_id": str(invoice.id)})
+    assert first.status_code == 200
+
+    second = await client.post("/arca/emit-invoice", json={"voucher_id": str(invoice.id)})
+    assert second.status_code == 400
+    assert len(fake_afip.instances) == 1
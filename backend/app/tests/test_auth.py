@@ -0,0 +1,46 @@
+"""
+Tests de /auth/dev-login (solo con DEBUG).
+"""
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.config import SETTINGS
+
+
+@pytest.fixture
+def debug_app(monkeypatch):
+    from app.main import app
+
+    # SETTINGS es inmutable: el router usa una copia con DEBUG activado
+    monkeypatch.setattr("app.routers.auth.SETTINGS", SETTINGS.model_copy(update={"DEBUG": True}))
+    monkeypatch.setattr(app.state, "dev_user_id", None, raising=False)
+    return app
+
+
+async def test_dev_login_remembers_user(client, business, debug_app):
+    first = await client.post("http://test/auth/dev-login")
+    assert first.status_code == 200
+    assert first.json()["user"]["id"] == str(business.owner_id)
+    assert debug_app.state.dev_user_id == business.owner_id
+
+    second = await client.post("http://test/auth/dev-login")
+    assert second.status_code == 200
+    assert UUID(second.json()["user"]["id"]) == business.owner_id
+
+
+async def test_dev_login_falls_back_when_user_is_gone(client, business, debug_app):
+    debug_app.state.dev_user_id = uuid4()
+
+    response = await client.post("http://test/auth/dev-login")
+
+    assert response.status_code == 200
+    assert debug_app.state.dev_user_id == business.owner_id
+
+
+async def test_dev_login_disabled_without_debug(client, monkeypatch):
+    monkeypatch.setattr("app.routers.auth.SETTINGS", SETTINGS.model_copy(update={"DEBUG": False}))
+
+    response = await client.post("http://test/auth/dev-login")
+
+    assert response.status_code == 404
@@ -0,0 +1,51 @@
+"""
+Tests de los endpoints que responden con JSON serializado por pydantic-core
+(app/utils/responses.py).
+"""
+from app.models.category import Category
+from app.models.payment_method import PaymentMethodCatalog
+from app.services.category_service import CATEGORY_TREE_CACHE
+
+
+async def test_category_tree(client, db, business):
+    root = Category(business_id=business.id, name="Sanitarios")
+    db.add(root)
+    await db.flush()
+    db.add(Category(business_id=business.id, parent_id=root.id, name="Griferías"))
+    await db.commit()
+    CATEGORY_TREE_CACHE.invalidate(business.id)
+
+    response = await client.get("/categories/tree")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    [tree_root] = response.json()
+    assert tree_root["name"] == "Sanitarios"
+    assert [child["name"] for child in tree_root["subcategories"]] == ["Griferías"]
+
+
+async def test_client_list(client):
+    response = await client.get("/clients")
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "total": 0, "page": 1, "per_page": 20, "pages": 0}
+
+
+async def test_payment_methods(client, db, business):
+    db.add_all([
+        PaymentMethodCatalog(business_id=business.id, name="Efectivo", code="CASH"),
+        PaymentMethodCatalog(business_id=business.id, name="Cheque", code="CHECK", is_active=False),
+    ])
+    await db.commit()
+
+    response = await client.get("/payment-methods/")
+
+    assert response.status_code == 200
+    assert [method["code"] for method in response.json()] == ["CASH"]
+
+
+async def test_price_update_drafts_empty(client):
+    response = await client.get("/price-update-drafts")
+
+    assert response.status_code == 200
+    assert response.json() == []
@@ -0,0 +1,109 @@
+"""
+Tests de alembic/migration_helpers.py contra la base de prueba (psycopg2,
+como en alembic/env.py).
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "alembic"))
+
+from migration_helpers import assert_no_duplicates, create_index_concurrently  # noqa: E402
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL no configurada")
+
+
+@pytest.fixture
+def sync_engine():
+    """Engine síncrono con una tabla items(business, code) con un código repetido."""
+    url = sa.engine.make_url(TEST_DATABASE_URL).set(drivername="postgresql+psycopg2")
+    engine = sa.create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(sa.text("DROP TABLE IF EXISTS helper_items"))
+        conn.execute(sa.text("CREATE TABLE helper_items (business int, code text, deleted boolean)"))
+        conn.execute(sa.text(
+            "INSERT INTO helper_items VALUES (1, 'A', false), (1, 'A', false), "
+            "(1, 'B', false), (1, 'B', true), (2, 'A', false)"
+        ))
+    yield engine
+    with engine.begin() as conn:
+        conn.execute(sa.text("DROP TABLE helper_items"))
+    engine.dispose()
+
+
+def run_migration(engine, fn):
+    """Ejecuta fn con el contexto de operaciones de Alembic, como una revisión."""
+    with engine.connect() as conn:
+        context = MigrationContext.configure(conn)
+        with Operations.context(context), context.begin_transaction():
+            fn()
+
+
+def index_state(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(
+            sa.text(
+                "SELECT i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+            ),
+            {"name": name},
+        ).scalar()
+
+
+def test_assert_no_duplicates_lists_keys(sync_engine):
+    with pytest.raises(RuntimeError, match=r"business=1, code=A, filas=2"):
+        run_migration(
+            sync_engine,
+            lambda: assert_no_duplicates(
+                "helper_items", ["business", "code"], where="NOT deleted"
+            ),
+        )
+
+    # Filtrando la fila repetida no hay duplicados
+    run_migration(
+        sync_engine,
+        lambda: assert_no_duplicates(
+            "helper_items", ["business", "code"], where="NOT deleted AND code <> 'A'"
+        ),
+    )
+
+
+def test_assert_no_duplicates_shows_details(sync_engine):
+    with pytest.raises(RuntimeError, match=r"business=1, code=B, filas=2, deleted=\[False, True\]"):
+        run_migration(
+            sync_engine,
+            lambda: assert_no_duplicates(
+                "helper_items", ["business", "code"], where="code = 'B'", details=["deleted"]
+            ),
+        )
+
+
+def test_failed_unique_index_is_dropped_and_retry_works(sync_engine):
+    def upgrade():
+        create_index_concurrently(
+            "uq_helper_items", "helper_items", ["business", "code"],
+            unique=True, postgresql_where=sa.text("NOT deleted"),
+        )
+
+    with pytest.raises(sa.exc.IntegrityError):
+        run_migration(sync_engine, upgrade)
+    assert index_state(sync_engine, "uq_helper_items") is None
+
+    with sync_engine.begin() as conn:
+        conn.execute(sa.text(
+            "UPDATE helper_items SET deleted = true WHERE ctid = "
+            "(SELECT min(ctid) FROM helper_items WHERE business = 1 AND code = 'A')"
+        ))
+    run_migration(sync_engine, upgrade)
+    assert index_state(sync_engine, "uq_helper_items") is True
+
+    # Reintentar sobre un índice válido no lo reconstruye ni falla
+    run_migration(sync_engine, upgrade)
+    assert index_state(sync_engine, "uq_helper_items") is True
@@ -0,0 +1,73 @@
+"""
+Tests del tipo de columna Money (importes en centavos BIGINT).
+"""
+from decimal import Decimal
+
+from sqlalchemy import select, text
+
+from app.models.product import Product
+from app.models.purchase_order import PurchaseOrderItem
+from app.models.types import Money, round_cents
+
+
+def test_bind_stores_cents():
+    money = Money()
+    assert money.process_bind_param(Decimal("1234.56"), None) == 123456
+    assert money.process_bind_param(Decimal("-0.01"), None) == -1
+    assert money.process_bind_param(10, None) == 1000
+    assert money.process_bind_param(None, None) is None
+
+
+def test_round_cents_half_up():
+    assert round_cents(Decimal("0.125")) == Decimal("0.13")
+    assert round_cents(Decimal("0.135")) == Decimal("0.14")
+    assert round_cents(Decimal("-0.125")) == Decimal("-0.13")
+    assert round_cents(Decimal("0.124")) == Decimal("0.12")
+
+
+def test_bind_rounds_like_round_cents():
+    """Lo que calcula el modelo en Python es exactamente lo que se guarda."""
+    money = Money()
+    for value in ("0.125", "0.135", "2.675", "-1.005", "10.0049"):
+        cents = money.process_bind_param(Decimal(value), None)
+        assert money.process_result_value(cents, None) == round_cents(Decimal(value))
+
+    subtotal, iva_amount, total = PurchaseOrderItem.compute_totals(
+        Decimal("0.50"), 1, Decimal("5.00")
+    )
+    # 0.025: con HALF_EVEN daría 0.02 en Python y 3 centavos en la base
+    assert iva_amount == Decimal("0.03")
+    assert money.process_bind_param(iva_amount, None) == 3
+
+
+def test_result_returns_two_decimals():
+    money = Money()
+    assert money.process_result_value(123456, None) == Decimal("1234.56")
+    assert str(money.process_result_value(1000, None)) == "10.00"
+
+
+async def test_round_trip(db, business):
+    product = Product(
+        business_id=business.id,
+        code="MONEY-1",
+        description="Producto de prueba",
+        cost_price=Decimal("1234567.89"),
+        list_price=Decimal("0.10"),
+        sale_price=Decimal("99.995"),
+    )
+    db.add(product)
+    await db.commit()
+
+    raw = (
+        await db.execute(
+            text("SELECT cost_price, list_price, sale_price FROM products WHERE id = :id"),
+            {"id": product.id},
+        )
+    ).one()
+    assert tuple(raw) == (123456789, 10, 10000)
+
+    db.expunge_all()
+    loaded = (await db.execute(select(Product).where(Product.id == product.id))).scalar_one()
+    assert loaded.cost_price == Decimal("1234567.89")
+    assert loaded.list_price == Decimal("0.10")
+    assert loaded.sale_price == Decimal("100.00")
@@ -0,0 +1,53 @@
+"""
+Tests del total de los listados paginados (page_total).
+"""
+import pytest
+
+from app.models.category import Category
+
+
+@pytest.fixture
+async def categories(db, business):
+    db.add_all(Category(business_id=business.id, name=f"Categoría {n}") for n in range(5))
+    await db.commit()
+
+
+@pytest.mark.parametrize(
+    ("page", "per_page", "items"),
+    [
+        (1, 10, 5),  # página única incompleta: sin COUNT
+        (1, 2, 2),  # página completa: COUNT
+        (3, 2, 1),  # última página incompleta
+        (4, 2, 0),  # fuera de rango: COUNT
+    ],
+)
+async def test_category_list_total(client, categories, page, per_page, items):
+    response = await client.get("/categories", params={"page": page, "per_page": per_page})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["items"]) == items
+    assert body["total"] == 5
+
+
+async def test_product_list_items(client):
+    for n in range(3):
+        response = await client.post("/products", json={"code": f"L-{n}", "description": f"Producto {n}"})
+        assert response.status_code == 201
+
+    response = await client.get("/products", params={"per_page": 2})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 3
+    assert body["pages"] == 2
+    assert [item["code"] for item in body["items"]] == ["L-0", "L-1"]
+
+
+async def test_voucher_lists_empty(client):
+    for path in ("/vouchers", "/vouchers/pending-quotations"):
+        response = await client.get(path)
+
+        assert response.status_code == 200
+        assert response.json()["items"] == []
+        assert response.json()["total"] == 0
@@ -0,0 +1,42 @@
+"""
+Tests del render de PDF fuera del event loop.
+"""
+import threading
+
+from app.services import pdf_service as pdf_module
+from app.services.pdf_service import pdf_service, render_pdf
+
+
+class FakeHTML:
+    """Reemplaza a WeasyPrint y registra en qué hilo se escribió el PDF."""
+
+    threads: list = []
+
+    def __init__(self, string: str):
+        self.string = string
+
+    def write_pdf(self) -> bytes:
+        FakeHTML.threads.append(threading.get_ident())
+        return self.string.encode()
+
+
+async def test_render_pdf_runs_in_worker_thread(monkeypatch):
+    monkeypatch.setattr(pdf_module, "HTML", FakeHTML)
+    FakeHTML.threads = []
+
+    assert await render_pdf("<p>hola</p>") == b"<p>hola</p>"
+    assert FakeHTML.threads and FakeHTML.threads[0] != threading.get_ident()
+
+
+async def test_generate_pdf_uses_render_pdf(monkeypatch):
+    monkeypatch.setattr(pdf_module, "HTML", FakeHTML)
+    FakeHTML.threads = []
+
+    context = {
+        "business": {}, "client": {}, "voucher": {"letter": "X"},
+        "items": [], "totals": {},
+    }
+    pdf = await pdf_service.generate_voucher_pdf(context)
+
+    assert pdf.startswith(b"<")
+    assert FakeHTML.threads[0] != threading.get_ident()
@@ -0,0 +1,100 @@
+"""
+Tests de creación y edición de órdenes de pedido.
+"""
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.exc import SAWarning
+
+from app.models.product import Product
+from app.models.supplier import Supplier
+
+# Los totales se recalculan con un UPDATE en la base: un FROM mal armado
+# solo se nota como advertencia (producto cartesiano), así que falla el test
+pytestmark = pytest.mark.filterwarnings("error::sqlalchemy.exc.SAWarning")
+
+
+@pytest.fixture
+async def supplier_products(db, business):
+    supplier = Supplier(business_id=business.id, name="Proveedor")
+    db.add(supplier)
+    await db.flush()
+    products = [
+        Product(business_id=business.id, supplier_id=supplier.id, code=f"P-{n}", description=f"Producto {n}")
+        for n in range(3)
+    ]
+    db.add_all(products)
+    await db.commit()
+    return supplier, products
+
+
+def item(product, quantity, unit_cost, iva_rate="21.00"):
+    return {
+        "product_id": str(product.id),
+        "quantity_to_order": quantity,
+        "unit_cost": unit_cost,
+        "iva_rate": iva_rate,
+    }
+
+
+async def test_create_purchase_order_totals(client, supplier_products):
+    supplier, products = supplier_products
+
+    response = await client.post(
+        "/purchase-orders",
+        json={
+            "supplier_id": str(supplier.id),
+            "items": [
+                item(products[0], 3, "10.00"),
+                item(products[1], 2, "0.33", "10.50"),
+            ],
+        },
+    )
+
+    assert response.status_code == 201
+    order = response.json()
+    assert order["status"] == "draft"
+    assert len(order["items"]) == 2
+    # 30.00 + 0.66 ; IVA 6.30 + 0.07 (0.0693)
+    assert Decimal(order["subtotal"]) == Decimal("30.66")
+    assert Decimal(order["total_iva"]) == Decimal("6.37")
+    assert Decimal(order["total"]) == Decimal("37.03")
+
+
+async def test_update_purchase_order_replaces_items(client, supplier_products):
+    supplier, products = supplier_products
+    created = (
+        await client.post(
+            "/purchase-orders",
+            json={"supplier_id": str(supplier.id), "items": [item(products[0], 1, "100.00")]},
+        )
+    ).json()
+
+    response = await client.put(
+        f"/purchase-orders/{created['id']}",
+        json={"notes": "Reemplazo", "items": [item(products[2], 4, "2.50", "27.00")]},
+    )
+
+    assert response.status_code == 200
+    order = response.json()
+    assert order["notes"] == "Reemplazo"
+    assert [i["product_id"] for i in order["items"]] == [str(products[2].id)]
+    assert Decimal(order["subtotal"]) == Decimal("10.00")
+    assert Decimal(order["total_iva"]) == Decimal("2.70")
+    assert Decimal(order["total"]) == Decimal("12.70")
+
+
+async def test_update_purchase_order_without_items_keeps_totals(client, supplier_products):
+    supplier, products = supplier_products
+    created = (
+        await client.post(
+            "/purchase-orders",
+            json={"supplier_id": str(supplier.id), "items": [item(products[0], 2, "5.00")]},
+        )
+    ).json()
+
+    response = await client.put(f"/purchase-orders/{created['id']}", json={"notes": "Solo notas"})
+
+    assert response.status_code == 200
+    assert Decimal(response.json()["total"]) == Decimal("12.10")
+    assert len(response.json()["items"]) == 1
@@ -0,0 +1,81 @@
+"""
+Tests de los índices únicos parciales y de su traducción a errores 400.
+"""
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.models.product import Product
+from app.utils.db import commit_unique
+
+
+async def test_duplicate_product_code_is_rejected(client):
+    payload = {"code": "A-001", "description": "Producto"}
+
+    response = await client.post("/products", json=payload)
+    assert response.status_code == 201
+
+    response = await client.post("/products", json={**payload, "description": "Otro"})
+    assert response.status_code == 400
+    assert "A-001" in response.json()["detail"]
+
+
+async def test_deleted_product_code_can_be_reused(client):
+    payload = {"code": "A-002", "description": "Producto"}
+
+    product_id = (await client.post("/products", json=payload)).json()["id"]
+    assert (await client.delete(f"/products/{product_id}")).status_code == 200
+
+    response = await client.post("/products", json=payload)
+    assert response.status_code == 201
+
+
+async def test_duplicate_product_code_violates_index(db, business):
+    db.add_all([
+        Product(business_id=business.id, code="A-003", description="Uno"),
+        Product(business_id=business.id, code="A-003", description="Dos"),
+    ])
+    with pytest.raises(IntegrityError, match="uq_products_business_code"):
+        await db.commit()
+    await db.rollback()
+
+
+async def test_commit_unique_translates_only_listed_indexes(db, business):
+    # El rollback expira los objetos de la sesión, business incluido
+    business_id = business.id
+    db.add_all([
+        Product(business_id=business_id, code="A-004", description="Uno"),
+        Product(business_id=business_id, code="A-004", description="Dos"),
+    ])
+    with pytest.raises(ValueError, match="código repetido"):
+        await commit_unique(db, {"uq_products_business_code": "código repetido"})
+
+    db.add_all([
+        Product(business_id=business_id, code="A-005", description="Uno"),
+        Product(business_id=business_id, code="A-005", description="Dos"),
+    ])
+    with pytest.raises(IntegrityError):
+        await commit_unique(db, {"uq_clients_business_document": "otro índice"})
+
+
+async def test_duplicate_client_document_is_rejected(client):
+    payload = {
+        "name": "Cliente",
+        "document_type": "CUIT",
+        "document_number": "20-11111111-2",
+        "tax_condition": "Responsable Inscripto",
+    }
+
+    response = await client.post("/clients", json=payload)
+    assert response.status_code == 201
+
+    response = await client.post("/clients", json={**payload, "name": "Otro"})
+    assert response.status_code == 400
+
+
+async def test_second_open_cash_register_is_rejected(client):
+    response = await client.post("/cash/open", json={"opening_amount": "100.00"})
+    assert response.status_code == 201
+
+    response = await client.post("/cash/open", json={"opening_amount": "50.00"})
+    assert response.status_code == 409
+    assert response.json()["detail"].startswith("Ya hay una caja abierta")
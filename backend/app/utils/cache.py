@@ -0,0 +1,43 @@
+"""
+Caché en memoria del proceso con vencimiento por tiempo.
+"""
+import time
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Caché clave -> valor en memoria del proceso, con TTL por entrada.
+
+    Pensada para lecturas frecuentes de datos que cambian poco (ej: el árbol
+    de categorías de un negocio). Quien modifica los datos debe invalidar la
+    clave después del commit; el TTL acota cuánto puede quedar desactualizada
+    una entrada si el cambio llega por otro proceso.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retorna el valor cacheado, o None si no está o ya venció."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Guarda un valor; si la caché está llena descarta la entrada más vieja."""
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Descarta la entrada de la clave, si existe."""
+        self._data.pop(key, None)
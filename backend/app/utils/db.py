@@ -0,0 +1,26 @@
+"""
+Utilidades de sesión de base de datos compartidas por los servicios.
+"""
+from typing import Mapping
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def commit_unique(db: AsyncSession, messages: Mapping[str, str]) -> None:
+    """
+    Hace commit traduciendo la violación de un índice único a ValueError.
+
+    `messages` mapea el nombre del índice (o constraint) al mensaje para el
+    usuario. Ante un IntegrityError se hace rollback; si no corresponde a
+    ninguno de esos índices se propaga tal cual.
+    """
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        detail = str(e.orig)
+        for constraint_name, message in messages.items():
+            if constraint_name in detail:
+                raise ValueError(message) from e
+        raise
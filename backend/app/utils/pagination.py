@@ -0,0 +1,27 @@
+"""
+Utilidades de paginación compartidas por los servicios de listado.
+"""
+from typing import Sequence
+
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def page_total(
+    db: AsyncSession,
+    rows: Sequence,
+    offset: int,
+    per_page: int,
+    *conditions: ColumnElement[bool],
+) -> int:
+    """
+    Total de filas del listado para una página ya consultada.
+
+    Si la página vino incompleta el total se deduce sin COUNT (el caso
+    habitual: una sola página o la última); si no, se cuenta con las mismas
+    condiciones del listado.
+    """
+    if len(rows) < per_page and (rows or offset == 0):
+        return offset + len(rows)
+    count_query = select(func.count()).where(*conditions)
+    return (await db.execute(count_query)).scalar() or 0
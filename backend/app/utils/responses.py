@@ -0,0 +1,37 @@
+"""
+Respuestas JSON serializadas directamente por pydantic-core.
+"""
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema: Any) -> TypeAdapter:
+    """TypeAdapter del schema, compilado una sola vez por tipo."""
+    return TypeAdapter(schema)
+
+
+def dump_json(schema: Any, data: Any) -> bytes:
+    """
+    Valida `data` contra `schema` y lo serializa a JSON en pydantic-core.
+
+    `data` puede traer objetos ORM (se leen con from_attributes), también
+    dentro de un dict (ej: los items de una página). Es una sola pasada:
+    sin la validación, el volcado a dicts y el json de la stdlib que hace
+    FastAPI con el response_model.
+    """
+    adapter = _adapter(schema)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def json_response(content: bytes) -> Response:
+    """
+    Respuesta con JSON ya serializado (por dump_json o desde una caché).
+
+    FastAPI no vuelve a procesar un Response: el response_model del
+    endpoint queda solo para la documentación OpenAPI.
+    """
+    return Response(content=content, media_type="application/json")
@@ -11,16 +11,15 @@ from jose import JWTError, jwt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import get_settings
+from app.config import SETTINGS
 from app.database import get_db
 
-settings = get_settings()
 security = HTTPBearer(auto_error=False)
 
 
 def create_access_token(user_id: UUID, email: str) -> str:
     """Crea un JWT de acceso con expiración de 30 minutos."""
-    expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = datetime.utcnow() + timedelta(minutes=SETTINGS.ACCESS_TOKEN_EXPIRE_MINUTES)
     payload = {
         "sub": str(user_id),
         "email": email,
@@ -28,19 +27,19 @@ def create_access_token(user_id: UUID, email: str) -> str:
         "exp": expire,
         "iat": datetime.utcnow(),
     }
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    return jwt.encode(payload, SETTINGS.JWT_SECRET, algorithm=SETTINGS.JWT_ALGORITHM)
 
 
 def create_refresh_token(user_id: UUID) -> str:
     """Crea un JWT de refresh con expiración de 7 días."""
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = datetime.utcnow() + timedelta(days=SETTINGS.REFRESH_TOKEN_EXPIRE_DAYS)
     payload = {
         "sub": str(user_id),
         "type": "refresh",
         "exp": expire,
         "iat": datetime.utcnow(),
     }
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    return jwt.encode(payload, SETTINGS.JWT_SECRET, algorithm=SETTINGS.JWT_ALGORITHM)
 
 
 def verify_token(token: str) -> dict:
@@ -48,8 +47,8 @@ def verify_token(token: str) -> dict:
     try:
         payload = jwt.decode(
             token,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM],
+            SETTINGS.JWT_SECRET,
+            algorithms=[SETTINGS.JWT_ALGORITHM],
         )
         return payload
     except JWTError as e:
@@ -155,6 +154,28 @@ async def get_current_business(
         )
 
 
+async def get_current_business_instance(
+    db: AsyncSession = Depends(get_db),
+    business_id: UUID = Depends(get_current_business),
+):
+    """
+    Dependency que retorna el Business del usuario actual.
+
+    get_current_business ya lo cargó en la misma sesión (get_db se resuelve
+    una vez por request), así que db.get lo toma del identity map sin
+    volver a consultar la base.
+    """
+    from app.models.business import Business
+
+    business = await db.get(Business, business_id)
+    if not business:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Negocio no encontrado",
+        )
+    return business
+
+
 async def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: AsyncSession = Depends(get_db),
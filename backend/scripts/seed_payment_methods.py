@@ -13,7 +13,6 @@ from app.database import async_session_maker
 from app.models.payment_method import PaymentMethodCatalog
 from app.models.business import Business
 from sqlalchemy import select
-from uuid import uuid4
 
 
 DEFAULT_PAYMENT_METHODS = [
@@ -38,9 +37,12 @@ async def seed_payment_methods():
         for business in businesses:
             print(f"\nProcesando negocio: {business.name}")
             
-            # Verificar qué métodos ya existen
+            # Verificar qué métodos ya existen (los eliminados no cuentan)
             result = await db.execute(
-                select(PaymentMethodCatalog).where(PaymentMethodCatalog.business_id == business.id)
+                select(PaymentMethodCatalog).where(
+                    PaymentMethodCatalog.business_id == business.id,
+                    PaymentMethodCatalog.deleted_at.is_(None),
+                )
             )
             existing_methods = result.scalars().all()
             existing_codes = {m.code for m in existing_methods}
@@ -50,7 +52,6 @@ async def seed_payment_methods():
             for method_data in DEFAULT_PAYMENT_METHODS:
                 if method_data["code"] not in existing_codes:
                     payment_method = PaymentMethodCatalog(
-                        id=uuid4(),
                         business_id=business.id,
                         name=method_data["name"],
                         code=method_data["code"],
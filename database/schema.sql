@@ -15,13 +15,12 @@ CREATE TABLE users (
 	google_id VARCHAR(255) NOT NULL, 
 	is_active BOOLEAN NOT NULL, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id)
 );
 
-CREATE INDEX ix_users_id ON users (id);
 CREATE UNIQUE INDEX ix_users_google_id ON users (google_id);
 CREATE UNIQUE INDEX ix_users_email ON users (email);
 
@@ -40,56 +39,54 @@ CREATE TABLE businesses (
 	logo_url VARCHAR(500), 
 	header_text TEXT, 
 	sale_point VARCHAR(5), 
-	last_quotation_number VARCHAR(8), 
-	last_receipt_number VARCHAR(8), 
-	last_invoice_a_number VARCHAR(8), 
-	last_invoice_b_number VARCHAR(8), 
-	last_invoice_c_number VARCHAR(8), 
-	last_purchase_order_number VARCHAR(8), 
-	arca_token TEXT, 
-	arca_sign TEXT, 
+	arca_token BYTEA, 
+	arca_sign BYTEA, 
 	arca_token_expiration VARCHAR(30), 
 	arca_cuit_representante VARCHAR(13), 
 	arca_environment VARCHAR(20), 
 	afipsdk_access_token VARCHAR(500), 
-	afip_cert TEXT, 
-	afip_key TEXT, 
+	afip_cert BYTEA, 
+	afip_key BYTEA, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(owner_id) REFERENCES users (id)
 );
 
-CREATE INDEX ix_businesses_owner_id ON businesses (owner_id);
-CREATE INDEX ix_businesses_id ON businesses (id);
+CREATE INDEX ix_businesses_active ON businesses (owner_id) WHERE deleted_at IS NULL;
+ALTER TABLE businesses ALTER COLUMN arca_token SET STORAGE EXTERNAL;
+ALTER TABLE businesses ALTER COLUMN arca_sign SET STORAGE EXTERNAL;
+ALTER TABLE businesses ALTER COLUMN afip_cert SET STORAGE EXTERNAL;
+ALTER TABLE businesses ALTER COLUMN afip_key SET STORAGE EXTERNAL;
 
 -- Tabla: cash_registers
 CREATE TABLE cash_registers (
 	business_id UUID NOT NULL, 
 	opened_by UUID NOT NULL, 
 	closed_by UUID, 
-	status cashregisterstatus NOT NULL, 
-	opening_amount NUMERIC(12, 2) NOT NULL, 
-	opened_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	closed_at TIMESTAMP WITHOUT TIME ZONE, 
-	counted_cash NUMERIC(12, 2), 
-	difference NUMERIC(12, 2), 
+	status VARCHAR(20) NOT NULL, 
+	opening_amount BIGINT NOT NULL, 
+	opened_at TIMESTAMP WITH TIME ZONE NOT NULL, 
+	closed_at TIMESTAMP WITH TIME ZONE, 
+	counted_cash BIGINT, 
+	difference BIGINT, 
 	difference_reason TEXT, 
 	closing_pdf_path VARCHAR(500), 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
+	CONSTRAINT ck_cash_registers_status CHECK (status IN ('OPEN', 'CLOSED')), 
 	FOREIGN KEY(business_id) REFERENCES businesses (id), 
 	FOREIGN KEY(opened_by) REFERENCES users (id), 
 	FOREIGN KEY(closed_by) REFERENCES users (id)
 );
 
-CREATE INDEX ix_cash_registers_id ON cash_registers (id);
-CREATE INDEX ix_cash_registers_business_id ON cash_registers (business_id);
+CREATE INDEX ix_cash_registers_active ON cash_registers (business_id) WHERE deleted_at IS NULL;
+CREATE UNIQUE INDEX uq_cash_registers_business_open ON cash_registers (business_id) WHERE status = 'OPEN' AND deleted_at IS NULL;
 
 -- Tabla: categories
 CREATE TABLE categories (
@@ -98,16 +95,15 @@ CREATE TABLE categories (
 	name VARCHAR(100) NOT NULL, 
 	description TEXT, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(business_id) REFERENCES businesses (id), 
 	FOREIGN KEY(parent_id) REFERENCES categories (id)
 );
 
-CREATE INDEX ix_categories_id ON categories (id);
-CREATE INDEX ix_categories_business_id ON categories (business_id);
+CREATE INDEX ix_categories_active ON categories (business_id, name) WHERE deleted_at IS NULL;
 CREATE INDEX ix_categories_name ON categories (name);
 CREATE INDEX ix_categories_parent_id ON categories (parent_id);
 
@@ -128,19 +124,18 @@ CREATE TABLE clients (
 	phone VARCHAR(50), 
 	email VARCHAR(255), 
 	notes TEXT, 
-	current_balance NUMERIC(12, 2) NOT NULL, 
-	credit_limit NUMERIC(12, 2), 
+	current_balance BIGINT NOT NULL, 
+	credit_limit BIGINT, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(business_id) REFERENCES businesses (id)
 );
 
-CREATE INDEX ix_clients_business_id ON clients (business_id);
-CREATE INDEX ix_clients_id ON clients (id);
-CREATE INDEX ix_clients_document_number ON clients (document_number);
+CREATE INDEX ix_clients_active ON clients (business_id, name) WHERE deleted_at IS NULL;
+CREATE UNIQUE INDEX uq_clients_business_document ON clients (business_id, document_number) WHERE deleted_at IS NULL;
 CREATE INDEX ix_clients_name ON clients (name);
 
 -- Tabla: payment_methods
@@ -151,14 +146,15 @@ CREATE TABLE payment_methods (
 	is_active BOOLEAN NOT NULL, 
 	requires_reference BOOLEAN NOT NULL, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(business_id) REFERENCES businesses (id)
 );
 
-CREATE INDEX ix_payment_methods_id ON payment_methods (id);
+CREATE INDEX ix_payment_methods_business ON payment_methods (business_id, name) INCLUDE (id, code, is_active, requires_reference);
+CREATE UNIQUE INDEX uq_business_payment_code_live ON payment_methods (business_id, code) WHERE deleted_at IS NULL;
 
 -- Tabla: price_update_drafts
 CREATE TABLE price_update_drafts (
@@ -170,19 +166,34 @@ CREATE TABLE price_update_drafts (
 	filter_supplier_id UUID, 
 	filter_supplier_name VARCHAR(255), 
 	filter_search VARCHAR(255), 
-	products_data TEXT NOT NULL, 
-	product_count VARCHAR(10) NOT NULL, 
+	products_data JSONB NOT NULL, 
+	product_count INTEGER NOT NULL, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(business_id) REFERENCES businesses (id) ON DELETE CASCADE, 
 	FOREIGN KEY(created_by) REFERENCES users (id) ON DELETE SET NULL
 );
 
-CREATE INDEX ix_price_update_drafts_id ON price_update_drafts (id);
-CREATE INDEX ix_price_update_drafts_business_id ON price_update_drafts (business_id);
+CREATE INDEX ix_price_update_drafts_active ON price_update_drafts (business_id, updated_at) WHERE deleted_at IS NULL;
+CREATE INDEX ix_price_update_drafts_products_data ON price_update_drafts USING gin (products_data jsonb_path_ops);
+
+-- Tabla: voucher_counters
+CREATE TABLE voucher_counters (
+	business_id UUID NOT NULL, 
+	counter_type SMALLINT NOT NULL, 
+	last_number BIGINT NOT NULL, 
+	id UUID NOT NULL, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
+	PRIMARY KEY (id), 
+	CONSTRAINT uq_voucher_counters_business_type UNIQUE (business_id, counter_type), 
+	CONSTRAINT ck_voucher_counters_counter_type CHECK (counter_type BETWEEN 1 AND 6), 
+	FOREIGN KEY(business_id) REFERENCES businesses (id) ON DELETE CASCADE
+);
 
 -- Tabla: suppliers
 CREATE TABLE suppliers (
@@ -200,16 +211,15 @@ CREATE TABLE suppliers (
 	default_discount_2 NUMERIC(5, 2) NOT NULL, 
 	default_discount_3 NUMERIC(5, 2) NOT NULL, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(business_id) REFERENCES businesses (id)
 );
 
-CREATE INDEX ix_suppliers_id ON suppliers (id);
 CREATE INDEX ix_suppliers_name ON suppliers (name);
-CREATE INDEX ix_suppliers_business_id ON suppliers (business_id);
+CREATE INDEX ix_suppliers_active ON suppliers (business_id, name) WHERE deleted_at IS NULL;
 
 -- Tabla: products
 CREATE TABLE products (
@@ -220,33 +230,32 @@ CREATE TABLE products (
 	supplier_code VARCHAR(50), 
 	description VARCHAR(500) NOT NULL, 
 	details TEXT, 
-	cost_price NUMERIC(12, 2) NOT NULL, 
-	list_price NUMERIC(12, 2) NOT NULL, 
+	cost_price BIGINT NOT NULL, 
+	list_price BIGINT NOT NULL, 
 	discount_1 NUMERIC(5, 2) NOT NULL, 
 	discount_2 NUMERIC(5, 2) NOT NULL, 
 	discount_3 NUMERIC(5, 2) NOT NULL, 
 	discount_display VARCHAR(20), 
 	extra_cost NUMERIC(5, 2) NOT NULL, 
-	net_price NUMERIC(12, 2) NOT NULL, 
-	sale_price NUMERIC(12, 2) NOT NULL, 
+	net_price BIGINT NOT NULL, 
+	sale_price BIGINT NOT NULL, 
 	iva_rate NUMERIC(5, 2) NOT NULL, 
 	current_stock INTEGER NOT NULL, 
 	minimum_stock INTEGER NOT NULL, 
 	unit VARCHAR(20) NOT NULL, 
 	is_active BOOLEAN NOT NULL, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(business_id) REFERENCES businesses (id), 
 	FOREIGN KEY(category_id) REFERENCES categories (id), 
 	FOREIGN KEY(supplier_id) REFERENCES suppliers (id)
 );
 
-CREATE INDEX ix_products_business_id ON products (business_id);
-CREATE INDEX ix_products_code ON products (code);
-CREATE INDEX ix_products_id ON products (id);
+CREATE INDEX ix_products_active ON products (business_id, description) WHERE deleted_at IS NULL;
+CREATE UNIQUE INDEX uq_products_business_code ON products (business_id, code) WHERE deleted_at IS NULL;
 CREATE INDEX ix_products_supplier_code ON products (supplier_code);
 CREATE INDEX ix_products_description ON products (description);
 CREATE INDEX ix_products_category_id ON products (category_id);
@@ -258,29 +267,29 @@ CREATE TABLE purchase_orders (
 	supplier_id UUID, 
 	category_id UUID, 
 	created_by UUID NOT NULL, 
-	status purchaseorderstatus NOT NULL, 
+	status SMALLINT DEFAULT 1 NOT NULL, 
 	sale_point VARCHAR(4) NOT NULL, 
 	number VARCHAR(8) NOT NULL, 
-	subtotal NUMERIC(14, 2) NOT NULL, 
-	total_iva NUMERIC(14, 2) NOT NULL, 
-	total NUMERIC(14, 2) NOT NULL, 
+	subtotal BIGINT DEFAULT 0 NOT NULL, 
+	total_iva BIGINT DEFAULT 0 NOT NULL, 
+	total BIGINT DEFAULT 0 NOT NULL, 
 	notes TEXT, 
-	confirmed_at TIMESTAMP WITHOUT TIME ZONE, 
+	confirmed_at TIMESTAMP WITH TIME ZONE, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
+	CONSTRAINT ck_purchase_orders_status CHECK (status BETWEEN 1 AND 2), 
 	FOREIGN KEY(business_id) REFERENCES businesses (id), 
 	FOREIGN KEY(supplier_id) REFERENCES suppliers (id), 
 	FOREIGN KEY(category_id) REFERENCES categories (id), 
 	FOREIGN KEY(created_by) REFERENCES users (id)
 );
 
-CREATE INDEX ix_purchase_orders_id ON purchase_orders (id);
 CREATE INDEX ix_purchase_orders_supplier_id ON purchase_orders (supplier_id);
 CREATE INDEX ix_purchase_orders_category_id ON purchase_orders (category_id);
-CREATE INDEX ix_purchase_orders_business_id ON purchase_orders (business_id);
+CREATE INDEX ix_purchase_orders_active ON purchase_orders (business_id, created_at) WHERE deleted_at IS NULL;
 CREATE INDEX ix_purchase_orders_status ON purchase_orders (status);
 
 -- Tabla: supplier_categories
@@ -301,9 +310,9 @@ CREATE TABLE supplier_category_discounts (
 	discount_2 NUMERIC(5, 2) NOT NULL, 
 	discount_3 NUMERIC(5, 2) NOT NULL, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(supplier_id) REFERENCES suppliers (id), 
 	FOREIGN KEY(category_id) REFERENCES categories (id)
@@ -311,40 +320,42 @@ CREATE TABLE supplier_category_discounts (
 
 CREATE INDEX ix_supplier_category_discounts_supplier_id ON supplier_category_discounts (supplier_id);
 CREATE INDEX ix_supplier_category_discounts_category_id ON supplier_category_discounts (category_id);
-CREATE INDEX ix_supplier_category_discounts_id ON supplier_category_discounts (id);
 
 -- Tabla: vouchers
 CREATE TABLE vouchers (
 	business_id UUID NOT NULL, 
 	client_id UUID NOT NULL, 
 	created_by UUID, 
-	voucher_type vouchertype NOT NULL, 
-	status voucherstatus NOT NULL, 
+	voucher_type SMALLINT NOT NULL, 
+	status SMALLINT DEFAULT 1 NOT NULL, 
 	sale_point VARCHAR(5) NOT NULL, 
 	number VARCHAR(8) NOT NULL, 
+	full_number VARCHAR(14) GENERATED ALWAYS AS (sale_point || '-' || number) STORED, 
 	date DATE NOT NULL, 
 	due_date DATE, 
-	general_discount NUMERIC(5, 2) NOT NULL, 
-	subtotal NUMERIC(12, 2) NOT NULL, 
-	iva_amount NUMERIC(12, 2) NOT NULL, 
-	total NUMERIC(12, 2) NOT NULL, 
+	general_discount NUMERIC(5, 2) DEFAULT 0 NOT NULL, 
+	subtotal BIGINT DEFAULT 0 NOT NULL, 
+	iva_amount BIGINT DEFAULT 0 NOT NULL, 
+	total BIGINT DEFAULT 0 NOT NULL, 
 	cae VARCHAR(20), 
 	cae_expiration DATE, 
-	arca_response TEXT, 
+	arca_response JSONB, 
 	barcode VARCHAR(100), 
 	qr_data TEXT, 
 	notes TEXT, 
 	internal_notes TEXT, 
-	show_prices VARCHAR(1), 
+	show_prices BOOLEAN NOT NULL, 
 	deleted_by UUID, 
 	deletion_reason TEXT, 
 	related_voucher_id UUID, 
 	invoiced_voucher_id UUID, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
+	CONSTRAINT ck_vouchers_voucher_type CHECK (voucher_type BETWEEN 1 AND 11), 
+	CONSTRAINT ck_vouchers_status CHECK (status BETWEEN 1 AND 3), 
 	FOREIGN KEY(business_id) REFERENCES businesses (id), 
 	FOREIGN KEY(client_id) REFERENCES clients (id), 
 	FOREIGN KEY(created_by) REFERENCES users (id), 
@@ -355,32 +366,33 @@ CREATE TABLE vouchers (
 
 CREATE INDEX ix_vouchers_client_id ON vouchers (client_id);
 CREATE INDEX ix_vouchers_invoiced_voucher_id ON vouchers (invoiced_voucher_id);
-CREATE INDEX ix_vouchers_business_id ON vouchers (business_id);
+CREATE INDEX ix_vouchers_active ON vouchers (business_id, created_at) WHERE deleted_at IS NULL;
+CREATE INDEX ix_vouchers_sales ON vouchers (business_id, status, voucher_type, date) INCLUDE (total) WHERE deleted_at IS NULL;
 CREATE INDEX ix_vouchers_voucher_type ON vouchers (voucher_type);
 CREATE INDEX ix_vouchers_related_voucher_id ON vouchers (related_voucher_id);
-CREATE INDEX ix_vouchers_id ON vouchers (id);
 
 -- Tabla: cash_movements
 CREATE TABLE cash_movements (
 	cash_register_id UUID NOT NULL, 
-	type cashmovementtype NOT NULL, 
-	payment_method cashpaymentmethod NOT NULL, 
-	amount NUMERIC(12, 2) NOT NULL, 
+	type SMALLINT NOT NULL, 
+	payment_method SMALLINT NOT NULL, 
+	amount BIGINT NOT NULL, 
 	description VARCHAR(255) NOT NULL, 
 	voucher_id UUID, 
 	created_by UUID NOT NULL, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
+	CONSTRAINT ck_cash_movements_type CHECK (type BETWEEN 1 AND 4), 
+	CONSTRAINT ck_cash_movements_payment_method CHECK (payment_method BETWEEN 1 AND 5), 
 	FOREIGN KEY(cash_register_id) REFERENCES cash_registers (id), 
 	FOREIGN KEY(voucher_id) REFERENCES vouchers (id), 
 	FOREIGN KEY(created_by) REFERENCES users (id)
 );
 
-CREATE INDEX ix_cash_movements_id ON cash_movements (id);
-CREATE INDEX ix_cash_movements_cash_register_id ON cash_movements (cash_register_id);
+CREATE INDEX ix_cash_movements_register_covering ON cash_movements (cash_register_id, created_at) INCLUDE (type, payment_method, amount);
 
 -- Tabla: payments
 CREATE TABLE payments (
@@ -389,17 +401,18 @@ CREATE TABLE payments (
 	voucher_id UUID, 
 	received_by UUID, 
 	date DATE NOT NULL, 
-	amount NUMERIC(12, 2) NOT NULL, 
-	method paymentmethod NOT NULL, 
+	amount BIGINT NOT NULL, 
+	method SMALLINT NOT NULL, 
 	reference VARCHAR(100), 
 	check_bank VARCHAR(100), 
 	check_date DATE, 
 	notes TEXT, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
+	CONSTRAINT ck_payments_method CHECK (method BETWEEN 1 AND 7), 
 	FOREIGN KEY(business_id) REFERENCES businesses (id), 
 	FOREIGN KEY(client_id) REFERENCES clients (id), 
 	FOREIGN KEY(voucher_id) REFERENCES vouchers (id), 
@@ -407,7 +420,6 @@ CREATE TABLE payments (
 );
 
 CREATE INDEX ix_payments_client_id ON payments (client_id);
-CREATE INDEX ix_payments_id ON payments (id);
 CREATE INDEX ix_payments_voucher_id ON payments (voucher_id);
 CREATE INDEX ix_payments_business_id ON payments (business_id);
 
@@ -424,40 +436,38 @@ CREATE TABLE price_history (
 	change_reason VARCHAR(255), 
 	import_file VARCHAR(255), 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(product_id) REFERENCES products (id), 
 	FOREIGN KEY(changed_by) REFERENCES users (id)
 );
 
-CREATE INDEX ix_price_history_id ON price_history (id);
 CREATE INDEX ix_price_history_product_id ON price_history (product_id);
 
 -- Tabla: purchase_order_items
 CREATE TABLE purchase_order_items (
 	purchase_order_id UUID NOT NULL, 
 	product_id UUID NOT NULL, 
-	system_stock INTEGER NOT NULL, 
+	system_stock INTEGER DEFAULT 0 NOT NULL, 
 	counted_stock INTEGER, 
-	quantity_to_order INTEGER NOT NULL, 
-	unit_cost NUMERIC(12, 2) NOT NULL, 
-	iva_rate NUMERIC(5, 2) NOT NULL, 
-	subtotal NUMERIC(14, 2) NOT NULL, 
-	iva_amount NUMERIC(14, 2) NOT NULL, 
-	total NUMERIC(14, 2) NOT NULL, 
+	quantity_to_order INTEGER DEFAULT 0 NOT NULL, 
+	unit_cost BIGINT DEFAULT 0 NOT NULL, 
+	iva_rate NUMERIC(5, 2) DEFAULT 21.00 NOT NULL, 
+	subtotal BIGINT DEFAULT 0 NOT NULL, 
+	iva_amount BIGINT DEFAULT 0 NOT NULL, 
+	total BIGINT DEFAULT 0 NOT NULL, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(purchase_order_id) REFERENCES purchase_orders (id), 
 	FOREIGN KEY(product_id) REFERENCES products (id)
 );
 
 CREATE INDEX ix_purchase_order_items_product_id ON purchase_order_items (product_id);
-CREATE INDEX ix_purchase_order_items_id ON purchase_order_items (id);
 CREATE INDEX ix_purchase_order_items_purchase_order_id ON purchase_order_items (purchase_order_id);
 
 -- Tabla: voucher_items
@@ -468,24 +478,23 @@ CREATE TABLE voucher_items (
 	description VARCHAR(500) NOT NULL, 
 	quantity NUMERIC(12, 2) NOT NULL, 
 	unit VARCHAR(20) NOT NULL, 
-	unit_price NUMERIC(12, 2) NOT NULL, 
-	discount_percent NUMERIC(5, 2) NOT NULL, 
+	unit_price BIGINT NOT NULL, 
+	discount_percent NUMERIC(5, 2) DEFAULT 0 NOT NULL, 
 	iva_rate NUMERIC(5, 2) NOT NULL, 
-	iva_amount NUMERIC(12, 2) NOT NULL, 
-	subtotal NUMERIC(12, 2) NOT NULL, 
-	total NUMERIC(12, 2) NOT NULL, 
+	iva_amount BIGINT NOT NULL, 
+	subtotal BIGINT NOT NULL, 
+	total BIGINT NOT NULL, 
 	line_number INTEGER NOT NULL, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
 	FOREIGN KEY(voucher_id) REFERENCES vouchers (id) ON DELETE CASCADE, 
 	FOREIGN KEY(product_id) REFERENCES products (id)
 );
 
 CREATE INDEX ix_voucher_items_voucher_id ON voucher_items (voucher_id);
-CREATE INDEX ix_voucher_items_id ON voucher_items (id);
 
 -- Tabla: voucher_payments
 CREATE TABLE voucher_payments (
@@ -494,16 +503,15 @@ CREATE TABLE voucher_payments (
 	amount NUMERIC(12, 2) NOT NULL, 
 	reference VARCHAR(100), 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
 	CONSTRAINT positive_amount CHECK (amount > 0), 
 	FOREIGN KEY(voucher_id) REFERENCES vouchers (id) ON DELETE CASCADE, 
 	FOREIGN KEY(payment_method_id) REFERENCES payment_methods (id)
 );
 
-CREATE INDEX ix_voucher_payments_id ON voucher_payments (id);
 
 -- Tabla: client_accounts
 CREATE TABLE client_accounts (
@@ -511,16 +519,17 @@ CREATE TABLE client_accounts (
 	voucher_id UUID, 
 	payment_id UUID, 
 	date DATE NOT NULL, 
-	movement_type movementtype NOT NULL, 
+	movement_type SMALLINT NOT NULL, 
 	description VARCHAR(255) NOT NULL, 
-	debit NUMERIC(12, 2) NOT NULL, 
-	credit NUMERIC(12, 2) NOT NULL, 
-	balance NUMERIC(12, 2) NOT NULL, 
+	debit BIGINT DEFAULT 0 NOT NULL, 
+	credit BIGINT DEFAULT 0 NOT NULL, 
+	balance BIGINT NOT NULL, 
 	id UUID NOT NULL, 
-	created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
-	deleted_at TIMESTAMP WITHOUT TIME ZONE, 
+	created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL, 
+	deleted_at TIMESTAMP WITH TIME ZONE, 
 	PRIMARY KEY (id), 
+	CONSTRAINT ck_client_accounts_movement_type CHECK (movement_type BETWEEN 1 AND 6), 
 	FOREIGN KEY(client_id) REFERENCES clients (id), 
 	FOREIGN KEY(voucher_id) REFERENCES vouchers (id), 
 	FOREIGN KEY(payment_id) REFERENCES payments (id)
@@ -528,4 +537,3 @@ CREATE TABLE client_accounts (
 
 CREATE INDEX ix_client_accounts_date ON client_accounts (date);
 CREATE INDEX ix_client_accounts_client_id ON client_accounts (client_id);
-CREATE INDEX ix_client_accounts_id ON client_accounts (id);